@@ -10,18 +10,29 @@ Main FastAPI application with endpoints for:
 - Dashboard and settings
 """
 
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import re
+import secrets
 import sys
-from datetime import datetime, timedelta, time
-from typing import List, Optional, Dict
+import threading
+from datetime import datetime, timedelta, time, tzinfo
+from zoneinfo import ZoneInfoNotFoundError
+from functools import lru_cache
+from typing import Annotated, Any, List, Optional, Dict
 from fastapi import FastAPI, HTTPException, Depends, status, Request, Query
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer
 from urllib.parse import urlencode
+from pydantic import BaseModel, TypeAdapter
 from starlette.authentication import AuthCredentials, SimpleUser
-from colorama import Fore, init
 from googleapiclient.discovery import build
-import pytz
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func
+from sqlalchemy.engine import Engine
 
 from src import config
 from src.core import models
@@ -29,10 +40,18 @@ from src.database import models as database, SessionLocal, init_db, get_db, Sess
 from src.auth import service as auth_service
 from src.calendar import service as calendar_service
 from src.services.calendar_service import CalendarService
+from src.services.google_calendar import google_calendar_client, EVENT_PATCH_SOURCE_FIELDS
+from src.services.reminder_scheduler import reminder_scheduler
 from src.core.auth import GoogleAuthManager
 from src.integrations.twilio import TwilioWrapper, TwilioCallError
+from src.utils.console import Fore
+from src.utils.timezones import UTC, get_timezone
+from src.utils.logger import get_logger
 
-init(autoreset=True)
+agent_log = get_logger("agent")
+auth_log = get_logger("auth")
+notification_log = get_logger("notifications")
+reminder_log = get_logger("reminders")
 
 OAUTH_REDIRECT_PARAM_ACCESS_TOKEN = "access_token"
 OAUTH_REDIRECT_PARAM_REFRESH_TOKEN = "refresh_token"
@@ -74,16 +93,57 @@ GOOGLE_CALENDAR_SUMMARY_FIELD = "summary"
 GOOGLE_CALENDAR_DESCRIPTION_FIELD = "description"
 GOOGLE_CALENDAR_STATUS_FIELD = "status"
 GOOGLE_CALENDAR_STATUS_CANCELLED = "cancelled"
+GOOGLE_CALENDAR_LIST_FIELDS = "items(id,summary,description,start,status)"
+GOOGLE_CALENDAR_NO_SHOW_READ_FIELDS = "summary,description,extendedProperties"
+GOOGLE_CALENDAR_EXTENDED_PROPERTIES_FIELD = "extendedProperties"
+GOOGLE_CALENDAR_PRIVATE_PROPERTIES_FIELD = "private"
+GOOGLE_CALENDAR_NO_SHOW_PATCH_FIELDS = "id"
 APPOINTMENT_SUMMARY_PREFIX = "Appointment:"
 APPOINTMENT_SUMMARY_FALLBACK = "Appointment"
 APPOINTMENT_SUMMARY_SEPARATOR = " "
 APPOINTMENT_STATUS_SCHEDULED = "scheduled"
 APPOINTMENT_STATUS_CANCELLED = "cancelled"
 APPOINTMENT_STATUS_NO_SHOW = "no_show"
+APPOINTMENT_STATUS_CONFIRMED = "confirmed"
+UPCOMING_APPOINTMENT_STATUSES = (APPOINTMENT_STATUS_SCHEDULED, APPOINTMENT_STATUS_CONFIRMED)
+UPCOMING_APPOINTMENTS_DAYS_AHEAD = 30
+UPCOMING_APPOINTMENTS_WINDOW = timedelta(days=UPCOMING_APPOINTMENTS_DAYS_AHEAD)
+# Columns of an AppointmentResponse, selected without loading ORM objects;
+# pair with a join (or outer join) to Patient for the name
+APPOINTMENT_RESPONSE_COLUMNS = (
+    database.Appointment.id,
+    database.Appointment.calendar_event_id,
+    database.Appointment.patient_id,
+    database.Patient.name.label("patient_name"),
+    database.Appointment.date,
+    database.Appointment.time,
+    database.Appointment.duration_minutes,
+    database.Appointment.type,
+    database.Appointment.status,
+    database.Appointment.notes,
+    database.Appointment.reminder_sent,
+    database.Appointment.created_at,
+)
+# Columns of a CallResponse, selected the same way
+CALL_RESPONSE_COLUMNS = (
+    database.Call.id,
+    database.Call.call_sid,
+    database.Call.patient_id,
+    database.Patient.name.label("patient_name"),
+    database.Call.phone_number.label("phone"),
+    database.Call.type,
+    database.Call.status,
+    database.Call.duration_seconds,
+    database.Call.started_at,
+    database.Call.ended_at,
+    database.Call.created_at,
+)
 APPOINTMENT_TYPE_FALLBACK = "General"
 SUMMARY_NO_SHOW_PREFIX = "NO SHOW:"
 SUMMARY_NO_SHOW_FALLBACK = f"{SUMMARY_NO_SHOW_PREFIX}{APPOINTMENT_SUMMARY_SEPARATOR}{APPOINTMENT_SUMMARY_FALLBACK}"
 DESCRIPTION_FIELD_SEPARATOR = ": "
+DESCRIPTION_LINE_BREAKS = "\r\n"
+DESCRIPTION_LINE_RE = re.compile(rf"^(.*?){re.escape(DESCRIPTION_FIELD_SEPARATOR)}(.*)$", re.MULTILINE)
 DESCRIPTION_LABEL_STATUS = "Status"
 DESCRIPTION_FIELD_STATUS = "status"
 DESCRIPTION_FIELD_TYPE = "type"
@@ -92,6 +152,27 @@ DESCRIPTION_KEY_REPLACEMENT = "_"
 APPOINTMENT_TIME_ALL_DAY = "All day"
 DATE_INPUT_FORMAT = "%Y-%m-%d"
 DATE_OUTPUT_FORMAT = "%Y-%m-%d"
+AGENT_DATETIME_INPUT_FORMAT = "%Y-%m-%d %H:%M"
+AGENT_AVAILABILITY_RANGE_DEFAULT_DAYS = 7
+AGENT_AVAILABILITY_RANGE_MAX_DAYS = 14
+# Random bytes in generated record IDs (hex-encoded to twice as many characters)
+RECORD_ID_TOKEN_BYTES = 6
+NOTIFICATION_THREAD_NAME_PREFIX = "notify"
+JSON_MEDIA_TYPE = "application/json"
+XML_MEDIA_TYPE = "application/xml"
+# Twilio voice that reads out manual-call messages
+MANUAL_CALL_VOICE = "alice"
+# skip/limit list endpoints: default and largest page size
+LIST_LIMIT_DEFAULT = 100
+LIST_LIMIT_MAX = 100
+RECENT_ACTIVITY_LIMIT = 5
+# Serialize whole response lists in one pydantic-core pass
+APPOINTMENT_LIST_ADAPTER = TypeAdapter(List[models.AppointmentResponse])
+CALL_LIST_ADAPTER = TypeAdapter(List[models.CallResponse])
+PATIENT_LIST_ADAPTER = TypeAdapter(List[models.PatientResponse])
+PATIENT_UNIQUE_KEY = ("doctor_id", "phone")
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
 TIME_OUTPUT_FORMAT = "%H:%M"
 DATE_QUERY_PARAM = "date"
 DAYS_AHEAD_QUERY_PARAM = "days_ahead"
@@ -114,7 +195,220 @@ def build_oauth_redirect_url(base_url: str, payload: dict) -> str:
     return f"{base_url}{separator}{query_string}"
 
 
-def parse_calendar_date(date_value: str, timezone: pytz.BaseTzInfo) -> datetime.date:
+def model_json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model built from trusted database rows.
+
+    Returning a Response makes FastAPI skip re-validating and re-encoding
+    the body; the route's response_model still documents it in OpenAPI.
+    """
+    return Response(content=model.model_dump_json(), media_type=JSON_MEDIA_TYPE)
+
+
+def list_json_response(adapter: TypeAdapter, items: List[BaseModel]) -> Response:
+    """
+    Serialize a list of response models built from trusted database rows.
+
+    The adapter dumps the whole list to JSON bytes at once instead of
+    FastAPI validating and encoding each item.
+    """
+    return Response(content=adapter.dump_json(items), media_type=JSON_MEDIA_TYPE)
+
+
+async def run_read_queries(db: Session, queries, *args) -> list:
+    """
+    Run independent read-only queries concurrently, off the event loop.
+
+    Each query gets its own session and pooled connection when the request
+    session is bound to an engine. A session pinned to one connection (as
+    in tests) runs them one after another instead, since a connection
+    can't be shared across threads. Queries must return plain rows, not
+    ORM objects, as their sessions close before the results are used.
+    """
+    bind = db.get_bind()
+    if not isinstance(bind, Engine):
+        return await run_in_threadpool(lambda: [query(db, *args) for query in queries])
+
+    def run(query):
+        with SessionLocal(bind=bind) as session:
+            return query(session, *args)
+
+    return list(await asyncio.gather(
+        *(run_in_threadpool(run, query) for query in queries)
+    ))
+
+
+def update_fields(update: BaseModel) -> Dict[str, Any]:
+    """
+    Fields a partial-update request actually sets.
+
+    Omitted fields and explicit nulls are both left out, so only the
+    columns that change are written.
+    """
+    return update.model_dump(exclude_unset=True, exclude_none=True)
+
+
+def paginate(query, pagination: models.PaginationParams):
+    """
+    Fetch one page of a query.
+
+    Returns the page's rows and the pagination fields (total, page,
+    per_page) for the response; pages is derived by the response model.
+    """
+    total = query.order_by(None).count()
+    rows = query.offset(
+        (pagination.page - 1) * pagination.per_page
+    ).limit(pagination.per_page).all()
+    return rows, {
+        "total": total,
+        "page": pagination.page,
+        "per_page": pagination.per_page,
+    }
+
+
+def appointment_row_to_response(row: Any, patient_name: Optional[str]) -> models.AppointmentResponse:
+    """AppointmentResponse for an appointment object or column row, with display fallbacks."""
+    return models.AppointmentResponse.from_orm_fast(
+        row,
+        patient_name=patient_name or APPOINTMENT_SUMMARY_FALLBACK,
+        duration_minutes=row.duration_minutes or config.APPOINTMENT_DURATION_MINUTES,
+        type=row.type or APPOINTMENT_TYPE_FALLBACK,
+        status=row.status or APPOINTMENT_STATUS_SCHEDULED,
+        reminder_sent=row.reminder_sent or False,
+    )
+
+
+def appointment_to_response(appointment: database.Appointment) -> models.AppointmentResponse:
+    """AppointmentResponse for a stored appointment, with display fallbacks."""
+    return appointment_row_to_response(
+        appointment, appointment.patient.name if appointment.patient else None
+    )
+
+
+def call_row_to_response(row: Any, patient_name: Optional[str], phone: str) -> models.CallResponse:
+    """CallResponse for a call object or column row, with empty-value fallbacks."""
+    return models.CallResponse.from_orm_fast(
+        row,
+        call_sid=row.call_sid or "",
+        patient_id=row.patient_id or "",
+        patient_name=patient_name or "",
+        phone=phone,
+        type=row.type or "",
+        status=row.status or "",
+        duration_seconds=row.duration_seconds or 0,
+    )
+
+
+def call_to_response(call: database.Call) -> models.CallResponse:
+    """CallResponse for a stored call, with empty-value fallbacks."""
+    return call_row_to_response(
+        call, call.patient.name if call.patient else None, call.phone_number
+    )
+
+
+def appointment_rows_to_responses(rows) -> List[models.AppointmentResponse]:
+    """AppointmentResponses for rows selected with APPOINTMENT_RESPONSE_COLUMNS."""
+    return [appointment_row_to_response(row, row.patient_name) for row in rows]
+
+
+def call_rows_to_responses(rows) -> List[models.CallResponse]:
+    """CallResponses for rows selected with CALL_RESPONSE_COLUMNS."""
+    return [call_row_to_response(row, row.patient_name, row.phone) for row in rows]
+
+
+def patient_to_response(
+    patient: database.Patient,
+    last_appointment_at: Optional[datetime] = None
+) -> models.PatientResponse:
+    """PatientResponse for a stored patient and the time of their latest appointment."""
+    return models.PatientResponse.from_orm_fast(
+        patient,
+        last_appointment=last_appointment_at,
+    )
+
+
+def last_appointment_times(db: Session, patient_ids: List[str]) -> Dict[str, datetime]:
+    """Latest appointment time per patient, fetched in one grouped query."""
+    if not patient_ids:
+        return {}
+    rows = db.query(
+        database.Appointment.patient_id,
+        func.max(database.Appointment.scheduled_at)
+    ).filter(
+        database.Appointment.patient_id.in_(patient_ids),
+        database.Appointment.scheduled_at.isnot(None)
+    ).group_by(database.Appointment.patient_id).all()
+    return dict(rows)
+
+
+def parse_iso_datetime(value: str, fallback_format: str) -> datetime:
+    """
+    Parse a date or date-time string.
+
+    Well-formed ISO input takes the C-level fromisoformat path; anything
+    else (e.g. unpadded months) falls back to strptime with the given format.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, fallback_format)
+
+
+def find_or_create_patient(
+    db: Session,
+    doctor_id: str,
+    name: str,
+    phone: str
+) -> tuple[database.Patient, bool]:
+    """
+    Return the doctor's patient with this phone, inserting one if needed.
+
+    On SQLite and PostgreSQL the insert is an ON CONFLICT DO NOTHING against
+    the (doctor_id, phone) unique key, so concurrent calls from the same
+    caller can't create duplicates. Databases that don't have the key yet
+    (init_db not run since it was added) use the plain lookup-then-add path.
+    The new row is left uncommitted.
+
+    Returns:
+        (patient, created)
+    """
+    upsert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    created = False
+
+    if upsert is not None and database.has_unique_key(
+        db.connection(), database.Patient.__tablename__, PATIENT_UNIQUE_KEY
+    ):
+        result = db.execute(
+            upsert(database.Patient)
+            .values(
+                id=f"pat_{secrets.token_hex(RECORD_ID_TOKEN_BYTES)}",
+                doctor_id=doctor_id,
+                name=name,
+                phone=phone
+            )
+            .on_conflict_do_nothing(index_elements=list(PATIENT_UNIQUE_KEY))
+        )
+        created = result.rowcount == 1
+
+    patient = db.query(database.Patient).filter(
+        database.Patient.doctor_id == doctor_id,
+        database.Patient.phone == phone
+    ).first()
+
+    if patient is None:
+        patient = database.Patient(
+            id=f"pat_{secrets.token_hex(RECORD_ID_TOKEN_BYTES)}",
+            doctor_id=doctor_id,
+            name=name,
+            phone=phone
+        )
+        db.add(patient)
+        created = True
+
+    return patient, created
+
+
+def parse_calendar_date(date_value: str, timezone: tzinfo) -> datetime.date:
     """Parse a calendar date string into a date."""
     normalized = date_value.strip().lower()
     today = datetime.now(timezone).date()
@@ -124,20 +418,20 @@ def parse_calendar_date(date_value: str, timezone: pytz.BaseTzInfo) -> datetime.
     if normalized == DATE_VALUE_TOMORROW:
         return today + timedelta(days=DATE_RANGE_DAYS)
 
-    return datetime.strptime(normalized, DATE_INPUT_FORMAT).date()
+    return parse_iso_datetime(normalized, DATE_INPUT_FORMAT).date()
 
 
 def resolve_time_window(
     date_value: Optional[str],
     days_ahead: Optional[int],
-    timezone: pytz.BaseTzInfo
+    timezone: tzinfo
 ) -> tuple[datetime, datetime]:
     """Resolve time window for calendar query."""
     now = datetime.now(timezone)
 
     if date_value:
         target_date = parse_calendar_date(date_value, timezone)
-        day_start = timezone.localize(datetime.combine(target_date, time.min))
+        day_start = datetime.combine(target_date, time.min, tzinfo=timezone)
         day_end = day_start + timedelta(days=DATE_RANGE_DAYS)
         time_min = now if target_date == now.date() else day_start
         return time_min, day_end
@@ -164,37 +458,28 @@ def parse_description_fields(description: Optional[str]) -> Dict[str, str]:
     if not description:
         return {}
 
-    parsed: Dict[str, str] = {}
-    for line in description.splitlines():
-        if DESCRIPTION_FIELD_SEPARATOR not in line:
-            continue
-        key, value = line.split(DESCRIPTION_FIELD_SEPARATOR, 1)
-        normalized_key = key.strip().lower().replace(DESCRIPTION_KEY_SEPARATOR, DESCRIPTION_KEY_REPLACEMENT)
-        parsed[normalized_key] = value.strip()
-    return parsed
+    return {
+        key.strip().lower().replace(DESCRIPTION_KEY_SEPARATOR, DESCRIPTION_KEY_REPLACEMENT): value.strip()
+        for key, value in DESCRIPTION_LINE_RE.findall(description)
+    }
+
+
+@lru_cache(maxsize=None)
+def description_field_re(field_label: str) -> re.Pattern:
+    """Whole description lines for one "<label>: value" field."""
+    return re.compile(
+        rf"^{re.escape(field_label)}{re.escape(DESCRIPTION_FIELD_SEPARATOR)}.*$", re.MULTILINE
+    )
 
 
 def update_description_field(description: Optional[str], field_label: str, value: str) -> str:
     """Update or insert a field in the event description."""
-    field_prefix = f"{field_label}{DESCRIPTION_FIELD_SEPARATOR}"
+    line = f"{field_label}{DESCRIPTION_FIELD_SEPARATOR}{value}"
     if not description:
-        return f"{field_label}{DESCRIPTION_FIELD_SEPARATOR}{value}"
-
-    lines = description.splitlines()
-    updated_lines: List[str] = []
-    field_found = False
-
-    for line in lines:
-        if line.startswith(field_prefix):
-            updated_lines.append(f"{field_label}{DESCRIPTION_FIELD_SEPARATOR}{value}")
-            field_found = True
-        else:
-            updated_lines.append(line)
+        return line
 
-    if not field_found:
-        updated_lines.append(f"{field_label}{DESCRIPTION_FIELD_SEPARATOR}{value}")
-
-    return "\n".join(updated_lines)
+    updated, count = description_field_re(field_label).subn(lambda _: line, description)
+    return updated if count else f"{description.rstrip(DESCRIPTION_LINE_BREAKS)}\n{line}"
 
 
 def build_no_show_summary(summary: Optional[str]) -> str:
@@ -256,7 +541,8 @@ def update_calendar_event_no_show(
     try:
         event = service.events().get(
             calendarId=calendar_id,
-            eventId=event_id
+            eventId=event_id,
+            fields=GOOGLE_CALENDAR_NO_SHOW_READ_FIELDS
         ).execute()
     except Exception as e:
         raise HTTPException(
@@ -267,15 +553,26 @@ def update_calendar_event_no_show(
     description = event.get(GOOGLE_CALENDAR_DESCRIPTION_FIELD, "")
     updated_description = update_description_field(description, DESCRIPTION_LABEL_STATUS, APPOINTMENT_STATUS_NO_SHOW)
     updated_summary = build_no_show_summary(event.get(GOOGLE_CALENDAR_SUMMARY_FIELD))
+    patch_body = {
+        GOOGLE_CALENDAR_DESCRIPTION_FIELD: updated_description,
+        GOOGLE_CALENDAR_SUMMARY_FIELD: updated_summary
+    }
 
-    event[GOOGLE_CALENDAR_DESCRIPTION_FIELD] = updated_description
-    event[GOOGLE_CALENDAR_SUMMARY_FIELD] = updated_summary
+    # Events booked by the agent also carry structured metadata; keep it in sync
+    private_properties = event.get(GOOGLE_CALENDAR_EXTENDED_PROPERTIES_FIELD, {}).get(
+        GOOGLE_CALENDAR_PRIVATE_PROPERTIES_FIELD, {}
+    )
+    if DESCRIPTION_FIELD_STATUS in private_properties:
+        patch_body[GOOGLE_CALENDAR_EXTENDED_PROPERTIES_FIELD] = {
+            GOOGLE_CALENDAR_PRIVATE_PROPERTIES_FIELD: {DESCRIPTION_FIELD_STATUS: APPOINTMENT_STATUS_NO_SHOW}
+        }
 
     try:
-        service.events().update(
+        service.events().patch(
             calendarId=calendar_id,
             eventId=event_id,
-            body=event
+            body=patch_body,
+            fields=GOOGLE_CALENDAR_NO_SHOW_PATCH_FIELDS
         ).execute()
     except Exception as e:
         raise HTTPException(
@@ -284,7 +581,7 @@ def update_calendar_event_no_show(
         )
 
 
-def parse_event_datetime(value: Optional[str], timezone: pytz.BaseTzInfo) -> Optional[datetime]:
+def parse_event_datetime(value: Optional[str], timezone: tzinfo) -> Optional[datetime]:
     """Parse Google event datetime into localized datetime."""
     if not value:
         return None
@@ -293,13 +590,13 @@ def parse_event_datetime(value: Optional[str], timezone: pytz.BaseTzInfo) -> Opt
         normalized = normalized.replace(DATETIME_UTC_SUFFIX, DATETIME_UTC_OFFSET, 1)
     parsed = datetime.fromisoformat(normalized)
     if parsed.tzinfo is None:
-        return timezone.localize(parsed)
+        return parsed.replace(tzinfo=timezone)
     return parsed.astimezone(timezone)
 
 
 def map_event_to_appointment_record(
     event: dict,
-    timezone: pytz.BaseTzInfo
+    timezone: tzinfo
 ) -> models.CalendarAppointmentRecord:
     """Map Google Calendar event to appointment record."""
     summary = normalize_summary(event.get(GOOGLE_CALENDAR_SUMMARY_FIELD))
@@ -357,7 +654,11 @@ except Exception as e:
     print(f"{Fore.RED}❌ Database initialization failed: {e}")
     sys.exit(1)
 
-# Initialize FastAPI app
+# Initialize FastAPI app.
+# No custom default_response_class (e.g. ORJSONResponse): with the default,
+# endpoints that declare a response_model are serialized straight to JSON
+# bytes by pydantic-core, skipping jsonable_encoder and json.dumps. A custom
+# response class would turn that fast path off.
 app = FastAPI(
     title=config.APP_NAME,
     version=config.APP_VERSION,
@@ -395,6 +696,32 @@ except Exception as e:
     print(f"{Fore.RED}❌ Google Auth Manager initialization failed: {e}")
     sys.exit(1)
 
+# Patient SMS goes out on its own small pool so responses never wait on Twilio.
+# Created on first use and again after shutdown, so an in-process restart
+# (or a re-entered test lifespan) gets a fresh pool.
+_notification_pool: Optional[ThreadPoolExecutor] = None
+_notification_pool_lock = threading.Lock()
+
+
+def get_notification_pool() -> ThreadPoolExecutor:
+    global _notification_pool
+    with _notification_pool_lock:
+        if _notification_pool is None:
+            _notification_pool = ThreadPoolExecutor(
+                max_workers=config.NOTIFICATION_MAX_WORKERS,
+                thread_name_prefix=NOTIFICATION_THREAD_NAME_PREFIX
+            )
+        return _notification_pool
+
+
+def close_notification_pool() -> None:
+    """Let queued notifications go out, then stop the pool; later sends start a new one."""
+    global _notification_pool
+    with _notification_pool_lock:
+        pool, _notification_pool = _notification_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
 # HTTP Bearer security for JWT tokens
 security = HTTPBearer()
 
@@ -445,7 +772,7 @@ async def health_check():
         "status": "healthy",
         "app": config.APP_NAME,
         "version": config.APP_VERSION,
-        "timestamp": datetime.utcnow()
+        "timestamp": datetime.now(UTC)
     }
 
 
@@ -480,10 +807,7 @@ async def get_google_auth_url(db: Session = Depends(get_db)):
             "state": ""
         }
     except Exception as e:
-        print(f"{Fore.RED}[AUTH] ❌ Error generating auth URL: {str(e)}")
-        import traceback
-        print(f"{Fore.RED}[AUTH] Traceback:")
-        traceback.print_exc()
+        auth_log.exception("Error generating auth URL: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get auth URL: {str(e)}"
@@ -642,9 +966,7 @@ def handle_google_oauth_callback(
             return RedirectResponse(url=redirect_url)
         raise
     except Exception as e:
-        print(f"{Fore.RED}[AUTH] ❌ Unexpected error in callback: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        auth_log.exception("Unexpected error in callback: %s", e)
         if redirect_on_error and config.FRONTEND_OAUTH_REDIRECT_URL:
             error_payload = {
                 OAUTH_REDIRECT_PARAM_ERROR: OAUTH_ERROR_GENERIC,
@@ -714,15 +1036,12 @@ async def get_doctor_profile(
             detail=ERROR_DOCTOR_NOT_FOUND
         )
 
-    return {
-        "id": user.id,
-        "email": user.email,
-        "name": user.name,
-        "phone": user.phone or DEFAULT_DOCTOR_PHONE,
-        "timezone": user.timezone or config.DOCTOR_TIMEZONE,
-        "calendar_connected": bool(user.google_oauth_token),
-        "created_at": user.created_at
-    }
+    return models.DoctorProfile.from_orm_fast(
+        user,
+        phone=user.phone or DEFAULT_DOCTOR_PHONE,
+        timezone=user.timezone or config.DOCTOR_TIMEZONE,
+        calendar_connected=bool(user.google_oauth_token)
+    )
 
 
 # ============================================================================
@@ -805,6 +1124,7 @@ async def disconnect_calendar(
         user.google_refresh_token = None
         user.google_token_expiry = None
         db.commit()
+        auth_service.invalidate_oauth_token_cache(current_user)
 
         return {"success": True, "message": config.ERROR_CALENDAR_DISCONNECT}
 
@@ -900,9 +1220,9 @@ async def list_calendar_appointments(
 
         tz_name = user.timezone or config.DOCTOR_TIMEZONE
         try:
-            timezone = pytz.timezone(tz_name)
-        except pytz.UnknownTimeZoneError:
-            timezone = pytz.timezone(CALENDAR_TIMEZONE_FALLBACK)
+            timezone = get_timezone(tz_name)
+        except ZoneInfoNotFoundError:
+            timezone = get_timezone(CALENDAR_TIMEZONE_FALLBACK)
 
         if days_ahead is not None and days_ahead <= 0:
             raise HTTPException(
@@ -922,7 +1242,8 @@ async def list_calendar_appointments(
             maxResults=limit,
             singleEvents=GOOGLE_CALENDAR_SINGLE_EVENTS,
             orderBy=GOOGLE_CALENDAR_ORDER_BY,
-            timeZone=timezone.zone
+            timeZone=timezone.key,
+            fields=GOOGLE_CALENDAR_LIST_FIELDS
         ).execute()
 
         events = result.get("items", [])
@@ -979,8 +1300,8 @@ async def mark_calendar_appointment_no_show(
 
 @app.get("/api/patients", response_model=List[models.PatientResponse])
 async def list_patients(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(LIST_LIMIT_DEFAULT, ge=1, le=LIST_LIMIT_MAX),
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -992,25 +1313,11 @@ async def list_patients(
             database.Patient.doctor_id == current_user
         ).offset(skip).limit(limit).all()
 
-        results = []
-        for patient in patients:
-            last_appt = db.query(database.Appointment).filter(
-                database.Appointment.patient_id == patient.id
-            ).order_by(database.Appointment.date.desc()).first()
-
-            results.append({
-                "id": patient.id,
-                "name": patient.name,
-                "phone": patient.phone,
-                "email": patient.email,
-                "notes": patient.notes,
-                "created_at": patient.created_at,
-                "last_appointment": (
-                    datetime.strptime(last_appt.date, DATE_INPUT_FORMAT)
-                    if last_appt and last_appt.date else None
-                ),
-            })
-        return results
+        last_times = last_appointment_times(db, [patient.id for patient in patients])
+        return list_json_response(PATIENT_LIST_ADAPTER, [
+            patient_to_response(patient, last_times.get(patient.id))
+            for patient in patients
+        ])
 
     except Exception as e:
         raise HTTPException(
@@ -1028,10 +1335,8 @@ async def create_patient(
     """
     Create a new patient record for the authenticated doctor.
     """
-    import uuid
-
     try:
-        patient_id = f"pat_{uuid.uuid4().hex[:12]}"
+        patient_id = f"pat_{secrets.token_hex(RECORD_ID_TOKEN_BYTES)}"
         patient = database.Patient(
             id=patient_id,
             doctor_id=current_user,
@@ -1044,16 +1349,14 @@ async def create_patient(
         db.commit()
         db.refresh(patient)
 
-        return {
-            "id": patient.id,
-            "name": patient.name,
-            "phone": patient.phone,
-            "email": patient.email,
-            "notes": patient.notes,
-            "created_at": patient.created_at,
-            "last_appointment": None,
-        }
+        return patient_to_response(patient)
 
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A patient with this phone number already exists"
+        )
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -1082,22 +1385,8 @@ async def get_patient(
             detail=ERROR_APPOINTMENT_NOT_FOUND
         )
 
-    last_appt = db.query(database.Appointment).filter(
-        database.Appointment.patient_id == patient.id
-    ).order_by(database.Appointment.date.desc()).first()
-
-    return {
-        "id": patient.id,
-        "name": patient.name,
-        "phone": patient.phone,
-        "email": patient.email,
-        "notes": patient.notes,
-        "created_at": patient.created_at,
-        "last_appointment": (
-            datetime.strptime(last_appt.date, DATE_INPUT_FORMAT)
-            if last_appt and last_appt.date else None
-        ),
-    }
+    last_times = last_appointment_times(db, [patient.id])
+    return patient_to_response(patient, last_times.get(patient.id))
 
 
 @app.put("/api/patients/{patient_id}", response_model=models.PatientResponse)
@@ -1122,35 +1411,14 @@ async def update_patient(
         )
 
     try:
-        if request.name is not None:
-            patient.name = request.name
-        if request.phone is not None:
-            patient.phone = request.phone
-        if request.email is not None:
-            patient.email = request.email
-        if request.notes is not None:
-            patient.notes = request.notes
-
-        patient.updated_at = datetime.utcnow()
+        for field, value in update_fields(request).items():
+            setattr(patient, field, value)
+
         db.commit()
         db.refresh(patient)
 
-        last_appt = db.query(database.Appointment).filter(
-            database.Appointment.patient_id == patient.id
-        ).order_by(database.Appointment.date.desc()).first()
-
-        return {
-            "id": patient.id,
-            "name": patient.name,
-            "phone": patient.phone,
-            "email": patient.email,
-            "notes": patient.notes,
-            "created_at": patient.created_at,
-            "last_appointment": (
-                datetime.strptime(last_appt.date, DATE_INPUT_FORMAT)
-                if last_appt and last_appt.date else None
-            ),
-        }
+        last_times = last_appointment_times(db, [patient.id])
+        return patient_to_response(patient, last_times.get(patient.id))
 
     except Exception as e:
         db.rollback()
@@ -1198,36 +1466,25 @@ async def delete_patient(
 
 @app.get("/api/appointments", response_model=List[models.AppointmentResponse])
 async def list_appointments(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(LIST_LIMIT_DEFAULT, ge=1, le=LIST_LIMIT_MAX),
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     List all appointments for the authenticated doctor.
+
+    Only the response columns are selected, so rows come back as plain
+    tuples without building or tracking ORM objects.
     """
     try:
-        appointments = db.query(database.Appointment).filter(
+        rows = db.query(*APPOINTMENT_RESPONSE_COLUMNS).outerjoin(
+            database.Patient, database.Patient.id == database.Appointment.patient_id
+        ).filter(
             database.Appointment.doctor_id == current_user
         ).offset(skip).limit(limit).all()
 
-        return [
-            {
-                "id": appt.id,
-                "calendar_event_id": appt.calendar_event_id,
-                "patient_id": appt.patient_id,
-                "patient_name": appt.patient.name,
-                "date": appt.date,
-                "time": appt.time,
-                "duration_minutes": appt.duration_minutes,
-                "type": appt.type,
-                "status": appt.status,
-                "notes": appt.notes,
-                "reminder_sent": appt.reminder_sent,
-                "created_at": appt.created_at
-            }
-            for appt in appointments
-        ]
+        return list_json_response(APPOINTMENT_LIST_ADAPTER, appointment_rows_to_responses(rows))
 
     except Exception as e:
         raise HTTPException(
@@ -1238,25 +1495,37 @@ async def list_appointments(
 
 @app.get("/api/appointments/upcoming", response_model=models.UpcomingAppointmentsResponse)
 async def get_upcoming_appointments(
+    pagination: Annotated[models.PaginationParams, Query()],
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Get upcoming appointments for the next 30 days.
+    Get one page of scheduled and confirmed appointments for the next 30 days.
 
-    Uses Calendar MCP through backend proxy pattern.
+    Only the response columns are selected (patient name via a join), so
+    rows come back as plain tuples without building ORM objects.
     """
     try:
-        appointments = calendar_service.get_upcoming_appointments(
-            user_id=current_user,
-            db=db,
-            days_ahead=30
-        )
-
-        return {
-            "count": len(appointments),
-            "appointments": appointments
-        }
+        today = datetime.now(get_timezone(config.DOCTOR_TIMEZONE)).date()
+        window_start = datetime.combine(today, time.min)
+        # Through the end of the last day in the window
+        window_end = window_start + UPCOMING_APPOINTMENTS_WINDOW + timedelta(days=1)
+
+        query = db.query(*APPOINTMENT_RESPONSE_COLUMNS).join(
+            database.Patient, database.Patient.id == database.Appointment.patient_id
+        ).filter(
+            database.Appointment.doctor_id == current_user,
+            database.Appointment.scheduled_at >= window_start,
+            database.Appointment.scheduled_at < window_end,
+            database.Appointment.status.in_(UPCOMING_APPOINTMENT_STATUSES)
+        ).order_by(database.Appointment.scheduled_at)
+        rows, page_fields = paginate(query, pagination)
+
+        return model_json_response(models.UpcomingAppointmentsResponse.model_construct(
+            count=page_fields["total"],
+            appointments=appointment_rows_to_responses(rows),
+            **page_fields
+        ))
 
     except Exception as e:
         raise HTTPException(
@@ -1324,20 +1593,7 @@ async def create_appointment(
             database.Appointment.id == result["appointment_id"]
         ).first()
 
-        return {
-            "id": appointment.id,
-            "calendar_event_id": appointment.calendar_event_id,
-            "patient_id": appointment.patient_id,
-            "patient_name": appointment.patient.name,
-            "date": appointment.date,
-            "time": appointment.time,
-            "duration_minutes": appointment.duration_minutes,
-            "type": appointment.type,
-            "status": appointment.status,
-            "notes": appointment.notes,
-            "reminder_sent": appointment.reminder_sent,
-            "created_at": appointment.created_at
-        }
+        return appointment_to_response(appointment)
 
     except HTTPException:
         raise
@@ -1365,6 +1621,26 @@ def find_appointment_by_id_or_calendar_id(db, doctor_id: str, appointment_id: st
     return appointment
 
 
+def set_appointment_status(db, doctor_id: str, appointment_id: str, new_status: str) -> bool:
+    """
+    Set an appointment's status with a direct UPDATE, matching the local ID
+    first and then calendar_event_id.
+
+    Returns:
+        True if an appointment was updated
+    """
+    # updated_at is set by the column's onupdate
+    values = {database.Appointment.status: new_status}
+    for id_column in (database.Appointment.id, database.Appointment.calendar_event_id):
+        updated = db.query(database.Appointment).filter(
+            database.Appointment.doctor_id == doctor_id,
+            id_column == appointment_id
+        ).update(values, synchronize_session=False)
+        if updated:
+            return True
+    return False
+
+
 @app.put("/api/appointments/{appointment_id}", response_model=models.AppointmentResponse)
 async def update_appointment(
     appointment_id: str,
@@ -1384,37 +1660,15 @@ async def update_appointment(
         )
 
     try:
-        if request.date is not None:
-            appointment.date = request.date
-        if request.time is not None:
-            appointment.time = request.time
-        if request.type is not None:
-            appointment.type = request.type
-        if request.notes is not None:
-            appointment.notes = request.notes
-        if request.status is not None:
-            appointment.status = request.status
-
-        appointment.updated_at = datetime.utcnow()
+        # Set on the loaded row (not Query.update) so the scheduled_at sync
+        # hook still runs when the date or time changes
+        for field, value in update_fields(request).items():
+            setattr(appointment, field, value)
+
         db.commit()
         db.refresh(appointment)
 
-        patient_name = appointment.patient.name if appointment.patient else APPOINTMENT_SUMMARY_FALLBACK
-
-        return {
-            "id": appointment.id,
-            "calendar_event_id": appointment.calendar_event_id,
-            "patient_id": appointment.patient_id,
-            "patient_name": patient_name,
-            "date": appointment.date,
-            "time": appointment.time,
-            "duration_minutes": appointment.duration_minutes or config.APPOINTMENT_DURATION_MINUTES,
-            "type": appointment.type,
-            "status": appointment.status,
-            "notes": appointment.notes,
-            "reminder_sent": appointment.reminder_sent or False,
-            "created_at": appointment.created_at,
-        }
+        return appointment_to_response(appointment)
 
     except Exception as e:
         db.rollback()
@@ -1433,21 +1687,18 @@ async def delete_appointment(
     """
     Cancel an appointment by setting its status to cancelled.
     """
-    appointment = find_appointment_by_id_or_calendar_id(db, current_user, appointment_id)
-
-    if not appointment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=ERROR_APPOINTMENT_NOT_FOUND
-        )
-
     try:
-        appointment.status = APPOINTMENT_STATUS_CANCELLED
-        appointment.updated_at = datetime.utcnow()
+        if not set_appointment_status(db, current_user, appointment_id, APPOINTMENT_STATUS_CANCELLED):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=ERROR_APPOINTMENT_NOT_FOUND
+            )
         db.commit()
 
         return {"success": True, "message": f"Appointment {appointment_id} cancelled"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -1466,21 +1717,18 @@ async def confirm_appointment(
     """
     Confirm an appointment by setting its status to confirmed.
     """
-    appointment = find_appointment_by_id_or_calendar_id(db, current_user, appointment_id)
-
-    if not appointment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=ERROR_APPOINTMENT_NOT_FOUND
-        )
-
     try:
-        appointment.status = "confirmed"
-        appointment.updated_at = datetime.utcnow()
+        if not set_appointment_status(db, current_user, appointment_id, APPOINTMENT_STATUS_CONFIRMED):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=ERROR_APPOINTMENT_NOT_FOUND
+            )
         db.commit()
 
         return {"success": True, "message": "Appointment confirmed"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -1523,7 +1771,6 @@ async def mark_appointment_no_show(
 
         if appointment:
             appointment.status = APPOINTMENT_STATUS_NO_SHOW
-            appointment.updated_at = datetime.utcnow()
             db.commit()
 
         return {
@@ -1549,8 +1796,8 @@ async def mark_appointment_no_show(
 
 @app.get("/api/calls", response_model=List[models.CallResponse])
 async def list_calls(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(LIST_LIMIT_DEFAULT, ge=1, le=LIST_LIMIT_MAX),
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -1558,28 +1805,15 @@ async def list_calls(
     List all calls (inbound and outbound) for the authenticated doctor.
     """
     try:
-        calls = db.query(database.Call).filter(
+        rows = db.query(*CALL_RESPONSE_COLUMNS).outerjoin(
+            database.Patient, database.Patient.id == database.Call.patient_id
+        ).filter(
             database.Call.doctor_id == current_user
         ).order_by(
             database.Call.created_at.desc()
         ).offset(skip).limit(limit).all()
 
-        return [
-            {
-                "id": call.id,
-                "call_sid": call.call_sid or "",
-                "patient_id": call.patient_id or "",
-                "patient_name": call.patient.name if call.patient else "",
-                "phone": call.phone_number,
-                "type": call.type or "",
-                "status": call.status or "",
-                "duration_seconds": call.duration_seconds or 0,
-                "started_at": call.started_at,
-                "ended_at": call.ended_at,
-                "created_at": call.created_at,
-            }
-            for call in calls
-        ]
+        return list_json_response(CALL_LIST_ADAPTER, call_rows_to_responses(rows))
 
     except Exception as e:
         raise HTTPException(
@@ -1590,35 +1824,28 @@ async def list_calls(
 
 @app.get("/api/calls/scheduled", response_model=models.ScheduledCallsResponse)
 async def get_scheduled_calls(
+    pagination: Annotated[models.PaginationParams, Query()],
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Get scheduled outbound calls for the authenticated doctor.
+    Get one page of scheduled outbound calls for the authenticated doctor.
     """
     try:
-        calls = db.query(database.Call).filter(
+        query = db.query(*CALL_RESPONSE_COLUMNS).outerjoin(
+            database.Patient, database.Patient.id == database.Call.patient_id
+        ).filter(
             database.Call.doctor_id == current_user,
             database.Call.status.in_(["initiated", "scheduled", "ringing"])
-        ).order_by(database.Call.created_at.desc()).all()
+        ).order_by(database.Call.created_at.desc())
+        rows, page_fields = paginate(query, pagination)
 
-        call_list = [
-            {
-                "id": call.id,
-                "call_sid": call.call_sid or "",
-                "patient_id": call.patient_id or "",
-                "patient_name": call.patient.name if call.patient else "",
-                "phone": call.phone_number,
-                "type": call.type or "",
-                "status": call.status or "",
-                "duration_seconds": call.duration_seconds or 0,
-                "started_at": call.started_at,
-                "ended_at": call.ended_at,
-                "created_at": call.created_at,
-            }
-            for call in calls
-        ]
-        return {"count": len(call_list), "calls": call_list}
+        call_list = call_rows_to_responses(rows)
+        return model_json_response(models.ScheduledCallsResponse.model_construct(
+            count=page_fields["total"],
+            calls=call_list,
+            **page_fields
+        ))
 
     except Exception as e:
         raise HTTPException(
@@ -1647,19 +1874,7 @@ async def get_call(
             detail="Call not found"
         )
 
-    return {
-        "id": call.id,
-        "call_sid": call.call_sid or "",
-        "patient_id": call.patient_id or "",
-        "patient_name": call.patient.name if call.patient else "",
-        "phone": call.phone_number,
-        "type": call.type or "",
-        "status": call.status or "",
-        "duration_seconds": call.duration_seconds or 0,
-        "started_at": call.started_at,
-        "ended_at": call.ended_at,
-        "created_at": call.created_at,
-    }
+    return call_to_response(call)
 
 
 @app.post("/api/calls/manual", response_model=models.CallResponse)
@@ -1674,8 +1889,6 @@ async def make_manual_call(
     Looks up the patient by ID, initiates a Twilio call to their
     phone number, and stores the call record in the database.
     """
-    import uuid
-
     # Look up patient to get their phone number
     patient = db.query(database.Patient).filter(
         database.Patient.id == request.patient_id,
@@ -1688,18 +1901,20 @@ async def make_manual_call(
             detail="Patient not found"
         )
 
-    call_id = f"call_{uuid.uuid4().hex[:12]}"
+    call_id = f"call_{secrets.token_hex(RECORD_ID_TOKEN_BYTES)}"
     call_type = request.call_type or "manual"
     now = datetime.utcnow()
 
     try:
         # Build inline TwiML so Twilio doesn't need a public webhook URL
-        twiml_message = (
-            f"<Response><Say voice=\"alice\">{request.message}</Say></Response>"
+        twiml_message = TwilioWrapper.create_say_response(
+            request.message, language=None, voice=MANUAL_CALL_VOICE
         )
 
-        # Initiate Twilio call with real patient phone
-        twilio_result = twilio.make_outbound_call(
+        # Initiate Twilio call with real patient phone; the SDK blocks, so it
+        # runs on the threadpool instead of stalling the event loop
+        twilio_result = await run_in_threadpool(
+            twilio.make_outbound_call,
             to_number=patient.phone,
             twiml_body=twiml_message,
         )
@@ -1764,7 +1979,6 @@ async def get_dashboard_stats(
     Counts patients, appointments (by status), and calls
     belonging to the authenticated doctor.
     """
-    from sqlalchemy import func
 
     try:
         total_patients = db.query(func.count(database.Patient.id)).filter(
@@ -1775,11 +1989,11 @@ async def get_dashboard_stats(
             database.Appointment.doctor_id == current_user
         ).scalar() or 0
 
-        now_date = datetime.utcnow().strftime(DATE_OUTPUT_FORMAT)
+        today_start = datetime.combine(datetime.now(UTC).date(), time.min)
 
         upcoming_appointments = db.query(func.count(database.Appointment.id)).filter(
             database.Appointment.doctor_id == current_user,
-            database.Appointment.date >= now_date,
+            database.Appointment.scheduled_at >= today_start,
             database.Appointment.status.in_([
                 APPOINTMENT_STATUS_SCHEDULED, "confirmed"
             ])
@@ -1822,6 +2036,44 @@ async def get_dashboard_stats(
         )
 
 
+def fetch_recent_appointments(db: Session, doctor_id: str) -> list:
+    """Most recently updated appointments, as response column rows."""
+    return db.query(*APPOINTMENT_RESPONSE_COLUMNS).outerjoin(
+        database.Patient, database.Patient.id == database.Appointment.patient_id
+    ).filter(
+        database.Appointment.doctor_id == doctor_id
+    ).order_by(
+        database.Appointment.updated_at.desc()
+    ).limit(RECENT_ACTIVITY_LIMIT).all()
+
+
+def fetch_recent_calls(db: Session, doctor_id: str) -> list:
+    """Most recent calls, as response column rows."""
+    return db.query(*CALL_RESPONSE_COLUMNS).outerjoin(
+        database.Patient, database.Patient.id == database.Call.patient_id
+    ).filter(
+        database.Call.doctor_id == doctor_id
+    ).order_by(
+        database.Call.created_at.desc()
+    ).limit(RECENT_ACTIVITY_LIMIT).all()
+
+
+def fetch_upcoming_events(db: Session, doctor_id: str) -> list:
+    """Next scheduled or confirmed appointments from today on, as response column rows."""
+    today_start = datetime.combine(datetime.now(UTC).date(), time.min)
+    return db.query(*APPOINTMENT_RESPONSE_COLUMNS).outerjoin(
+        database.Patient, database.Patient.id == database.Appointment.patient_id
+    ).filter(
+        database.Appointment.doctor_id == doctor_id,
+        database.Appointment.scheduled_at >= today_start,
+        database.Appointment.status.in_([
+            APPOINTMENT_STATUS_SCHEDULED, "confirmed"
+        ])
+    ).order_by(
+        database.Appointment.scheduled_at.asc()
+    ).limit(RECENT_ACTIVITY_LIMIT).all()
+
+
 @app.get("/api/dashboard/activity", response_model=models.DashboardActivity)
 async def get_dashboard_activity(
     current_user: str = Depends(get_current_user),
@@ -1831,77 +2083,20 @@ async def get_dashboard_activity(
     Get recent activity: latest appointments, calls, and upcoming events.
 
     Queries the database for the most recent records belonging to the
-    authenticated doctor.
+    authenticated doctor; the three independent queries run concurrently.
     """
-    RECENT_ACTIVITY_LIMIT = 5
-
     try:
-        recent_appointments = db.query(database.Appointment).filter(
-            database.Appointment.doctor_id == current_user
-        ).order_by(
-            database.Appointment.updated_at.desc()
-        ).limit(RECENT_ACTIVITY_LIMIT).all()
-
-        recent_calls = db.query(database.Call).filter(
-            database.Call.doctor_id == current_user
-        ).order_by(
-            database.Call.created_at.desc()
-        ).limit(RECENT_ACTIVITY_LIMIT).all()
-
-        now_date = datetime.utcnow().strftime(DATE_OUTPUT_FORMAT)
-        upcoming_events = db.query(database.Appointment).filter(
-            database.Appointment.doctor_id == current_user,
-            database.Appointment.date >= now_date,
-            database.Appointment.status.in_([
-                APPOINTMENT_STATUS_SCHEDULED, "confirmed"
-            ])
-        ).order_by(
-            database.Appointment.date.asc(),
-            database.Appointment.time.asc()
-        ).limit(RECENT_ACTIVITY_LIMIT).all()
-
-        def appointment_to_dict(appt):
-            patient_name = APPOINTMENT_SUMMARY_FALLBACK
-            if appt.patient:
-                patient_name = appt.patient.name
-            return {
-                "id": appt.id,
-                "calendar_event_id": appt.calendar_event_id,
-                "patient_id": appt.patient_id,
-                "patient_name": patient_name,
-                "date": appt.date,
-                "time": appt.time,
-                "duration_minutes": appt.duration_minutes or config.APPOINTMENT_DURATION_MINUTES,
-                "type": appt.type or APPOINTMENT_TYPE_FALLBACK,
-                "status": appt.status or APPOINTMENT_STATUS_SCHEDULED,
-                "notes": appt.notes,
-                "reminder_sent": appt.reminder_sent or False,
-                "created_at": appt.created_at,
-            }
-
-        def call_to_dict(call):
-            patient_name = ""
-            if call.patient:
-                patient_name = call.patient.name
-            return {
-                "id": call.id,
-                "call_sid": call.call_sid or "",
-                "patient_id": call.patient_id or "",
-                "patient_name": patient_name,
-                "phone": call.phone_number,
-                "type": call.type or "",
-                "status": call.status or "",
-                "duration_seconds": call.duration_seconds or 0,
-                "started_at": call.started_at,
-                "ended_at": call.ended_at,
-                "created_at": call.created_at,
-            }
+        recent_appointments, recent_calls, upcoming_events = await run_read_queries(
+            db,
+            (fetch_recent_appointments, fetch_recent_calls, fetch_upcoming_events),
+            current_user
+        )
 
-        return {
-            "recent_appointments": [appointment_to_dict(a) for a in recent_appointments],
-            "recent_calls": [call_to_dict(c) for c in recent_calls],
-            "upcoming_events": [appointment_to_dict(a) for a in upcoming_events],
-        }
+        return model_json_response(models.DashboardActivity.model_construct(
+            recent_appointments=appointment_rows_to_responses(recent_appointments),
+            recent_calls=call_rows_to_responses(recent_calls),
+            upcoming_events=appointment_rows_to_responses(upcoming_events),
+        ))
 
     except Exception as e:
         print(f"{Fore.RED}[DASHBOARD] ❌ Failed to load activity: {e}")
@@ -1942,12 +2137,13 @@ async def update_settings(request: models.SettingsUpdate):
     TODO: Restart scheduler if reminder settings changed
     """
     return {
-        "appointment_duration_minutes": request.appointment_duration_minutes or config.APPOINTMENT_DURATION_MINUTES,
-        "reminder_hours_before": request.reminder_hours_before or config.REMINDER_HOURS_BEFORE,
-        "timezone": request.timezone or config.DOCTOR_TIMEZONE,
-        "enable_sms_confirmations": request.enable_sms_confirmations if request.enable_sms_confirmations is not None else config.ENABLE_SMS_CONFIRMATIONS,
-        "enable_reminders": request.enable_reminders if request.enable_reminders is not None else config.ENABLE_REMINDERS,
-        "enable_outbound_calls": config.ENABLE_OUTBOUND_CALLS
+        "appointment_duration_minutes": config.APPOINTMENT_DURATION_MINUTES,
+        "reminder_hours_before": config.REMINDER_HOURS_BEFORE,
+        "timezone": config.DOCTOR_TIMEZONE,
+        "enable_sms_confirmations": config.ENABLE_SMS_CONFIRMATIONS,
+        "enable_reminders": config.ENABLE_REMINDERS,
+        "enable_outbound_calls": config.ENABLE_OUTBOUND_CALLS,
+        **update_fields(request),
     }
 
 
@@ -1996,7 +2192,7 @@ async def twilio_voice_webhook():
         from_number="+1234567890",  # TODO: Get from Twilio request
         to_number=config.TWILIO_PHONE_NUMBER
     )
-    return response.to_xml()
+    return Response(content=response.to_xml(), media_type=XML_MEDIA_TYPE)
 
 
 # ============================================================================
@@ -2011,7 +2207,7 @@ async def http_exception_handler(request, exc):
         content={
             "success": False,
             "error": exc.detail,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(UTC).isoformat()
         }
     )
 
@@ -2025,7 +2221,7 @@ async def general_exception_handler(request, exc):
         content={
             "success": False,
             "error": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(UTC).isoformat()
         }
     )
 
@@ -2037,6 +2233,16 @@ async def general_exception_handler(request, exc):
 # They accept phone numbers instead of JWT, create patients dynamically,
 # and return voice-appropriate responses with verbose logging.
 
+def agent_slot_to_dict(slot) -> dict:
+    """Render a TimeSlot the way the voice agent reads it."""
+    return {
+        "time": slot.formatted_time,
+        "date": slot.formatted_date,
+        "start": slot.start.isoformat(),
+        "end": slot.end.isoformat()
+    }
+
+
 class AgentCheckAvailabilityRequest(models.BaseModel):
     date: str
 
@@ -2058,24 +2264,16 @@ async def agent_check_availability(
         available_slots: List of available times
     """
     date = request.date
-    print(f"{Fore.CYAN}[AGENT API] check_availability called with date={date}")
+    agent_log.debug("check_availability called with date=%s", date)
 
     try:
         # Use CalendarService to check availability
         date_str, formatted_date, slots, message = cal_service.check_availability(date)
 
         # Convert TimeSlot objects to dicts for JSON response
-        available_slots = [
-            {
-                "time": slot.formatted_time,
-                "date": slot.formatted_date,
-                "start": slot.start.isoformat(),
-                "end": slot.end.isoformat()
-            }
-            for slot in slots
-        ]
+        available_slots = [agent_slot_to_dict(slot) for slot in slots]
 
-        print(f"{Fore.GREEN}[AGENT API] ✅ check_availability returned: {len(available_slots)} slots")
+        agent_log.info("check_availability returned %d slots", len(available_slots))
         return {
             "success": True,
             "date": date_str,
@@ -2085,9 +2283,7 @@ async def agent_check_availability(
         }
 
     except Exception as e:
-        print(f"{Fore.RED}[AGENT API] ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        agent_log.exception("Error: %s", e)
         return {
             "success": False,
             "date": date,
@@ -2095,6 +2291,70 @@ async def agent_check_availability(
         }
 
 
+class AgentCheckAvailabilityRangeRequest(models.BaseModel):
+    start_date: str
+    days: int = AGENT_AVAILABILITY_RANGE_DEFAULT_DAYS
+
+@app.post("/api/agent/calendar/availability-range")
+async def agent_check_availability_range(
+    request: AgentCheckAvailabilityRangeRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Check available appointment slots for several consecutive days.
+
+    Lets the agent answer "what's open this week?" with one tool call
+    instead of one per day; one free/busy query covers the whole range and
+    is split by day.
+
+    Args:
+        request: AgentCheckAvailabilityRangeRequest with start_date and days
+
+    Returns:
+        dates: Available slots per date
+    """
+    agent_log.debug(
+        "check_availability_range called with start_date=%s days=%s",
+        request.start_date, request.days
+    )
+
+    try:
+        start = cal_service.parse_date(request.start_date)
+        days = max(1, min(request.days, AGENT_AVAILABILITY_RANGE_MAX_DAYS))
+        dates = [
+            (start + timedelta(days=offset)).strftime(DATE_OUTPUT_FORMAT)
+            for offset in range(days)
+        ]
+
+        results = cal_service.check_availability_range(dates)
+
+        availability = [
+            {
+                "date": date_str,
+                "formatted_date": formatted_date,
+                "available_slots": [agent_slot_to_dict(slot) for slot in slots],
+                "message": message
+            }
+            for date_str, formatted_date, slots, message in results
+        ]
+        total_slots = sum(len(day["available_slots"]) for day in availability)
+
+        agent_log.info("check_availability_range returned %d slots over %d days", total_slots, days)
+        return {
+            "success": True,
+            "dates": availability,
+            "total_slots": total_slots
+        }
+
+    except Exception as e:
+        agent_log.exception("Error: %s", e)
+        return {
+            "success": False,
+            "start_date": request.start_date,
+            "error": str(e)
+        }
+
+
 class AgentListAppointmentsRequest(models.BaseModel):
     phone_number: str
 
@@ -2113,7 +2373,7 @@ async def agent_list_appointments(request: AgentListAppointmentsRequest, db: Ses
     Returns:
         appointments: List of patient's appointments
     """
-    print(f"{Fore.CYAN}[AGENT API] list_appointments called for phone={phone_number}")
+    agent_log.debug("list_appointments called for phone=%s", phone_number)
 
     try:
         # Find patient by phone number
@@ -2122,22 +2382,22 @@ async def agent_list_appointments(request: AgentListAppointmentsRequest, db: Ses
         ).first()
 
         if not patient:
-            print(f"{Fore.YELLOW}[AGENT API] ⚠️  Patient not found for phone={phone_number}")
+            agent_log.warning("Patient not found for phone=%s", phone_number)
             return {
                 "success": True,
                 "appointments": [],
                 "message": f"No appointments found for this number"
             }
 
-        print(f"{Fore.GREEN}[AGENT API] ✅ Found patient: {patient.id} ({patient.name})")
+        agent_log.debug("Found patient: %s (%s)", patient.id, patient.name)
 
         # Get patient's appointments
         appointments = db.query(database.Appointment).filter(
             database.Appointment.patient_id == patient.id,
             database.Appointment.status.in_(["scheduled", "confirmed"])
-        ).order_by(database.Appointment.date, database.Appointment.time).all()
+        ).order_by(database.Appointment.scheduled_at).all()
 
-        print(f"{Fore.GREEN}[AGENT API] ✅ Found {len(appointments)} appointments")
+        agent_log.info("Found %d appointments", len(appointments))
 
         return {
             "success": True,
@@ -2155,15 +2415,31 @@ async def agent_list_appointments(request: AgentListAppointmentsRequest, db: Ses
         }
 
     except Exception as e:
-        print(f"{Fore.RED}[AGENT API] ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        agent_log.exception("Error: %s", e)
         return {
             "success": False,
             "error": str(e)
         }
 
 
+async def release_booking(booking: Future) -> None:
+    """Cancel the appointment a booking created, once it finishes, if it succeeded."""
+    try:
+        success, _, confirmation_id, _ = await asyncio.wrap_future(booking)
+    except Exception:
+        return
+    if not success:
+        return
+
+    cancelled, message = await asyncio.wrap_future(
+        google_calendar_client.submit(cal_service.cancel_appointment, confirmation_id)
+    )
+    if cancelled:
+        agent_log.info("Released appointment %s after failed booking", confirmation_id)
+    else:
+        agent_log.error("Could not release appointment %s: %s", confirmation_id, message)
+
+
 class AgentScheduleAppointmentRequest(models.BaseModel):
     phone_number: str
     patient_name: str
@@ -2195,36 +2471,16 @@ async def agent_schedule_appointment(
     time = request.time
     appointment_type = request.appointment_type
 
-    print(f"{Fore.CYAN}[AGENT API] schedule_appointment called for phone={phone_number}, date={date}, time={time}")
+    agent_log.debug(
+        "schedule_appointment called for phone=%s, date=%s, time=%s", phone_number, date, time
+    )
 
     try:
         # Use hardcoded doctor_id for single-tenant
         doctor_id = "doctor_001"
 
-        # Find or create patient
-        patient = db.query(database.Patient).filter(
-            database.Patient.phone == phone_number
-        ).first()
-
-        if not patient:
-            print(f"{Fore.CYAN}[AGENT API] Creating new patient: {patient_name}")
-            import uuid
-            patient_id = f"pat_{uuid.uuid4().hex[:12]}"
-            patient = database.Patient(
-                id=patient_id,
-                doctor_id=doctor_id,
-                name=patient_name,
-                phone=phone_number
-            )
-            db.add(patient)
-            db.commit()
-            print(f"{Fore.GREEN}[AGENT API] ✅ Created patient: {patient_id}")
-        else:
-            print(f"{Fore.GREEN}[AGENT API] ✅ Found existing patient: {patient.id}")
-
         # Parse datetime from date and time strings
-        from datetime import datetime as dt_parse
-        appointment_datetime = dt_parse.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+        appointment_datetime = parse_iso_datetime(f"{date} {time}", AGENT_DATETIME_INPUT_FORMAT)
 
         # Map appointment_type string to AppointmentType enum
         from src.api.schemas.calendar import AppointmentType
@@ -2235,22 +2491,43 @@ async def agent_schedule_appointment(
         }
         appt_type = appt_type_map.get(appointment_type, AppointmentType.CHECKUP)
 
-        # Book appointment using CalendarService
-        success, message, confirmation_id, appointment = cal_service.create_appointment(
+        # Book appointment using CalendarService. The Google round trips don't
+        # depend on the patient row, so they run while the database work happens.
+        booking = google_calendar_client.submit(
+            cal_service.create_appointment,
             patient_name=patient_name,
             patient_phone=phone_number,
             appointment_datetime=appointment_datetime,
             appointment_type=appt_type
         )
 
+        try:
+            patient, created = find_or_create_patient(db, doctor_id, patient_name, phone_number)
+
+            success, message, confirmation_id, appointment = await asyncio.wrap_future(booking)
+
+            # One commit for the new patient, once the booking has come back
+            if created:
+                db.commit()
+        except Exception:
+            # The caller is told the booking failed, so it mustn't stay on the calendar
+            await release_booking(booking)
+            raise
+
+        if created:
+            agent_log.info("Created patient: %s", patient.id)
+        else:
+            agent_log.debug("Found existing patient: %s", patient.id)
+
         if not success:
-            print(f"{Fore.RED}[AGENT API] ❌ booking failed: {message}")
+            agent_log.warning("Booking failed: %s", message)
             return {
                 "success": False,
                 "error": message
             }
 
-        print(f"{Fore.GREEN}[AGENT API] ✅ Appointment created: {confirmation_id}")
+        agent_log.info("Appointment created: %s", confirmation_id)
+        queue_sms(phone_number, f"{config.MSG_APPOINTMENT_CONFIRMED} {message}")
         return {
             "success": True,
             "appointment_id": confirmation_id,
@@ -2262,9 +2539,7 @@ async def agent_schedule_appointment(
         }
 
     except Exception as e:
-        print(f"{Fore.RED}[AGENT API] ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        agent_log.exception("Error: %s", e)
         db.rollback()
         return {
             "success": False,
@@ -2300,8 +2575,10 @@ async def agent_reschedule_appointment(
     new_date = request.new_date
     new_time = request.new_time
 
-    print(f"{Fore.CYAN}[AGENT API] reschedule_appointment called for phone={phone_number}, appt={appointment_id}")
-    print(f"{Fore.CYAN}[AGENT API]   New date/time: {new_date} {new_time}")
+    agent_log.debug(
+        "reschedule_appointment called for phone=%s, appt=%s, new date/time=%s %s",
+        phone_number, appointment_id, new_date, new_time
+    )
 
     try:
         # Verify patient owns this appointment (check in Google Calendar via service)
@@ -2310,15 +2587,16 @@ async def agent_reschedule_appointment(
         ).first()
 
         if not patient:
-            print(f"{Fore.RED}[AGENT API] ❌ Patient not found")
+            agent_log.warning("Patient not found for phone=%s", phone_number)
             return {
                 "success": False,
                 "error": "Patient not found"
             }
 
         # Parse new datetime
-        from datetime import datetime as dt_parse
-        new_appointment_datetime = dt_parse.strptime(f"{new_date} {new_time}", "%Y-%m-%d %H:%M")
+        new_appointment_datetime = parse_iso_datetime(
+            f"{new_date} {new_time}", AGENT_DATETIME_INPUT_FORMAT
+        )
 
         # Reschedule using CalendarService
         success, message, appointment = cal_service.reschedule_appointment(
@@ -2327,13 +2605,14 @@ async def agent_reschedule_appointment(
         )
 
         if not success:
-            print(f"{Fore.RED}[AGENT API] ❌ Reschedule failed: {message}")
+            agent_log.warning("Reschedule failed: %s", message)
             return {
                 "success": False,
                 "error": message
             }
 
-        print(f"{Fore.GREEN}[AGENT API] ✅ Rescheduled appointment {appointment_id} to {new_date} {new_time}")
+        agent_log.info("Rescheduled appointment %s to %s %s", appointment_id, new_date, new_time)
+        queue_sms(phone_number, f"{config.MSG_APPOINTMENT_RESCHEDULED} {message}")
 
         return {
             "success": True,
@@ -2342,9 +2621,7 @@ async def agent_reschedule_appointment(
         }
 
     except Exception as e:
-        print(f"{Fore.RED}[AGENT API] ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        agent_log.exception("Error: %s", e)
         return {
             "success": False,
             "error": str(e)
@@ -2375,32 +2652,43 @@ async def agent_cancel_appointment(
     phone_number = request.phone_number
     appointment_id = request.appointment_id
 
-    print(f"{Fore.CYAN}[AGENT API] cancel_appointment called for phone={phone_number}, appt={appointment_id}")
+    agent_log.debug("cancel_appointment called for phone=%s, appt=%s", phone_number, appointment_id)
 
     try:
+        # Read the event while the patient is verified; the cancel below
+        # builds its patch from it instead of reading it again
+        event_prefetch = google_calendar_client.submit(
+            google_calendar_client.get_event, appointment_id, fields=EVENT_PATCH_SOURCE_FIELDS
+        )
+
         # Verify patient owns this appointment
         patient = db.query(database.Patient).filter(
             database.Patient.phone == phone_number
         ).first()
 
         if not patient:
-            print(f"{Fore.RED}[AGENT API] ❌ Patient not found")
+            # Drop the read if it hasn't started yet
+            event_prefetch.cancel()
+            agent_log.warning("Patient not found for phone=%s", phone_number)
             return {
                 "success": False,
                 "error": "Patient not found"
             }
 
+        event = await asyncio.wrap_future(event_prefetch)
+
         # Cancel appointment using CalendarService
-        success, message = cal_service.cancel_appointment(appointment_id=appointment_id)
+        success, message = cal_service.cancel_appointment(appointment_id=appointment_id, event=event)
 
         if not success:
-            print(f"{Fore.RED}[AGENT API] ❌ Cancellation failed: {message}")
+            agent_log.warning("Cancellation failed: %s", message)
             return {
                 "success": False,
                 "error": message
             }
 
-        print(f"{Fore.GREEN}[AGENT API] ✅ Appointment cancelled")
+        agent_log.info("Appointment %s cancelled", appointment_id)
+        queue_sms(phone_number, config.MSG_APPOINTMENT_CANCELLED)
 
         return {
             "success": True,
@@ -2408,15 +2696,62 @@ async def agent_cancel_appointment(
         }
 
     except Exception as e:
-        print(f"{Fore.RED}[AGENT API] ❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        agent_log.exception("Error: %s", e)
         return {
             "success": False,
             "error": str(e)
         }
 
 
+# ============================================================================
+# NOTIFICATIONS
+# ============================================================================
+
+def queue_sms(to_number: str, message: str) -> None:
+    """Send an SMS in the background; failures are logged, not raised."""
+    def log_failure(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            notification_log.error("SMS to %s failed: %s", to_number, error)
+
+    try:
+        future = get_notification_pool().submit(twilio.send_sms, to_number=to_number, message=message)
+    except RuntimeError as e:
+        # Pool closed by a concurrent shutdown
+        notification_log.error("SMS to %s not queued: %s", to_number, e)
+        return
+    future.add_done_callback(log_failure)
+
+
+# ============================================================================
+# REMINDERS
+# ============================================================================
+
+def send_appointment_reminder(appointment_id: str) -> None:
+    """Text the patient a reminder and record it on the calendar event."""
+    appointment = cal_service.get_appointment(appointment_id)
+    if not appointment or appointment.reminder_sent:
+        return
+    if appointment.status.value != APPOINTMENT_STATUS_SCHEDULED:
+        return
+
+    twilio.send_sms(
+        to_number=appointment.patient.phone,
+        message=config.render_appointment_reminder(
+            name=appointment.patient.name,
+            time=appointment.formatted_time
+        )
+    )
+    cal_service.mark_reminder_sent(appointment_id)
+    reminder_log.info("Reminder sent for appointment %s", appointment_id)
+
+
+def load_pending_reminders(window: timedelta):
+    """Appointments starting within `window` that still need a reminder."""
+    hours_ahead = int(window.total_seconds() // 3600)
+    return cal_service.get_upcoming_appointments(hours_ahead, pending_reminder_only=True)
+
+
 # ============================================================================
 # STARTUP/SHUTDOWN
 # ============================================================================
@@ -2427,12 +2762,21 @@ async def startup_event():
     print(f"{Fore.GREEN}✅ {config.APP_NAME} API started")
     print(f"{Fore.CYAN}📊 Debug mode: {config.DEBUG}")
     print(f"{Fore.CYAN}🔗 API Base URL: {config.API_BASE_URL}")
+    google_calendar_client.warmup()
+    if config.ENABLE_REMINDERS:
+        reminder_scheduler.start(send_appointment_reminder, load_pending_reminders)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Called when application shuts down"""
     print(f"{Fore.YELLOW}⏹️  {config.APP_NAME} API shutting down")
+    reminder_scheduler.stop()
+    google_calendar_client.close()
+    calendar_service.close_session()
+    # Let queued confirmations go out before exiting
+    close_notification_pool()
+    twilio.close()
 
 
 # ============================================================================
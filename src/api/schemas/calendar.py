@@ -2,8 +2,9 @@
 Pydantic schemas for Calendar API requests and responses.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -28,15 +29,21 @@ class AppointmentType(str, Enum):
 
 # ============== Common Models ==============
 
-class TimeSlot(BaseModel):
+# TimeSlot and Patient are built internally from already-typed values on
+# every availability check, so they are plain slotted dataclasses rather
+# than validated models. Pydantic still serializes them in responses.
+
+@dataclass(slots=True, frozen=True)
+class TimeSlot:
     """A single available time slot."""
     start: datetime
     end: datetime
-    formatted_time: str = Field(..., description="Human readable time, e.g., '2:00 PM'")
-    formatted_date: str = Field(..., description="Human readable date, e.g., 'Tuesday, February 11'")
+    formatted_time: Annotated[str, Field(description="Human readable time, e.g., '2:00 PM'")]
+    formatted_date: Annotated[str, Field(description="Human readable date, e.g., 'Tuesday, February 11'")]
 
 
-class Patient(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Patient:
     """Patient information."""
     name: str
     phone: str
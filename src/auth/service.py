@@ -10,7 +10,9 @@ Handles:
 
 import os
 import json
-import uuid
+import secrets
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
@@ -18,9 +20,10 @@ from google.oauth2.credentials import Credentials
 from sqlalchemy.orm import Session
 from src import config
 from src import database
-from colorama import Fore, init
+from src.utils.logger import get_logger
+from src.utils.console import Fore
 
-init(autoreset=True)
+log = get_logger("auth")
 
 OAUTH_USERINFO_API_NAME = "oauth2"
 OAUTH_USERINFO_API_VERSION = "v2"
@@ -34,6 +37,13 @@ TOKEN_FIELD_TOKEN_URI = "token_uri"
 TOKEN_FIELD_CLIENT_ID = "client_id"
 TOKEN_FIELD_CLIENT_SECRET = "client_secret"
 TOKEN_FIELD_SCOPES = "scopes"
+# Random bytes in generated IDs (hex-encoded to twice as many characters)
+USER_ID_TOKEN_BYTES = 6
+SESSION_ID_TOKEN_BYTES = 10
+
+# user_id -> (expires_at, token data); monotonic clock
+_oauth_token_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+_oauth_token_cache_lock = threading.RLock()
 
 
 def resolve_oauth_redirect_uri() -> str:
@@ -190,8 +200,8 @@ def get_google_oauth_url() -> tuple[str, str]:
         print(f"{Fore.CYAN}[AUTH SERVICE] Scopes: {config.GOOGLE_OAUTH_SCOPES}")
 
         print(f"{Fore.CYAN}[AUTH SERVICE] Creating Flow from credentials...")
-        flow = Flow.from_client_secrets_file(
-            config.GOOGLE_CREDENTIALS_PATH,
+        flow = Flow.from_client_config(
+            config.get_google_client_secrets(),
             scopes=config.GOOGLE_OAUTH_SCOPES,
             redirect_uri=redirect_uri
         )
@@ -210,10 +220,7 @@ def get_google_oauth_url() -> tuple[str, str]:
         print(f"{Fore.RED}[AUTH SERVICE] ❌ FileNotFoundError: {e}")
         raise
     except Exception as e:
-        print(f"{Fore.RED}[AUTH SERVICE] ❌ Error generating auth URL: {e}")
-        import traceback
-        print(f"{Fore.RED}[AUTH SERVICE] Traceback:")
-        traceback.print_exc()
+        log.exception("Error generating auth URL: %s", e)
         raise
 
 
@@ -231,8 +238,8 @@ def exchange_oauth_code_for_token(code: str, state: str) -> Optional[Dict[str, A
     try:
         from google_auth_oauthlib.flow import Flow
 
-        flow = Flow.from_client_secrets_file(
-            config.GOOGLE_CREDENTIALS_PATH,
+        flow = Flow.from_client_config(
+            config.get_google_client_secrets(),
             scopes=OAUTH_SCOPES,
             redirect_uri=resolve_oauth_redirect_uri(),
             state=state
@@ -327,10 +334,9 @@ def create_or_update_user(
                 user.google_token_expiry = datetime.fromisoformat(
                     oauth_token_data["expiry"]
                 )
-            user.updated_at = datetime.utcnow()
         else:
             # Create new user
-            user_id = f"user_{uuid.uuid4().hex[:12]}"
+            user_id = f"user_{secrets.token_hex(USER_ID_TOKEN_BYTES)}"
             user = database.User(
                 id=user_id,
                 email=email,
@@ -347,6 +353,7 @@ def create_or_update_user(
 
         db.commit()
         db.refresh(user)
+        invalidate_oauth_token_cache(user.id)
 
         if config.DEBUG:
             print(f"{Fore.CYAN}[DEBUG] User {email} created/updated: {user.id}")
@@ -382,6 +389,9 @@ def get_user_oauth_token(db: Session, user_id: str) -> Optional[Dict[str, Any]]:
     """
     Get user's Google OAuth token.
 
+    Served from a short-lived in-memory cache when possible, so repeated
+    calendar calls for the same user skip the database query.
+
     Args:
         db: Database session
         user_id: User ID
@@ -389,6 +399,10 @@ def get_user_oauth_token(db: Session, user_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: OAuth token data
     """
+    cached = _get_cached_oauth_token(user_id)
+    if cached is not None:
+        return cached
+
     user = get_user_by_id(db, user_id)
     if not user or not user.google_oauth_token:
         return None
@@ -405,12 +419,54 @@ def get_user_oauth_token(db: Session, user_id: str) -> Optional[Dict[str, Any]]:
             else:
                 return None
 
-        return token_data
+        _store_oauth_token(user_id, token_data, user.google_token_expiry)
+        return dict(token_data)
 
     except json.JSONDecodeError:
         return None
 
 
+def invalidate_oauth_token_cache(user_id: str) -> None:
+    """Drop a user's cached OAuth token after it is replaced or revoked."""
+    with _oauth_token_cache_lock:
+        _oauth_token_cache.pop(user_id, None)
+
+
+def _get_cached_oauth_token(user_id: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of a still-fresh cached token, if any."""
+    with _oauth_token_cache_lock:
+        entry = _oauth_token_cache.get(user_id)
+        if entry is None:
+            return None
+        expires_at, token_data = entry
+        if expires_at <= time.monotonic():
+            del _oauth_token_cache[user_id]
+            return None
+        return dict(token_data)
+
+
+def _store_oauth_token(
+    user_id: str,
+    token_data: Dict[str, Any],
+    token_expiry: Optional[datetime]
+) -> None:
+    """Cache token data until the TTL or the token's own expiry, whichever is first."""
+    ttl = config.OAUTH_TOKEN_CACHE_TTL_SECONDS
+    if token_expiry:
+        ttl = min(ttl, (token_expiry - datetime.utcnow()).total_seconds())
+    if ttl <= 0:
+        return
+
+    now = time.monotonic()
+    with _oauth_token_cache_lock:
+        if len(_oauth_token_cache) >= config.OAUTH_TOKEN_CACHE_MAX_ENTRIES:
+            for stale_id in [k for k, (exp, _) in _oauth_token_cache.items() if exp <= now]:
+                del _oauth_token_cache[stale_id]
+        if len(_oauth_token_cache) >= config.OAUTH_TOKEN_CACHE_MAX_ENTRIES:
+            del _oauth_token_cache[next(iter(_oauth_token_cache))]
+        _oauth_token_cache[user_id] = (now + ttl, dict(token_data))
+
+
 def refresh_user_oauth_token(db: Session, user_id: str) -> bool:
     """
     Refresh user's Google OAuth token using refresh token.
@@ -431,8 +487,7 @@ def refresh_user_oauth_token(db: Session, user_id: str) -> bool:
             return False
 
         # Load client secrets to get token_uri
-        with open(config.GOOGLE_CREDENTIALS_PATH, "r") as f:
-            client_secrets = json.load(f)
+        client_secrets = config.get_google_client_secrets()
 
         token_uri = client_secrets.get("token_uri", "https://oauth2.googleapis.com/token")
 
@@ -463,8 +518,8 @@ def refresh_user_oauth_token(db: Session, user_id: str) -> bool:
 
         user.google_oauth_token = json.dumps(token_data)
         user.google_token_expiry = credentials.expiry
-        user.updated_at = datetime.utcnow()
         db.commit()
+        invalidate_oauth_token_cache(user_id)
 
         if config.DEBUG:
             print(f"{Fore.CYAN}[DEBUG] OAuth token refreshed for user {user_id}")
@@ -493,7 +548,7 @@ def create_session(db: Session, user_id: str) -> Optional[database.UserSession]:
         UserSession: Created session object
     """
     try:
-        session_id = f"sess_{uuid.uuid4().hex[:20]}"
+        session_id = f"sess_{secrets.token_hex(SESSION_ID_TOKEN_BYTES)}"
 
         # Create JWT tokens
         access_token = create_access_token({"user_id": user_id})
@@ -9,11 +9,43 @@ Flow:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
+from src.config import (
+    CALENDAR_API_TIMEOUT_SECONDS,
+    CALENDAR_API_POOL_CONNECTIONS,
+    CALENDAR_API_POOL_MAXSIZE,
+)
+
 # Base URL for our Calendar API (running on same machine)
 CALENDAR_API_BASE_URL = "http://localhost:8000"
+HTTP_SCHEMES = ("http://", "https://")
+# Sent with every request; set once on the session rather than per call
+DEFAULT_HEADERS = {"Accept": "application/json"}
+
+
+def _build_session() -> requests.Session:
+    """HTTP session whose keep-alive connections are reused across calls."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=CALENDAR_API_POOL_CONNECTIONS,
+        pool_maxsize=CALENDAR_API_POOL_MAXSIZE
+    )
+    for scheme in HTTP_SCHEMES:
+        session.mount(scheme, adapter)
+    return session
+
+
+# Shared by every call so agent tool calls don't open a new connection each time
+_session = _build_session()
+
+
+def close_session() -> None:
+    """Close pooled connections to the Calendar API (call on shutdown)."""
+    _session.close()
 
 
 class CalendarServiceError(Exception):
@@ -42,12 +74,12 @@ def call_calendar_api(
     url = f"{CALENDAR_API_BASE_URL}{endpoint}"
     
     try:
-        response = requests.request(
+        response = _session.request(
             method=method,
             url=url,
             json=json_data,
             params=params,
-            timeout=10
+            timeout=CALENDAR_API_TIMEOUT_SECONDS
         )
         
         data = response.json()
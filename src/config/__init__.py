@@ -0,0 +1,26 @@
+"""
+Configuration loader for CallPilot application.
+
+Loads and validates all environment variables from .env file.
+Combines Pydantic settings with direct environment variable loading.
+
+Plain values live in src.config.constants and the Pydantic settings groups
+in src.config.models; both are reachable from here, so `from src import
+config` keeps working. The models (and pydantic) are only imported once
+something from them is read.
+"""
+
+from src.config import constants
+from src.config.constants import *  # noqa: F401,F403
+from src.config.constants import _ENV, _ensure_loaded  # noqa: F401
+
+
+def __getattr__(name: str):
+    # Typed constants and everything in src.config.models load on first use
+    if name in constants._LIMITS_CONSTANTS or name in constants._APPOINTMENT_CONSTANTS:
+        return getattr(constants, name)
+    from src.config import models
+    try:
+        return getattr(models, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -0,0 +1,331 @@
+"""
+Scalar configuration for CallPilot: strings, flags, messages and limits.
+
+Loads the environment (plus .env) into a snapshot and reads plain values
+from it. Importing this module does not import pydantic; the integer
+limits are validated by src.config.models the first time one is read.
+"""
+
+from functools import lru_cache
+import json
+import os
+import string
+import sys
+from typing import Callable
+from dotenv import dotenv_values
+
+from src.utils.console import Fore, COLOR_ENABLED as COLORAMA_AVAILABLE
+
+# Process environment layered over .env; the module-level constants and the
+# pydantic settings groups are all read from it. os.environ itself is not
+# modified, so export variables explicitly if a subprocess needs them.
+_ENV = {}
+_LOADED = False
+
+
+def _ensure_loaded() -> None:
+    """Read .env and snapshot the environment, once per process"""
+    global _LOADED
+    if _LOADED:
+        return
+    # Real environment variables win over .env, as with load_dotenv()
+    _ENV.update((name, value) for name, value in dotenv_values().items() if value is not None)
+    _ENV.update(os.environ)
+    _LOADED = True
+
+
+_ensure_loaded()
+
+
+class ConfigError(Exception):
+    """Raised when required configuration is missing or invalid"""
+    pass
+
+
+def validate_required_var(var_name: str, description: str = "") -> str:
+    """Validate that a required environment variable is set"""
+    value = _ENV.get(var_name)
+    if not value:
+        error_msg = f"Missing required environment variable: {var_name}"
+        if description:
+            error_msg += f" ({description})"
+        print(f"{Fore.RED}❌ {error_msg}")
+        raise ConfigError(error_msg)
+    return value
+
+
+def get_optional_var(var_name: str, default: str = None) -> str:
+    """Get an optional environment variable with default"""
+    return _ENV.get(var_name, default)
+
+
+_FORMAT_CONVERSIONS = {None: lambda value: value, "s": str, "r": repr, "a": ascii}
+
+
+def _compile_message(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once into a renderer taking keyword fields.
+
+    Templates with positional, attribute/index or nested fields fall back to
+    plain str.format.
+    """
+    parts = list(string.Formatter().parse(template))
+    if any(
+        field is not None and (not field.isidentifier() or "{" in spec)
+        for _, field, spec, _ in parts
+    ):
+        return lambda **fields: template.format(**fields)
+
+    def render(**fields) -> str:
+        return "".join(
+            literal if field is None
+            else literal + format(_FORMAT_CONVERSIONS[conversion](fields[field]), spec)
+            for literal, field, spec, conversion in parts
+        )
+    return render
+
+
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def get_bool_var(var_name: str, default: str) -> bool:
+    """Get a boolean environment variable ("true", "1", "yes", "on", ...)"""
+    return (_ENV.get(var_name, default) or "").strip().lower() in TRUTHY_VALUES
+
+
+def _parse_csv(raw: str, separator: str) -> tuple[str, ...]:
+    """Split a separated env value into a tuple of non-empty, stripped items"""
+    return tuple(item for item in map(str.strip, raw.split(separator)) if item)
+
+
+# ============================================================================
+# TYPED SETTINGS (resolved from src.config.models on first access)
+# ============================================================================
+# Integer settings are validated by the pydantic models in src.config.models.
+# They are looked up through the module __getattr__ below, so importing this
+# module alone does not import pydantic.
+_LIMITS_CONSTANTS = frozenset({
+    "CALENDAR_MAX_RESULTS",
+    "APPOINTMENTS_LOOKAHEAD_DAYS",
+    "REMINDER_HOURS_BEFORE",
+    "REMINDER_CHECK_INTERVAL_SECONDS",
+    "REMINDER_PRIME_HOURS",
+    "ACCESS_TOKEN_EXPIRE_MINUTES",
+    "REFRESH_TOKEN_EXPIRE_DAYS",
+    "TWILIO_API_TIMEOUT_SECONDS",
+    "ELEVENLABS_API_TIMEOUT_SECONDS",
+    "GOOGLE_API_TIMEOUT_SECONDS",
+    "GOOGLE_API_MAX_WORKERS",
+    "AVAILABILITY_CACHE_TTL_SECONDS",
+    "AVAILABILITY_CACHE_MAX_ENTRIES",
+    "OAUTH_TOKEN_CACHE_TTL_SECONDS",
+    "OAUTH_TOKEN_CACHE_MAX_ENTRIES",
+    "CALENDAR_API_TIMEOUT_SECONDS",
+    "CALENDAR_API_POOL_CONNECTIONS",
+    "CALENDAR_API_POOL_MAXSIZE",
+    "NOTIFICATION_MAX_WORKERS",
+    "DB_POOL_SIZE",
+    "TWILIO_API_POOL_MAXSIZE",
+    "TWILIO_API_CONNECT_RETRIES",
+    "TWILIO_STATUS_CACHE_TTL_SECONDS",
+    "TWILIO_STATUS_CACHE_MAX_ENTRIES",
+    "DB_MAX_OVERFLOW",
+})
+_APPOINTMENT_CONSTANTS = frozenset({
+    "APPOINTMENT_DURATION_MINUTES",
+    "APPOINTMENT_BUFFER_MINUTES",
+})
+
+
+def __getattr__(name: str):
+    if name in _LIMITS_CONSTANTS:
+        from src.config.models import get_limits_config
+        value = getattr(get_limits_config(), name.lower())
+    elif name in _APPOINTMENT_CONSTANTS:
+        from src.config.models import get_appointment_config
+        value = getattr(get_appointment_config(), name.removeprefix("APPOINTMENT_").lower())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Settings are process-wide, so later lookups can use a plain global
+    globals()[name] = value
+    return value
+
+
+# ============================================================================
+# GOOGLE OAUTH CONFIG
+# ============================================================================
+DEFAULT_GOOGLE_CREDENTIALS_PATH = "./google_credentials.json"
+GOOGLE_CREDENTIALS_PATH = get_optional_var(
+    "GOOGLE_CREDENTIALS_PATH",
+    DEFAULT_GOOGLE_CREDENTIALS_PATH
+)
+
+
+def _read_file_prefetched(path: str) -> bytes:
+    """Read a whole file, asking the kernel to read it ahead first"""
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        return f.read()
+
+
+@lru_cache(maxsize=1)
+def get_google_client_secrets() -> dict:
+    """
+    The parsed OAuth client secrets file at GOOGLE_CREDENTIALS_PATH.
+
+    Read once per process (validate_config() does it at startup); raises
+    FileNotFoundError if the file is missing.
+    """
+    return json.loads(_read_file_prefetched(GOOGLE_CREDENTIALS_PATH))
+
+
+DEFAULT_GOOGLE_CALENDAR_ID = "primary"
+GOOGLE_CALENDAR_ID = get_optional_var(
+    "GOOGLE_CALENDAR_ID",
+    DEFAULT_GOOGLE_CALENDAR_ID
+)
+DEFAULT_GOOGLE_OAUTH_SCOPES = (
+    "https://www.googleapis.com/auth/calendar,"
+    "openid,"
+    "https://www.googleapis.com/auth/userinfo.email,"
+    "https://www.googleapis.com/auth/userinfo.profile"
+)
+GOOGLE_OAUTH_SCOPES_SEPARATOR = ","
+GOOGLE_OAUTH_SCOPES_RAW = get_optional_var(
+    "GOOGLE_OAUTH_SCOPES",
+    DEFAULT_GOOGLE_OAUTH_SCOPES
+)
+GOOGLE_OAUTH_SCOPES = _parse_csv(GOOGLE_OAUTH_SCOPES_RAW, GOOGLE_OAUTH_SCOPES_SEPARATOR)
+# OAuth sends scopes as one space-delimited "scope" parameter
+GOOGLE_OAUTH_SCOPE_PARAM_SEPARATOR = " "
+
+
+@lru_cache(maxsize=None)
+def join_oauth_scopes(scopes: tuple[str, ...]) -> str:
+    """The interned "scope" parameter value for a tuple of scopes"""
+    return sys.intern(GOOGLE_OAUTH_SCOPE_PARAM_SEPARATOR.join(scopes))
+
+
+GOOGLE_OAUTH_SCOPES_STR = join_oauth_scopes(GOOGLE_OAUTH_SCOPES)
+
+GOOGLE_REDIRECT_URI = get_optional_var(
+    "GOOGLE_REDIRECT_URI",
+    None
+)
+
+
+# ============================================================================
+# ELEVENLABS CONFIG
+# ============================================================================
+ELEVENLABS_API_KEY = get_optional_var("ELEVENLABS_API_KEY", "")
+ELEVENLABS_AGENT_ID = get_optional_var("ELEVENLABS_AGENT_ID", "")
+ELEVENLABS_API_BASE_URL = get_optional_var(
+    "ELEVENLABS_API_BASE_URL",
+    "https://api.elevenlabs.io/v1"
+)
+
+# ============================================================================
+# TWILIO CONFIG
+# ============================================================================
+TWILIO_ACCOUNT_SID = get_optional_var("TWILIO_ACCOUNT_SID", "")
+TWILIO_AUTH_TOKEN = get_optional_var("TWILIO_AUTH_TOKEN", "")
+TWILIO_PHONE_NUMBER = get_optional_var("TWILIO_PHONE_NUMBER", "")
+TWILIO_API_BASE_URL = get_optional_var(
+    "TWILIO_API_BASE_URL",
+    "https://api.twilio.com"
+)
+
+# ============================================================================
+# DOCTOR SETTINGS
+# ============================================================================
+DOCTOR_TIMEZONE = get_optional_var("DOCTOR_TIMEZONE", "America/New_York")
+DOCTOR_EMAIL = get_optional_var("DOCTOR_EMAIL", "")
+
+# ============================================================================
+# REMINDER SCHEDULER
+# ============================================================================
+ENABLE_REMINDERS = get_bool_var("ENABLE_REMINDERS", "true")
+
+# ============================================================================
+# DATABASE CONFIG
+# ============================================================================
+DATABASE_URL = get_optional_var("DATABASE_URL", "sqlite:///./callpilot.db")
+
+# ============================================================================
+# AUTHENTICATION & SECURITY
+# ============================================================================
+SECRET_KEY = get_optional_var("SECRET_KEY", "dev-secret-key-change-in-production")
+ALGORITHM = get_optional_var("ALGORITHM", "HS256")
+
+# ============================================================================
+# APPLICATION CONFIG
+# ============================================================================
+APP_NAME = get_optional_var("APP_NAME", "CallPilot")
+APP_VERSION = get_optional_var("APP_VERSION", "0.1.0")
+DEBUG = get_bool_var("DEBUG", "false")
+LOG_LEVEL = get_optional_var("LOG_LEVEL", "INFO")
+API_BASE_URL = get_optional_var("API_BASE_URL", "http://localhost:8000")
+DEFAULT_CORS_ALLOWED_ORIGINS = "http://localhost:5173"
+CORS_ALLOWED_ORIGINS_SEPARATOR = ","
+CORS_ALLOWED_ORIGINS_RAW = get_optional_var("CORS_ALLOWED_ORIGINS", DEFAULT_CORS_ALLOWED_ORIGINS)
+CORS_ALLOWED_ORIGINS = _parse_csv(CORS_ALLOWED_ORIGINS_RAW, CORS_ALLOWED_ORIGINS_SEPARATOR)
+DEFAULT_FRONTEND_OAUTH_REDIRECT_URL = "http://localhost:5173/oauth/callback"
+FRONTEND_OAUTH_REDIRECT_URL = get_optional_var(
+    "FRONTEND_OAUTH_REDIRECT_URL",
+    DEFAULT_FRONTEND_OAUTH_REDIRECT_URL
+)
+
+# ============================================================================
+# WEBHOOK CONFIG
+# ============================================================================
+WEBHOOK_URL = get_optional_var("WEBHOOK_URL", "http://localhost:8000/api/webhooks/elevenlabs")
+
+# ============================================================================
+# SMS SETTINGS
+# ============================================================================
+ENABLE_SMS_CONFIRMATIONS = get_bool_var("ENABLE_SMS_CONFIRMATIONS", "true")
+SMS_CONFIRMATION_MESSAGE = get_optional_var(
+    "SMS_CONFIRMATION_MESSAGE",
+    "Hi {name}, your appointment is confirmed for {date} at {time}. Reply STOP to opt out."
+)
+
+# ============================================================================
+# FEATURE FLAGS
+# ============================================================================
+ENABLE_PATIENT_MANAGEMENT = get_bool_var("ENABLE_PATIENT_MANAGEMENT", "true")
+ENABLE_APPOINTMENT_REMINDERS = get_bool_var("ENABLE_APPOINTMENT_REMINDERS", "true")
+ENABLE_OUTBOUND_CALLS = get_bool_var("ENABLE_OUTBOUND_CALLS", "true")
+ENABLE_CALL_LOGGING = get_bool_var("ENABLE_CALL_LOGGING", "true")
+
+# ============================================================================
+# MESSAGES (Stored as constants to avoid magic strings)
+# ============================================================================
+MSG_APPOINTMENT_CONFIRMED = "Your appointment has been confirmed."
+MSG_APPOINTMENT_CANCELLED = "Your appointment has been cancelled."
+MSG_APPOINTMENT_RESCHEDULED = "Your appointment has been rescheduled."
+MSG_APPOINTMENT_REMINDER = "Hi {name}, reminder about your {time} appointment today."
+ERROR_INVALID_CREDENTIALS = "Invalid email or password."
+ERROR_APPOINTMENT_NOT_FOUND = "Appointment not found."
+ERROR_CALENDAR_DISCONNECT = "Calendar has been disconnected."
+ERROR_CALL_FAILED = "Failed to initiate call. Please try again."
+
+# Pre-parsed renderers for the templated messages above
+render_appointment_reminder = _compile_message(MSG_APPOINTMENT_REMINDER)
+render_sms_confirmation = _compile_message(SMS_CONFIRMATION_MESSAGE)
+
+
+def validate_config() -> bool:
+    """
+    Validate that all required config is properly set.
+    Call this on application startup.
+    """
+    _ensure_loaded()
+    # Load the client secrets now rather than on the first OAuth request
+    if os.path.exists(GOOGLE_CREDENTIALS_PATH):
+        try:
+            get_google_client_secrets()
+        except (OSError, ValueError) as e:
+            print(f"{Fore.YELLOW}⚠️  Could not read {GOOGLE_CREDENTIALS_PATH}: {e}")
+    print(f"{Fore.GREEN}✅ Configuration loaded successfully")
+    return True
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Pydantic settings groups for CallPilot.
+
+Each group is validated on first use and shared for the rest of the
+process. The integer constants in src.config.constants are read from
+LimitsConfig and AppointmentConfig.
+"""
+
+from functools import cached_property, lru_cache
+from typing import List
+from pydantic_settings import BaseSettings, EnvSettingsSource, SettingsConfigDict
+from pydantic import Field, computed_field
+
+from src.config.constants import _ENV, _ensure_loaded
+
+# The settings classes read the _ENV snapshot, so .env is parsed only once.
+
+
+class _SnapshotEnvSource(EnvSettingsSource):
+    """Environment settings source backed by _ENV instead of os.environ"""
+
+    def _load_env_vars(self):
+        if self.case_sensitive:
+            return dict(_ENV)
+        return {name.lower(): value for name, value in _ENV.items()}
+
+
+class _SnapshotSettings(BaseSettings):
+    """BaseSettings that read the config snapshot (environment + .env)"""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings
+    ):
+        return init_settings, _SnapshotEnvSource(settings_cls), file_secret_settings
+
+
+class GoogleCalendarConfig(_SnapshotSettings):
+    """Google Calendar API configuration."""
+    
+    model_config = SettingsConfigDict(
+        env_prefix="GOOGLE_",
+        extra="ignore"
+    )
+    
+    client_id: str = Field(default="", description="Google OAuth Client ID")
+    client_secret: str = Field(default="", description="Google OAuth Client Secret")
+    redirect_uri: str = Field(
+        default="http://localhost:8000/api/calendar/auth-callback",
+        description="OAuth redirect URI"
+    )
+    scopes: List[str] = Field(
+        default=[
+            "https://www.googleapis.com/auth/calendar",
+            "https://www.googleapis.com/auth/calendar.events"
+        ],
+        description="Google Calendar API scopes"
+    )
+    token_file: str = Field(
+        default="token.json",
+        description="Path to store OAuth tokens"
+    )
+
+
+class AppointmentConfig(_SnapshotSettings):
+    """Appointment settings."""
+    
+    model_config = SettingsConfigDict(
+        env_prefix="APPOINTMENT_",
+        extra="ignore"
+    )
+    
+    duration_minutes: int = Field(default=30, description="Default appointment duration")
+    buffer_minutes: int = Field(default=0, description="Buffer between appointments")
+    
+    available_start_hour: int = Field(default=9, description="Start hour")
+    available_start_minute: int = Field(default=0, description="Start minute")
+    available_end_hour: int = Field(default=17, description="End hour")
+    available_end_minute: int = Field(default=0, description="End minute")
+    
+    available_days: List[int] = Field(
+        default=[0, 1, 2, 3, 4, 5, 6],
+        description="Days of week (0=Mon, 6=Sun)"
+    )
+    
+    timezone: str = Field(default="America/New_York", description="Timezone")
+
+    @computed_field
+    @cached_property
+    def available_days_mask(self) -> int:
+        """available_days as a bitmask: bit n is set when weekday n is open"""
+        return sum(1 << day for day in set(self.available_days))
+
+    def is_available_day(self, weekday: int) -> bool:
+        """Whether the office is open on a weekday (0=Mon, 6=Sun)"""
+        return bool((self.available_days_mask >> weekday) & 1)
+
+
+class AppConfig(_SnapshotSettings):
+    """Main application configuration."""
+    
+    model_config = SettingsConfigDict(
+        env_prefix="APP_",
+        extra="ignore"
+    )
+    
+    app_name: str = Field(default="CallPilot", description="Application name")
+    debug: bool = Field(default=False, description="Debug mode")
+    host: str = Field(default="0.0.0.0", description="Server host")
+    port: int = Field(default=8000, description="Server port")
+
+
+class LimitsConfig(_SnapshotSettings):
+    """Numeric limits, timeouts and intervals (unprefixed env names)."""
+    
+    model_config = SettingsConfigDict(extra="ignore")
+    
+    calendar_max_results: int = Field(default=250, description="Max events per calendar query")
+    appointments_lookahead_days: int = Field(default=1, description="Default calendar lookahead")
+    
+    reminder_hours_before: int = Field(default=3, description="Reminder lead time")
+    reminder_check_interval_seconds: int = Field(default=900, description="Reminder poll interval")
+    reminder_prime_hours: int = Field(
+        default=24,
+        description="How far ahead the reminder scheduler loads appointments; reloaded once per window"
+    )
+    
+    access_token_expire_minutes: int = Field(default=30, description="JWT access token lifetime")
+    refresh_token_expire_days: int = Field(default=7, description="JWT refresh token lifetime")
+    
+    twilio_api_timeout_seconds: int = Field(default=10, description="Twilio request timeout")
+    twilio_api_pool_maxsize: int = Field(default=20, description="Pooled keep-alive connections to Twilio")
+    twilio_api_connect_retries: int = Field(
+        default=2,
+        description="Retries for failed Twilio connects; requests that were sent are never retried"
+    )
+    twilio_status_cache_ttl_seconds: int = Field(default=5, description="Call status cache TTL for live calls")
+    twilio_status_cache_max_entries: int = Field(default=1024, description="Call status cache size")
+    elevenlabs_api_timeout_seconds: int = Field(default=10, description="ElevenLabs request timeout")
+    google_api_timeout_seconds: int = Field(default=10, description="Google API request timeout")
+    google_api_max_workers: int = Field(default=8, description="Concurrent Google API calls")
+    availability_cache_ttl_seconds: int = Field(default=30, description="Availability cache TTL")
+    availability_cache_max_entries: int = Field(default=64, description="Availability cache size")
+    oauth_token_cache_ttl_seconds: int = Field(default=60, description="OAuth token cache TTL")
+    oauth_token_cache_max_entries: int = Field(default=10000, description="OAuth token cache size")
+    calendar_api_timeout_seconds: int = Field(default=10, description="Calendar API request timeout")
+    calendar_api_pool_connections: int = Field(default=10, description="Calendar API pooled hosts")
+    calendar_api_pool_maxsize: int = Field(default=100, description="Calendar API connections per host")
+    notification_max_workers: int = Field(
+        default=4,
+        description="Concurrent outbound SMS sends; keeps bursts under Twilio's rate limits"
+    )
+    db_pool_size: int = Field(default=20, description="Pooled database connections (server databases)")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed above the pool size")
+
+
+class Settings:
+    """
+    Every pydantic settings group for the process.
+
+    Each group is validated the first time it is read and kept afterwards.
+    """
+
+    @cached_property
+    def google(self) -> GoogleCalendarConfig:
+        return GoogleCalendarConfig()
+
+    @cached_property
+    def appointment(self) -> AppointmentConfig:
+        return AppointmentConfig()
+
+    @cached_property
+    def app(self) -> AppConfig:
+        return AppConfig()
+
+    @cached_property
+    def limits(self) -> LimitsConfig:
+        return LimitsConfig()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings singleton."""
+    _ensure_loaded()
+    return Settings()
+
+
+def get_google_config() -> GoogleCalendarConfig:
+    """Google Calendar settings, validated once per process."""
+    return get_settings().google
+
+
+def get_appointment_config() -> AppointmentConfig:
+    """Appointment settings, validated once per process."""
+    return get_settings().appointment
+
+
+def get_app_config() -> AppConfig:
+    """Application settings, validated once per process."""
+    return get_settings().app
+
+
+def get_limits_config() -> LimitsConfig:
+    """Numeric limits and timeouts, validated once per process."""
+    return get_settings().limits
+
+
+# Global Pydantic config instances (the same objects the getters return).
+# Resolved on first access through the module __getattr__ below, so a
+# process that never reads a group never validates it.
+_LAZY_SETTINGS = {
+    "google_config": get_google_config,
+    "appointment_config": get_appointment_config,
+    "app_config": get_app_config,
+    "limits_config": get_limits_config,
+}
+
+
+def __getattr__(name: str):
+    factory = _LAZY_SETTINGS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
@@ -4,41 +4,112 @@ Google OAuth authentication handling.
 
 import os
 import json
+import secrets
+import sys
+import threading
 from typing import Optional, Tuple
+from urllib.parse import urlencode
 from google.oauth2.credentials import Credentials
+from google.auth.exceptions import GoogleAuthError, RefreshError, TransportError
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from httplib2 import HttpLib2Error
+
+try:
+    from orjson import dumps as _dump_token_json, loads as _load_token_json
+except ImportError:
+    def _dump_token_json(data: dict) -> bytes:
+        """Encode token data (stdlib fallback when orjson is absent)."""
+        return json.dumps(data, separators=TOKEN_JSON_SEPARATORS).encode()
+
+    _load_token_json = json.loads
 
 from src import config
 
 # Named constants (can be overridden via environment variables)
 DEFAULT_TOKEN_FILE = "./token.json"
+TOKEN_FILE_TMP_SUFFIX = ".tmp"
+TOKEN_JSON_SEPARATORS = (",", ":")
+GOOGLE_CALENDAR_API_NAME = "calendar"
+GOOGLE_CALENDAR_API_VERSION = "v3"
+GOOGLE_AUTH_URI = "https://accounts.google.com/o/oauth2/auth"
+GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+AUTH_STATE_BYTES = 16
 
 
 class GoogleAuthManager:
     """Manages Google OAuth authentication."""
 
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "redirect_uri",
+        "scopes",
+        "token_file",
+        "token_version",
+        "_client_config",
+        "_auth_url_prefix",
+        "_credentials_cache",
+        "_email_cache",
+        "_local",
+    )
+
     def __init__(self):
         # Use old environment variable names for compatibility
-        self.client_id = os.getenv("GOOGLE_OAUTH_CLIENT_ID", "")
-        self.client_secret = os.getenv("GOOGLE_OAUTH_CLIENT_SECRET", "")
-        self.redirect_uri = os.getenv("GOOGLE_REDIRECT_URI", "")
+        self.client_id = config.get_optional_var("GOOGLE_OAUTH_CLIENT_ID", "")
+        self.client_secret = config.get_optional_var("GOOGLE_OAUTH_CLIENT_SECRET", "")
+        self.redirect_uri = config.get_optional_var("GOOGLE_REDIRECT_URI", "")
 
         # Validate required fields
         if not self.redirect_uri:
             raise ValueError("GOOGLE_REDIRECT_URI environment variable is required")
 
         # Parse scopes from comma or space-separated string
-        scopes_str = os.getenv("GOOGLE_OAUTH_SCOPES", "")
+        scopes_str = config.get_optional_var("GOOGLE_OAUTH_SCOPES", "")
         if scopes_str:
             # Handle both comma and space-separated formats
-            self.scopes = [s.strip() for s in scopes_str.replace(",", " ").split() if s.strip()]
+            # Immutable and interned; shared by every Flow and Credentials built here
+            self.scopes = tuple(sys.intern(s) for s in scopes_str.replace(",", " ").split())
         else:
             raise ValueError("GOOGLE_OAUTH_SCOPES environment variable is required")
 
+        # OAuth client settings shared by every Flow this manager creates
+        self._client_config = {
+            "web": {
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "auth_uri": GOOGLE_AUTH_URI,
+                "token_uri": GOOGLE_TOKEN_URI,
+                "redirect_uris": [self.redirect_uri]
+            }
+        }
+
+        # Every authorization URL is this prefix plus a fresh state value
+        self._auth_url_prefix = GOOGLE_AUTH_URI + "?" + urlencode({
+            "response_type": "code",
+            "client_id": self.client_id,
+            "redirect_uri": self.redirect_uri,
+            "scope": config.join_oauth_scopes(self.scopes),
+            "access_type": "offline",
+            "include_granted_scopes": "true",
+            "prompt": "consent"
+        })
+
         # Token file uses DEFAULT_TOKEN_FILE constant (can be overridden via env var)
-        self.token_file = os.getenv("GOOGLE_TOKEN_FILE", DEFAULT_TOKEN_FILE)
+        self.token_file = config.get_optional_var("GOOGLE_TOKEN_FILE", DEFAULT_TOKEN_FILE)
+        
+        # Bumped whenever stored tokens change so cached credentials can be dropped
+        self.token_version = 0
+
+        # (token file mtime_ns, credentials) from the last successful load
+        self._credentials_cache: Optional[Tuple[int, Credentials]] = None
+        # (access token, email) from the last userinfo lookup
+        self._email_cache: Optional[Tuple[str, str]] = None
+        # Calendar discovery service per thread (httplib2 is not thread-safe),
+        # rebuilt only when the credentials object changes
+        self._local = threading.local()
     
     def get_auth_url(self) -> str:
         """
@@ -53,25 +124,9 @@ class GoogleAuthManager:
         print(f"[GOOGLE AUTH]   redirect_uri: {self.redirect_uri}")
         print(f"[GOOGLE AUTH]   scopes: {self.scopes}")
 
-        flow = Flow.from_client_config(
-            client_config={
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.redirect_uri]
-                }
-            },
-            scopes=self.scopes
-        )
-        flow.redirect_uri = self.redirect_uri
-
-        auth_url, state = flow.authorization_url(
-            access_type="offline",
-            include_granted_scopes="true",
-            prompt="consent"
-        )
+        # Only the state varies between calls, so no Flow is built here
+        state = secrets.token_urlsafe(AUTH_STATE_BYTES)
+        auth_url = f"{self._auth_url_prefix}&{urlencode({'state': state})}"
 
         print(f"[GOOGLE AUTH] ✅ Auth URL generated")
         print(f"[GOOGLE AUTH]   Auth URL: {auth_url}")
@@ -91,15 +146,7 @@ class GoogleAuthManager:
         """
         try:
             flow = Flow.from_client_config(
-                client_config={
-                    "web": {
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                        "redirect_uris": [self.redirect_uri]
-                    }
-                },
+                client_config=self._client_config,
                 scopes=self.scopes
             )
             flow.redirect_uri = self.redirect_uri
@@ -126,14 +173,25 @@ class GoogleAuthManager:
         Returns:
             Valid Credentials object or None if not authenticated
         """
-        if not os.path.exists(self.token_file):
+        try:
+            mtime = os.stat(self.token_file).st_mtime_ns
+        except OSError:
+            self._credentials_cache = None
             return None
         
         try:
-            credentials = Credentials.from_authorized_user_file(
-                self.token_file, 
-                self.scopes
-            )
+            # Reuse the parsed credentials until the token file changes
+            cached = self._credentials_cache
+            if cached is not None and cached[0] == mtime:
+                credentials = cached[1]
+            else:
+                with open(self.token_file, "rb") as f:
+                    token_info = _load_token_json(f.read())
+                credentials = Credentials.from_authorized_user_info(
+                    token_info,
+                    self.scopes
+                )
+                self._credentials_cache = (mtime, credentials)
             
             # Refresh if expired
             if credentials and credentials.expired and credentials.refresh_token:
@@ -146,7 +204,8 @@ class GoogleAuthManager:
                 
             return None
             
-        except Exception:
+        except (OSError, ValueError, RefreshError, TransportError):
+            # Missing/corrupt token file, or a refresh Google rejected
             return None
     
     def is_authenticated(self) -> bool:
@@ -164,7 +223,16 @@ class GoogleAuthManager:
         if not credentials:
             return None
         
-        return build("calendar", "v3", credentials=credentials)
+        local = self._local
+        if getattr(local, "credentials", None) is not credentials:
+            local.service = build(
+                GOOGLE_CALENDAR_API_NAME,
+                GOOGLE_CALENDAR_API_VERSION,
+                credentials=credentials,
+                cache_discovery=False
+            )
+            local.credentials = credentials
+        return local.service
     
     def get_status(self) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -190,6 +258,9 @@ class GoogleAuthManager:
         try:
             if os.path.exists(self.token_file):
                 os.remove(self.token_file)
+            self._credentials_cache = None
+            self._email_cache = None
+            self.token_version += 1
             return True, "Successfully disconnected from Google Calendar"
         except Exception as e:
             return False, f"Failed to disconnect: {str(e)}"
@@ -205,18 +276,39 @@ class GoogleAuthManager:
             "scopes": credentials.scopes
         }
         
-        with open(self.token_file, "w") as f:
-            json.dump(token_data, f)
+        # Write beside the real file and swap it in, so a concurrent reader
+        # never parses a half-written token file
+        tmp_file = f"{self.token_file}{TOKEN_FILE_TMP_SUFFIX}"
+        with open(tmp_file, "wb") as f:
+            f.write(_dump_token_json(token_data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.token_file)
+        self._credentials_cache = (os.stat(self.token_file).st_mtime_ns, credentials)
+        self.token_version += 1
     
     def _get_user_email(self, credentials: Credentials) -> Optional[str]:
-        """Get user email from credentials."""
+        """
+        Get user email from credentials.
+
+        The email is remembered per access token, so status polls don't hit
+        the userinfo API until the token is refreshed or replaced.
+        """
+        cached = self._email_cache
+        if cached is not None and cached[0] == credentials.token:
+            return cached[1]
+
         try:
             service = build("oauth2", "v2", credentials=credentials)
             user_info = service.userinfo().get().execute()
-            return user_info.get("email")
-        except Exception:
+        except (HttpError, GoogleAuthError, HttpLib2Error, OSError):
             return None
 
+        email = user_info.get("email")
+        if email:
+            self._email_cache = (credentials.token, email)
+        return email
+
 
 # Global auth manager instance
 auth_manager = GoogleAuthManager()
\ No newline at end of file
@@ -8,9 +8,40 @@ Defines schemas for:
 - Calendar operations
 """
 
+import math
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from typing import Any, Optional, List
+from pydantic import BaseModel, EmailStr, Field, computed_field
+
+
+class OrmResponse(BaseModel):
+    """Response model that can be built from our own database rows"""
+
+    @classmethod
+    def from_orm_fast(cls, row: Any, **overrides: Any):
+        """
+        Build from an ORM object or result row without running validators.
+
+        Fields are read from the row's attributes of the same name; pass
+        overrides for renamed or derived fields. Only for trusted rows from
+        the database - external payloads go through normal validation.
+        """
+        values = {name: getattr(row, name) for name in cls.model_fields if name not in overrides}
+        values.update(overrides)
+        return cls.model_construct(**values)
+
+
+class PageResponse(BaseModel):
+    """Pagination fields shared by paginated responses"""
+    total: int
+    page: int
+    per_page: int
+
+    @computed_field
+    @property
+    def pages(self) -> int:
+        """Number of pages, derived so it can't drift from total/per_page"""
+        return math.ceil(self.total / self.per_page) if self.per_page else 0
 
 
 # ============================================================================
@@ -30,7 +61,7 @@ class TokenResponse(BaseModel):
 # DOCTOR MODELS
 # ============================================================================
 
-class DoctorProfile(BaseModel):
+class DoctorProfile(OrmResponse):
     """Doctor profile information"""
     id: str
     email: str
@@ -113,7 +144,7 @@ class PatientUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class PatientResponse(BaseModel):
+class PatientResponse(OrmResponse):
     """Patient information response"""
     id: str
     name: str
@@ -149,7 +180,7 @@ class AppointmentUpdate(BaseModel):
     status: Optional[str] = None
 
 
-class AppointmentResponse(BaseModel):
+class AppointmentResponse(OrmResponse):
     """Appointment information response"""
     id: str
     calendar_event_id: Optional[str] = None
@@ -179,9 +210,9 @@ class CalendarAppointmentRecord(BaseModel):
     status: str
 
 
-class UpcomingAppointmentsResponse(BaseModel):
-    """Response with list of upcoming appointments"""
-    count: int
+class UpcomingAppointmentsResponse(PageResponse):
+    """Response with one page of upcoming appointments"""
+    count: int  # all matches (same as total), as before pagination
     appointments: List[AppointmentResponse]
 
 
@@ -201,7 +232,7 @@ class CallCreate(BaseModel):
     call_type: Optional[str] = "manual"  # manual, reminder, confirmation
 
 
-class CallResponse(BaseModel):
+class CallResponse(OrmResponse):
     """Call information response"""
     id: str
     call_sid: str  # Twilio Call SID
@@ -219,9 +250,9 @@ class CallResponse(BaseModel):
         from_attributes = True
 
 
-class ScheduledCallsResponse(BaseModel):
-    """Response with list of scheduled calls"""
-    count: int
+class ScheduledCallsResponse(PageResponse):
+    """Response with one page of scheduled calls"""
+    count: int  # all matches (same as total), as before pagination
     calls: List[CallResponse]
 
 
@@ -320,10 +351,6 @@ class PaginationParams(BaseModel):
     per_page: int = Field(20, ge=1, le=100)
 
 
-class PaginatedResponse(BaseModel):
+class PaginatedResponse(PageResponse):
     """Generic paginated response"""
-    total: int
-    page: int
-    per_page: int
-    pages: int
     items: List[dict]
@@ -9,22 +9,73 @@ Defines SQLAlchemy models for:
 """
 
 from datetime import datetime
-from sqlalchemy import create_engine, Column, String, DateTime, Boolean, Integer, Text, ForeignKey, LargeBinary
+from typing import Optional
+from sqlalchemy import bindparam, create_engine, delete, event, func, inspect, select, update, Column, String, DateTime, Boolean, Integer, Text, ForeignKey, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from src import config
 
-# Create database engine
-engine = create_engine(
-    config.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in config.DATABASE_URL else {}
+# Create database engine. SQLite keeps SQLAlchemy's default pool; server
+# databases get a sized pool so concurrent requests don't queue on connects.
+if "sqlite" in config.DATABASE_URL:
+    engine = create_engine(
+        config.DATABASE_URL,
+        connect_args={"check_same_thread": False}
+    )
+else:
+    engine = create_engine(
+        config.DATABASE_URL,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_pre_ping=True
+    )
+
+# Applied to every new SQLite connection: WAL lets readers run alongside a
+# writer, and NORMAL sync is safe under WAL (only the last commits can be
+# lost on power failure, never corrupted)
+SQLITE_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # KiB, i.e. 64 MB of page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA temp_store=MEMORY",
 )
 
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_CONNECT_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+class _ModelBase:
+    # Fetch created_at/updated_at back with RETURNING during the flush, so
+    # reading them afterwards doesn't expire them and cost another SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+
 # Base class for all models
-Base = declarative_base()
+Base = declarative_base(cls=_ModelBase)
+
+# created_at/updated_at defaults are SQL (func.now()) rather than Python
+# callables: the timestamp is filled in by the database inside the INSERT or
+# UPDATE itself. The client-side default renders now() inline so tables
+# created before server_default was added still get a value. updated_at is
+# set by onupdate on every ORM UPDATE; handlers don't assign it.
+
+# (engine, table, columns) keys known to have a unique index; see has_unique_key
+_unique_keys_found: set = set()
+
+# Appointment.date + " " + Appointment.time, as stored
+APPOINTMENT_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
 
 
 # ============================================================================
@@ -49,8 +100,8 @@ class User(Base):
 
     # Account status
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     patients = relationship("Patient", back_populates="doctor")
@@ -68,6 +119,12 @@ class User(Base):
 class Patient(Base):
     """Patient record linked to a doctor"""
     __tablename__ = "patients"
+    __table_args__ = (
+        # One record per caller per doctor; also serves find-or-create lookups.
+        # A unique index rather than a constraint so init_db can add it to
+        # existing tables.
+        Index("uq_patients_doctor_phone", "doctor_id", "phone", unique=True),
+    )
 
     id = Column(String(50), primary_key=True, index=True)  # pat_123
     doctor_id = Column(String(50), ForeignKey("users.id"), nullable=False)
@@ -77,8 +134,8 @@ class Patient(Base):
     notes = Column(Text, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     doctor = relationship("User", back_populates="patients")
@@ -105,6 +162,9 @@ class Appointment(Base):
     # Appointment details
     date = Column(String(10), nullable=False)  # YYYY-MM-DD
     time = Column(String(5), nullable=False)  # HH:MM
+    # date and time as one value, kept in sync on every ORM write, so range
+    # filters and ordering use an index instead of string columns
+    scheduled_at = Column(DateTime, nullable=True)
     duration_minutes = Column(Integer, default=config.APPOINTMENT_DURATION_MINUTES)
     type = Column(String(100), default="General Checkup")
     notes = Column(Text, nullable=True)
@@ -115,17 +175,42 @@ class Appointment(Base):
     reminder_sent_at = Column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     doctor = relationship("User", back_populates="appointments")
     patient = relationship("Patient", back_populates="appointments")
 
+    __table_args__ = (
+        # A doctor's appointments in a date range with a given status
+        Index("ix_appointments_doctor_date_status", "doctor_id", "date", "status"),
+        # Upcoming appointments and dashboard counts, in time order
+        Index("ix_appointments_doctor_scheduled_at", "doctor_id", "scheduled_at"),
+        # Dashboard "recently changed" list
+        Index("ix_appointments_doctor_updated_at", "doctor_id", "updated_at"),
+        # A patient's latest / upcoming appointments
+        Index("ix_appointments_patient_scheduled_at", "patient_id", "scheduled_at"),
+    )
+
     class Config:
         from_attributes = True
 
 
+def parse_appointment_datetime(date: str, time: str) -> Optional[datetime]:
+    """Combine stored date and time strings; None if they don't parse."""
+    try:
+        return datetime.strptime(f"{date} {time}", APPOINTMENT_DATETIME_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+@event.listens_for(Appointment, "before_insert")
+@event.listens_for(Appointment, "before_update")
+def _sync_scheduled_at(mapper, connection, target: Appointment) -> None:
+    target.scheduled_at = parse_appointment_datetime(target.date, target.time)
+
+
 # ============================================================================
 # CALL MODEL
 # ============================================================================
@@ -152,12 +237,19 @@ class Call(Base):
     # Timestamps
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     # Relationships
     doctor = relationship("User", back_populates="calls")
     patient = relationship("Patient", back_populates="calls")
 
+    __table_args__ = (
+        # A doctor's calls, newest first (call list, dashboard)
+        Index("ix_calls_doctor_created_at", "doctor_id", "created_at"),
+        # Calls in given statuses (scheduled calls, dashboard counts)
+        Index("ix_calls_doctor_status_created_at", "doctor_id", "status", "created_at"),
+    )
+
     class Config:
         from_attributes = True
 
@@ -176,7 +268,7 @@ class UserSession(Base):
     refresh_token = Column(Text, nullable=False)  # JWT refresh token
     is_active = Column(Boolean, default=True)
     expires_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     class Config:
         from_attributes = True
@@ -186,9 +278,128 @@ class UserSession(Base):
 # DATABASE INITIALIZATION
 # ============================================================================
 
+def _add_scheduled_at(bind) -> None:
+    """
+    Add and backfill appointments.scheduled_at on databases created before it.
+
+    create_all() only creates missing tables, so an existing appointments
+    table needs the column and its values added here.
+    """
+    columns = {column["name"] for column in inspect(bind).get_columns(Appointment.__tablename__)}
+    if "scheduled_at" in columns:
+        return
+
+    table = Appointment.__table__
+    with bind.begin() as connection:
+        connection.exec_driver_sql(
+            f"ALTER TABLE {table.name} ADD COLUMN scheduled_at "
+            f"{table.c.scheduled_at.type.compile(dialect=bind.dialect)}"
+        )
+        rows = connection.execute(select(table.c.id, table.c.date, table.c.time)).all()
+        values = [
+            {"row_id": row.id, "value": parse_appointment_datetime(row.date, row.time)}
+            for row in rows
+        ]
+        if values:
+            connection.execute(
+                update(table).where(table.c.id == bindparam("row_id")).values(
+                    scheduled_at=bindparam("value")
+                ),
+                values
+            )
+
+
+def has_unique_key(connection, table_name: str, columns) -> bool:
+    """
+    Whether a unique index or constraint covers exactly these columns.
+
+    Positive answers are cached per engine: once init_db has added the key it
+    stays, while a missing key is looked up again on the next call.
+    """
+    cache_key = (connection.engine, table_name, tuple(columns))
+    if cache_key in _unique_keys_found:
+        return True
+
+    inspector = inspect(connection)
+    wanted = set(columns)
+    found = any(
+        set(index["column_names"]) == wanted
+        for index in inspector.get_indexes(table_name)
+        if index.get("unique")
+    ) or any(
+        set(constraint["column_names"]) == wanted
+        for constraint in inspector.get_unique_constraints(table_name)
+    )
+    if found:
+        _unique_keys_found.add(cache_key)
+    return found
+
+
+def _dedupe_patients(bind) -> None:
+    """
+    Merge duplicate (doctor_id, phone) patients before the unique index is built.
+
+    The oldest row is kept; appointments and calls pointing at the others
+    are moved onto it, then the others are deleted.
+    """
+    table = Patient.__table__
+    with bind.begin() as connection:
+        if has_unique_key(connection, table.name, ("doctor_id", "phone")):
+            return
+
+        duplicated = (
+            select(table.c.doctor_id, table.c.phone)
+            .group_by(table.c.doctor_id, table.c.phone)
+            .having(func.count() > 1)
+            .subquery()
+        )
+        rows = connection.execute(
+            select(table.c.id, table.c.doctor_id, table.c.phone)
+            .join(
+                duplicated,
+                (table.c.doctor_id == duplicated.c.doctor_id)
+                & (table.c.phone == duplicated.c.phone)
+            )
+            .order_by(table.c.created_at, table.c.id)
+        ).all()
+
+        kept = {}
+        merges = []
+        for row in rows:
+            key = (row.doctor_id, row.phone)
+            if key in kept:
+                merges.append({"old_id": row.id, "new_id": kept[key]})
+            else:
+                kept[key] = row.id
+        if not merges:
+            return
+
+        for referencing in (Appointment.__table__, Call.__table__):
+            connection.execute(
+                update(referencing)
+                .where(referencing.c.patient_id == bindparam("old_id"))
+                .values(patient_id=bindparam("new_id")),
+                merges
+            )
+        connection.execute(
+            delete(table).where(table.c.id == bindparam("old_id")),
+            merges
+        )
+
+
+def _create_missing_indexes(bind) -> None:
+    """Create indexes added to tables that already existed (create_all skips them)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
+
+
 def init_db():
     """Create all tables in the database"""
     Base.metadata.create_all(bind=engine)
+    _add_scheduled_at(engine)
+    _dedupe_patients(engine)
+    _create_missing_indexes(engine)
 
 
 def get_db():
@@ -7,13 +7,27 @@ Abstracts Twilio SDK functionality for:
 - Sending SMS confirmations
 """
 
-from typing import Optional, Dict, Any
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
+from urllib3.util.retry import Retry
 from twilio.twiml.voice_response import VoiceResponse
+from xml.sax.saxutils import escape
 from src import config
-from colorama import Fore, init
+from src.utils.console import Fore
 
-init(autoreset=True)
+
+# Calls in these states never change again, so their status is cached until evicted
+TERMINAL_CALL_STATUSES = frozenset({"completed", "busy", "failed", "no-answer", "canceled"})
+
+
+TWILIO_API_SCHEME = "https://"
+# Every request goes to api.twilio.com, so one host pool is enough
+TWILIO_API_POOL_CONNECTIONS = 1
 
 
 class TwilioCallError(Exception):
@@ -21,6 +35,54 @@ class TwilioCallError(Exception):
     pass
 
 
+def _build_http_client() -> TwilioHttpClient:
+    """Twilio HTTP client whose keep-alive connections are reused across calls."""
+    http_client = TwilioHttpClient(timeout=config.TWILIO_API_TIMEOUT_SECONDS)
+    # Only connect failures are retried: nothing was sent, so a call or SMS
+    # can't be duplicated
+    retries = Retry(
+        total=config.TWILIO_API_CONNECT_RETRIES,
+        connect=config.TWILIO_API_CONNECT_RETRIES,
+        read=0,
+        status=0,
+        other=0
+    )
+    http_client.session.mount(TWILIO_API_SCHEME, HTTPAdapter(
+        pool_connections=TWILIO_API_POOL_CONNECTIONS,
+        pool_maxsize=config.TWILIO_API_POOL_MAXSIZE,
+        max_retries=retries
+    ))
+    return http_client
+
+
+# Shared by every TwilioWrapper so calls and SMS don't each open a new connection
+_http_client = _build_http_client()
+
+
+# Stands in for the spoken text in pre-rendered TwiML; swapped for the
+# XML-escaped text on each call
+TWIML_TEXT_PLACEHOLDER = "__twiml_text__"
+
+
+@lru_cache(maxsize=32)
+def _gather_template(num_digits: int, finish_on_key: str) -> str:
+    """TwiML for a <Gather> prompt, rendered once per option set."""
+    response = VoiceResponse()
+    response.gather(
+        num_digits=num_digits,
+        finish_on_key=finish_on_key
+    ).say(TWIML_TEXT_PLACEHOLDER)
+    return response.to_xml()
+
+
+@lru_cache(maxsize=32)
+def _say_template(language: Optional[str], voice: Optional[str]) -> str:
+    """TwiML for a single <Say>, rendered once per language/voice."""
+    response = VoiceResponse()
+    response.say(TWIML_TEXT_PLACEHOLDER, voice=voice, language=language)
+    return response.to_xml()
+
+
 class TwilioWrapper:
     """
     Wrapper class for Twilio operations.
@@ -37,15 +99,22 @@ class TwilioWrapper:
         try:
             self.client = Client(
                 config.TWILIO_ACCOUNT_SID,
-                config.TWILIO_AUTH_TOKEN
+                config.TWILIO_AUTH_TOKEN,
+                http_client=_http_client
             )
             self.phone_number = config.TWILIO_PHONE_NUMBER
+            self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+            self._status_lock = threading.Lock()
             print(f"{Fore.GREEN}✅ Twilio client initialized")
         except Exception as e:
             error_msg = f"Failed to initialize Twilio client: {str(e)}"
             print(f"{Fore.RED}❌ {error_msg}")
             raise TwilioCallError(error_msg)
 
+    def close(self) -> None:
+        """Close pooled connections to Twilio (call on shutdown)."""
+        _http_client.session.close()
+
     # ========================================================================
     # INBOUND CALL HANDLING
     # ========================================================================
@@ -155,12 +224,16 @@ class TwilioWrapper:
     # CALL MONITORING
     # ========================================================================
 
-    def get_call_status(self, call_sid: str) -> Dict[str, Any]:
+    def get_call_status(self, call_sid: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get current status of a call.
 
+        Live calls are cached for a few seconds so repeated polls share one
+        Twilio request; finished calls stay cached since they can't change.
+
         Args:
             call_sid: Twilio Call SID
+            force_refresh: Skip the cache (e.g. when handling a status webhook)
 
         Returns:
             dict: Call status information
@@ -168,10 +241,15 @@ class TwilioWrapper:
         Raises:
             TwilioCallError: If call lookup fails
         """
+        if not force_refresh:
+            cached = self._get_cached_status(call_sid)
+            if cached is not None:
+                return cached
+
         try:
             call = self.client.calls(call_sid).fetch()
 
-            return {
+            status = {
                 "call_sid": call.sid,
                 "status": call.status,
                 "duration": call.duration,
@@ -188,6 +266,36 @@ class TwilioWrapper:
             print(f"{Fore.RED}❌ {error_msg}")
             raise TwilioCallError(error_msg)
 
+        self._store_status(call_sid, status)
+        return dict(status)
+
+    def _get_cached_status(self, call_sid: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a still-fresh cached call status, if any."""
+        with self._status_lock:
+            entry = self._status_cache.get(call_sid)
+            if entry is None:
+                return None
+            expires_at, status = entry
+            if expires_at <= time.monotonic():
+                del self._status_cache[call_sid]
+                return None
+            return dict(status)
+
+    def _store_status(self, call_sid: str, status: Dict[str, Any]) -> None:
+        """Cache a call status; terminal statuses never expire."""
+        now = time.monotonic()
+        if status["status"] in TERMINAL_CALL_STATUSES:
+            expires_at = float("inf")
+        else:
+            expires_at = now + config.TWILIO_STATUS_CACHE_TTL_SECONDS
+        with self._status_lock:
+            if len(self._status_cache) >= config.TWILIO_STATUS_CACHE_MAX_ENTRIES:
+                for stale_sid in [k for k, (exp, _) in self._status_cache.items() if exp <= now]:
+                    del self._status_cache[stale_sid]
+            if len(self._status_cache) >= config.TWILIO_STATUS_CACHE_MAX_ENTRIES:
+                del self._status_cache[next(iter(self._status_cache))]
+            self._status_cache[call_sid] = (expires_at, status)
+
     def list_calls(self, limit: int = 10, **kwargs) -> list:
         """
         List recent calls.
@@ -296,6 +404,8 @@ class TwilioWrapper:
         """
         try:
             call = self.client.calls(call_sid).update(status="completed")
+            with self._status_lock:
+                self._status_cache.pop(call_sid, None)
 
             if config.DEBUG:
                 print(f"{Fore.CYAN}[DEBUG] Call terminated: {call_sid}")
@@ -320,37 +430,42 @@ class TwilioWrapper:
         prompt: str,
         num_digits: int = 1,
         finish_on_key: str = "#"
-    ) -> VoiceResponse:
+    ) -> str:
         """
         Create TwiML for gathering DTMF input (IVR).
 
+        The surrounding markup is rendered once per (num_digits,
+        finish_on_key); only the escaped prompt is filled in per call.
+
         Args:
             prompt: Voice prompt to play
             num_digits: Number of digits to collect
             finish_on_key: Key that ends input collection
 
         Returns:
-            VoiceResponse: TwiML for gathering input
+            str: TwiML XML for gathering input
         """
-        response = VoiceResponse()
-        response.gather(
-            num_digits=num_digits,
-            finish_on_key=finish_on_key
-        ).say(prompt)
-        return response
+        return _gather_template(num_digits, finish_on_key).replace(
+            TWIML_TEXT_PLACEHOLDER, escape(prompt)
+        )
 
     @staticmethod
-    def create_say_response(message: str, language: str = "en") -> VoiceResponse:
+    def create_say_response(
+        message: str,
+        language: Optional[str] = "en",
+        voice: Optional[str] = None
+    ) -> str:
         """
         Create TwiML to say a message.
 
         Args:
-            message: Message to speak
-            language: Language code (default: "en")
+            message: Message to speak (XML-escaped here)
+            language: Language code (default: "en"; None omits it)
+            voice: Twilio voice name (default: Twilio's own)
 
         Returns:
-            VoiceResponse: TwiML for speaking message
+            str: TwiML XML for speaking message
         """
-        response = VoiceResponse()
-        response.say(message, language=language)
-        return response
+        return _say_template(language, voice).replace(
+            TWIML_TEXT_PLACEHOLDER, escape(message)
+        )
@@ -3,24 +3,96 @@ Calendar business logic service.
 Handles appointment scheduling, availability, and related operations.
 """
 
-from datetime import datetime, timedelta, time
-from typing import List, Optional, Tuple
-import pytz
+from calendar import month_abbr, month_name
+from datetime import date as date_type, datetime, timedelta
+from functools import lru_cache
+import re
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import time as time_module
 
-from src.config import appointment_config
-from src.services.google_calendar import google_calendar_client
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    def _parse_iso_datetime(value: str) -> datetime:
+        """Parse an RFC 3339 timestamp (stdlib fallback when ciso8601 is absent)."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+from src.config import (
+    appointment_config,
+    AVAILABILITY_CACHE_TTL_SECONDS,
+    AVAILABILITY_CACHE_MAX_ENTRIES,
+)
+from src.services.google_calendar import (
+    google_calendar_client,
+    EVENT_LIST_FIELDS,
+    EVENT_PATCH_SOURCE_FIELDS,
+)
+from src.services.reminder_scheduler import reminder_scheduler
+from src.utils.timezones import get_timezone
 from src.api.schemas.calendar import (
     TimeSlot, Patient, Appointment, AppointmentStatus, AppointmentType
 )
 
+SLOT_DATE_DISPLAY_FORMAT = "%A, %B %d"
+FULL_DATE_DISPLAY_FORMAT = "%A, %B %d, %Y"
+
+ISO_DATE_FORMAT = "%Y-%m-%d"
+US_SLASH_DATE_FORMAT = "%m/%d/%Y"
+US_DASH_DATE_FORMAT = "%m-%d-%Y"
+MONTH_DAY_FORMAT = "%B %d"
+ABBREVIATED_MONTH_DAY_FORMAT = "%b %d"
+MONTH_DAY_YEAR_FORMAT = "%B %d, %Y"
+DATE_INPUT_FORMATS = (
+    ISO_DATE_FORMAT,
+    US_SLASH_DATE_FORMAT,
+    US_DASH_DATE_FORMAT,
+    MONTH_DAY_FORMAT,
+    ABBREVIATED_MONTH_DAY_FORMAT,
+    MONTH_DAY_YEAR_FORMAT,
+)
+# Weekday display names, indexed by date.weekday()
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Natural-language dates: days from today, and weekday numbers for "next <day>"
+RELATIVE_DAYS = {"today": 0, "tomorrow": 1}
+NEXT_WEEKDAY_PREFIX = "next "
+WEEKDAYS = {name.lower(): index for index, name in enumerate(WEEKDAY_NAMES)}
+MONTH_NAMES = frozenset(name.lower() for name in month_name[1:])
+MONTH_ABBREVIATIONS = frozenset(name.lower() for name in month_abbr[1:])
+
+APPOINTMENT_SUMMARY_PREFIX = "Appointment:"
+REMINDER_SENT_MARKER = "Reminder Sent: true"
+# Present in the private extended properties of events created by this service
+APPOINTMENT_PROPERTY_KEY = "status"
+
+# (property key, description label) in description line order
+DESCRIPTION_FIELDS = (
+    ("patient", "Patient"),
+    ("phone", "Phone"),
+    ("email", "Email"),
+    ("type", "Type"),
+    ("status", "Status"),
+    ("reminder_sent", "Reminder Sent"),
+    ("notes", "Notes"),
+)
+
+# One "Key: value" metadata line of an event description; the key ends at
+# the first ": " on the line, as with str.split(": ", 1)
+DESCRIPTION_LINE_RE = re.compile(r"^(.*?): (.*)$", re.MULTILINE)
+
 
 class CalendarService:
     """Business logic for calendar operations."""
     
     def __init__(self):
-        self.tz = pytz.timezone(appointment_config.timezone)
+        self.tz = get_timezone(appointment_config.timezone)
         self.duration = appointment_config.duration_minutes
         self.buffer = appointment_config.buffer_minutes
+        
+        # (date_str, duration) -> (expires_at, check_availability result)
+        self._availability_cache: Dict[Tuple[str, int], Tuple[float, tuple]] = {}
+        self._availability_lock = Lock()
     
     # ============== Date Parsing ==============
     
@@ -29,41 +101,12 @@ class CalendarService:
         Parse date from various formats including natural language.
         
         Supports: 'today', 'tomorrow', 'next tuesday', 'YYYY-MM-DD', 'MM/DD/YYYY'
+        
+        Results are cached per (input, today): relative dates change when
+        the day does, so a new day starts a new set of keys.
         """
-        date_string = date_string.lower().strip()
         today = datetime.now(self.tz).date()
-        
-        # Natural language
-        if date_string == "today":
-            return self.tz.localize(datetime(today.year, today.month, today.day))
-        
-        if date_string == "tomorrow":
-            tomorrow = today + timedelta(days=1)
-            return self.tz.localize(datetime(tomorrow.year, tomorrow.month, tomorrow.day))
-        
-        if date_string.startswith("next "):
-            day_name = date_string.replace("next ", "")
-            days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-            if day_name in days:
-                target_day = days.index(day_name)
-                current_day = today.weekday()
-                days_ahead = target_day - current_day
-                if days_ahead <= 0:
-                    days_ahead += 7
-                target_date = today + timedelta(days=days_ahead)
-                return self.tz.localize(datetime(target_date.year, target_date.month, target_date.day))
-        
-        # Standard formats
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y", "%B %d", "%b %d", "%B %d, %Y"]:
-            try:
-                parsed = datetime.strptime(date_string, fmt)
-                if parsed.year == 1900:
-                    parsed = parsed.replace(year=today.year)
-                return self.tz.localize(datetime(parsed.year, parsed.month, parsed.day))
-            except ValueError:
-                continue
-        
-        raise ValueError(f"Could not parse date: {date_string}")
+        return _parse_date(date_string.lower().strip(), today.toordinal(), self.tz.key)
     
     # ============== Availability ==============
     
@@ -78,45 +121,67 @@ class CalendarService:
         Returns:
             Tuple of (date_str, formatted_date, slots, message)
         """
-        duration = duration_minutes or self.duration
+        return self._check_availability(date, duration_minutes or self.duration)
+    
+    def _check_availability(
+        self,
+        date: str,
+        duration: int,
+        busy_by_day: Optional[Dict[date_type, List[dict]]] = None
+    ) -> Tuple[str, str, List[TimeSlot], str]:
+        """
+        check_availability, optionally with free/busy already fetched.
         
+        Days present in busy_by_day use those periods; any other day
+        queries free/busy itself.
+        """
+
         # Parse date
         try:
             parsed_date = self.parse_date(date)
         except ValueError as e:
             return date, "", [], str(e)
         
-        date_str = parsed_date.strftime("%Y-%m-%d")
-        formatted_date = parsed_date.strftime("%A, %B %d, %Y")
+        date_str = parsed_date.date().isoformat()
+        formatted_date = _format_date(parsed_date.date(), FULL_DATE_DISPLAY_FORMAT)
         
         # Check if in past
         if parsed_date.date() < datetime.now(self.tz).date():
             return date_str, formatted_date, [], "Cannot check availability for past dates."
         
         # Check if day is available
-        if parsed_date.weekday() not in appointment_config.available_days:
-            day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            available_day_names = [day_names[i] for i in appointment_config.available_days]
+        if not appointment_config.is_available_day(parsed_date.weekday()):
+            available_day_names = [WEEKDAY_NAMES[i] for i in appointment_config.available_days]
             return (
                 date_str, 
                 formatted_date, 
                 [], 
-                f"Office is closed on {day_names[parsed_date.weekday()]}. Available: {', '.join(available_day_names)}"
+                f"Office is closed on {WEEKDAY_NAMES[parsed_date.weekday()]}. Available: {', '.join(available_day_names)}"
             )
         
+        cache_key = (date_str, duration)
+        cached = self._get_cached_availability(cache_key)
+        if cached is not None:
+            return cached
+        
         # Generate all possible slots
         all_slots = self._generate_time_slots(parsed_date, duration)
+        now = datetime.now(self.tz)
         
-        # Get busy periods
-        day_start = self.tz.localize(datetime(parsed_date.year, parsed_date.month, parsed_date.day, 0, 0, 0))
-        day_end = day_start + timedelta(days=1)
-        busy_periods = google_calendar_client.get_busy_periods(day_start, day_end)
-        
-        # Filter available slots
-        available_slots = self._filter_available_slots(all_slots, busy_periods)
-        
-        # Filter past slots (for today)
-        available_slots = self._filter_past_slots(available_slots)
+        if not all_slots or all_slots[-1].start <= now:
+            # Nothing left to book today (slots are in start order), so
+            # skip the free/busy round trip
+            available_slots = []
+        else:
+            # Get busy periods
+            busy_periods = busy_by_day.get(parsed_date.date()) if busy_by_day else None
+            if busy_periods is None:
+                day_start = datetime(parsed_date.year, parsed_date.month, parsed_date.day, tzinfo=self.tz)
+                day_end = day_start + timedelta(days=1)
+                busy_periods = google_calendar_client.get_busy_periods(day_start, day_end)
+            
+            # Filter busy and past slots in one pass
+            available_slots = self._filter_available_slots(all_slots, busy_periods, now=now)
         
         # Build message
         if not available_slots:
@@ -127,7 +192,9 @@ class CalendarService:
             if len(available_slots) > 5:
                 message += f" and {len(available_slots) - 5} more."
         
-        return date_str, formatted_date, available_slots, message
+        result = (date_str, formatted_date, available_slots, message)
+        self._store_availability(cache_key, result)
+        return result
     
     def check_availability_range(
         self,
@@ -137,100 +204,199 @@ class CalendarService:
         """
         Check availability across multiple dates.
         
+        Free/busy for every date that needs it is fetched in one query
+        spanning the earliest to the latest such date, then split by day,
+        instead of one round trip per date.
+        
         Returns:
             List of (date_str, formatted_date, slots, message) for each date
         """
-        results = []
+        duration = duration_minutes or self.duration
+        today = datetime.now(self.tz).date()
+        
+        days = set()
         for date in dates:
-            result = self.check_availability(date, duration_minutes)
-            results.append(result)
-        return results
+            try:
+                day = self.parse_date(date).date()
+            except ValueError:
+                continue
+            if (
+                day >= today
+                and appointment_config.is_available_day(day.weekday())
+                and self._get_cached_availability((day.isoformat(), duration)) is None
+            ):
+                days.add(day)
+        
+        busy_by_day = None
+        if len(days) > 1:
+            first, last = min(days), max(days)
+            range_start = datetime(first.year, first.month, first.day, tzinfo=self.tz)
+            range_end = datetime(last.year, last.month, last.day, tzinfo=self.tz) + timedelta(days=1)
+            busy_by_day = self._busy_by_day(
+                google_calendar_client.get_busy_periods(range_start, range_end), days
+            )
+        
+        return [self._check_availability(date, duration, busy_by_day) for date in dates]
+    
+    def _busy_by_day(self, busy_periods: List[dict], days: set) -> Dict[date_type, List[dict]]:
+        """Split busy periods by each local day they touch, with an entry for every day."""
+        by_day: Dict[date_type, List[dict]] = {day: [] for day in days}
+        for busy in busy_periods:
+            day = _parse_iso_datetime(busy["start"]).astimezone(self.tz).date()
+            last_day = _parse_iso_datetime(busy["end"]).astimezone(self.tz).date()
+            while day <= last_day:
+                if day in by_day:
+                    by_day[day].append(busy)
+                day += timedelta(days=1)
+        return by_day
     
     def is_slot_available(self, appointment_datetime: datetime) -> bool:
-        """Check if a specific datetime slot is available."""
-        if appointment_datetime.tzinfo is None:
-            appointment_datetime = self.tz.localize(appointment_datetime)
+        """
+        Check if a specific datetime slot is available.
         
-        date_str = appointment_datetime.strftime("%Y-%m-%d")
-        _, _, slots, _ = self.check_availability(date_str)
+        The slot is validated against the schedule locally (date, open day,
+        slot grid, not in the past) and free/busy is queried for that slot
+        only, instead of building and filtering the whole day.
+        """
+        if appointment_datetime.tzinfo is None:
+            appointment_datetime = appointment_datetime.replace(tzinfo=self.tz)
         
-        # Compare by hour and minute only (avoid timezone comparison issues)
-        target_time = (appointment_datetime.hour, appointment_datetime.minute)
+        # Compare by date, hour and minute only (avoid timezone comparison issues)
         target_date = appointment_datetime.date()
+        now = datetime.now(self.tz)
+        if target_date < now.date():
+            return False
+        if not appointment_config.is_available_day(target_date.weekday()):
+            return False
+        
+        start_hour = appointment_config.available_start_hour
+        start_minute = appointment_config.available_start_minute
+        target_offset = timedelta(
+            hours=appointment_datetime.hour - start_hour,
+            minutes=appointment_datetime.minute - start_minute
+        )
+        offsets = _slot_offsets(
+            self.duration,
+            self.buffer,
+            start_hour,
+            start_minute,
+            appointment_config.available_end_hour,
+            appointment_config.available_end_minute
+        )
+        slot = next((offset for offset in offsets if offset[0] == target_offset), None)
+        if slot is None:
+            return False
         
-        for slot in slots:
-            slot_time = (slot.start.hour, slot.start.minute)
-            slot_date = slot.start.date()
-            if slot_time == target_time and slot_date == target_date:
-                return True
-        return False
+        day_open = datetime(
+            target_date.year, target_date.month, target_date.day, start_hour, start_minute,
+            tzinfo=self.tz
+        )
+        slot_start = day_open + slot[0]
+        slot_end = day_open + slot[1]
+        if slot_start <= now:
+            return False
+        
+        busy_periods = google_calendar_client.get_busy_periods(slot_start, slot_end)
+        start_ts = slot_start.timestamp()
+        end_ts = slot_end.timestamp()
+        return not any(
+            busy_start < end_ts and busy_end > start_ts
+            for busy_start, busy_end in _busy_epochs(busy_periods)
+        )
+    
+    def _get_cached_availability(self, key: Tuple[str, int]) -> Optional[tuple]:
+        """Return a still-fresh availability result, if any."""
+        with self._availability_lock:
+            entry = self._availability_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time_module.monotonic():
+                del self._availability_cache[key]
+                return None
+            return result
+    
+    def _store_availability(self, key: Tuple[str, int], result: tuple) -> None:
+        """Cache an availability result for a short TTL."""
+        now = time_module.monotonic()
+        with self._availability_lock:
+            if len(self._availability_cache) >= AVAILABILITY_CACHE_MAX_ENTRIES:
+                for stale_key in [k for k, (exp, _) in self._availability_cache.items() if exp <= now]:
+                    del self._availability_cache[stale_key]
+            if len(self._availability_cache) >= AVAILABILITY_CACHE_MAX_ENTRIES:
+                del self._availability_cache[next(iter(self._availability_cache))]
+            self._availability_cache[key] = (now + AVAILABILITY_CACHE_TTL_SECONDS, result)
+    
+    def _invalidate_availability(self, *dates: str) -> None:
+        """Drop cached availability for the given dates (all dates if none given)."""
+        with self._availability_lock:
+            if not dates:
+                self._availability_cache.clear()
+                return
+            for key in [k for k in self._availability_cache if k[0] in dates]:
+                del self._availability_cache[key]
+    
+    def _event_date(self, event: dict) -> Optional[str]:
+        """Local YYYY-MM-DD date of an event's start, if it has one."""
+        start = event.get("start", {})
+        value = start.get("dateTime") or start.get("date")
+        return value[:10] if value else None
     
     def _generate_time_slots(self, date: datetime, duration: int) -> List[TimeSlot]:
-        """Generate all possible time slots for a date."""
-        slots = []
+        """
+        Generate all possible time slots for a date.
         
-        # Create naive datetime first, then localize properly
-        start_time = self.tz.localize(datetime(
-            date.year, date.month, date.day,
+        The slots for a (day, configuration) pair never change, so they are
+        built once and a fresh list of the shared, immutable slots is returned.
+        """
+        return list(_day_slots(
+            date.date(),
+            duration,
+            self.buffer,
             appointment_config.available_start_hour,
             appointment_config.available_start_minute,
-            0
-        ))
-        end_time = self.tz.localize(datetime(
-            date.year, date.month, date.day,
             appointment_config.available_end_hour,
             appointment_config.available_end_minute,
-            0
+            self.tz.key
         ))
-        
-        current = start_time
-        slot_duration = timedelta(minutes=duration)
-        buffer = timedelta(minutes=self.buffer)
-        
-        while current + slot_duration <= end_time:
-            slots.append(TimeSlot(
-                start=current,
-                end=current + slot_duration,
-                formatted_time=current.strftime("%-I:%M %p"),
-                formatted_date=current.strftime("%A, %B %d")
-            ))
-            current += slot_duration + buffer
-        
-        return slots
     
     def _filter_available_slots(
         self, 
         slots: List[TimeSlot], 
-        busy_periods: List[dict]
+        busy_periods: List[dict],
+        now: Optional[datetime] = None
     ) -> List[TimeSlot]:
-        """Remove slots that overlap with busy periods."""
+        """
+        Remove slots that overlap with busy periods or start at or before `now`.
+        
+        Busy periods are parsed once into sorted epoch pairs and walked
+        alongside the (start-ordered) slots, so the scan is O(slots + busy).
+        """
+        now_epoch = now.timestamp() if now is not None else float("-inf")
+        
+        busy_epochs = _busy_epochs(busy_periods)
+        
         available = []
+        busy_index = 0
+        busy_count = len(busy_epochs)
         
         for slot in slots:
-            is_available = True
+            slot_start = slot.start.timestamp()
+            if slot_start <= now_epoch:
+                continue
+            slot_end = slot.end.timestamp()
             
-            for busy in busy_periods:
-                busy_start = datetime.fromisoformat(busy["start"].replace("Z", "+00:00"))
-                busy_end = datetime.fromisoformat(busy["end"].replace("Z", "+00:00"))
-                
-                busy_start = busy_start.astimezone(self.tz)
-                busy_end = busy_end.astimezone(self.tz)
-                
-                # Check overlap
-                if not (slot.end <= busy_start or slot.start >= busy_end):
-                    is_available = False
-                    break
+            # Skip busy periods that end before this slot starts
+            while busy_index < busy_count and busy_epochs[busy_index][1] <= slot_start:
+                busy_index += 1
             
-            if is_available:
-                available.append(slot)
+            if busy_index < busy_count and busy_epochs[busy_index][0] < slot_end:
+                continue
+            
+            available.append(slot)
         
         return available
     
-    def _filter_past_slots(self, slots: List[TimeSlot]) -> List[TimeSlot]:
-        """Remove slots in the past."""
-        now = datetime.now(self.tz)
-        return [slot for slot in slots if slot.start > now]
-    
     # ============== Appointments ==============
     
     def create_appointment(
@@ -250,13 +416,13 @@ class CalendarService:
         """
         # Ensure timezone
         if appointment_datetime.tzinfo is None:
-            appointment_datetime = self.tz.localize(appointment_datetime)
+            appointment_datetime = appointment_datetime.replace(tzinfo=self.tz)
         
         # Check availability
         if not self.is_slot_available(appointment_datetime):
             return (
                 False,
-                f"The slot at {appointment_datetime.strftime('%-I:%M %p')} is not available.",
+                f"The slot at {_format_time(appointment_datetime.hour, appointment_datetime.minute)} is not available.",
                 None,
                 None
             )
@@ -264,7 +430,8 @@ class CalendarService:
         # Create event
         end_time = appointment_datetime + timedelta(minutes=self.duration)
         
-        description = self._build_event_description(
+        # Each field is formatted once; the description is rendered from the properties
+        properties = self._build_event_properties(
             patient_name=patient_name,
             patient_phone=patient_phone,
             patient_email=patient_email,
@@ -279,10 +446,13 @@ class CalendarService:
                 summary=f"Appointment: {patient_name}",
                 start=appointment_datetime,
                 end=end_time,
-                description=description
+                description=self._build_event_description(properties),
+                private_properties=properties
             )
             
+            self._invalidate_availability(appointment_datetime.date().isoformat())
             appointment = self._event_to_appointment(event)
+            reminder_scheduler.schedule(appointment)
             
             return (
                 True,
@@ -312,18 +482,23 @@ class CalendarService:
             Tuple of (success, message, appointment)
         """
         if new_datetime.tzinfo is None:
-            new_datetime = self.tz.localize(new_datetime)
+            new_datetime = new_datetime.replace(tzinfo=self.tz)
+        
+        # Current event state for the patch below; read while the free/busy
+        # check for the new slot is in flight
+        event_future = google_calendar_client.submit(
+            google_calendar_client.get_event, appointment_id, fields=EVENT_PATCH_SOURCE_FIELDS
+        )
         
         # Check new slot availability
         if not self.is_slot_available(new_datetime):
             return (
                 False,
-                f"The new slot at {new_datetime.strftime('%-I:%M %p')} is not available.",
+                f"The new slot at {_format_time(new_datetime.hour, new_datetime.minute)} is not available.",
                 None
             )
         
-        # Get existing event
-        event = google_calendar_client.get_event(appointment_id)
+        event = event_future.result()
         if not event:
             return False, "Appointment not found.", None
         
@@ -331,67 +506,68 @@ class CalendarService:
         new_end = new_datetime + timedelta(minutes=self.duration)
         
         # Reset reminder status
-        description = event.get("description", "")
-        description = description.replace("Reminder Sent: true", "Reminder Sent: false")
-        
-        updated_event = google_calendar_client.update_event(
-            appointment_id,
-            {
-                "start": new_datetime,
-                "end": new_end,
-                "description": description
-            }
-        )
+        updates = self._metadata_updates(event, "Reminder Sent", "reminder_sent", "false")
+        updates["start"] = new_datetime
+        updates["end"] = new_end
+        
+        updated_event = google_calendar_client.update_event(appointment_id, updates)
         
         if not updated_event:
             return False, "Failed to reschedule appointment.", None
         
+        self._invalidate_availability(
+            *filter(None, [self._event_date(event), new_datetime.date().isoformat()])
+        )
         appointment = self._event_to_appointment(updated_event)
+        reminder_scheduler.schedule(appointment)
         return (
             True,
             f"Appointment rescheduled to {appointment.formatted_date} at {appointment.formatted_time}.",
             appointment
         )
     
-    def cancel_appointment(self, appointment_id: str) -> Tuple[bool, str]:
+    def cancel_appointment(
+        self,
+        appointment_id: str,
+        event: Optional[dict] = None
+    ) -> Tuple[bool, str]:
         """
         Cancel an appointment.
         
+        Args:
+            appointment_id: Google Calendar event ID
+            event: The event as just read (at least EVENT_PATCH_SOURCE_FIELDS),
+                if the caller already has it; otherwise it is read here
+        
         Returns:
             Tuple of (success, message)
         """
-        event = google_calendar_client.get_event(appointment_id)
+        if event is None:
+            event = google_calendar_client.get_event(appointment_id, fields=EVENT_PATCH_SOURCE_FIELDS)
         if not event:
             return False, "Appointment not found."
         
         # Update status instead of deleting
-        description = event.get("description", "")
-        description = self._update_description_field(description, "Status", "cancelled")
+        updates = self._metadata_updates(event, "Status", "status", AppointmentStatus.CANCELLED.value)
+        updates["summary"] = event.get("summary", "").replace(APPOINTMENT_SUMMARY_PREFIX, "CANCELLED:")
         
-        summary = event.get("summary", "").replace("Appointment:", "CANCELLED:")
-        
-        updated = google_calendar_client.update_event(
-            appointment_id,
-            {"description": description, "summary": summary}
-        )
+        updated = google_calendar_client.update_event(appointment_id, updates)
         
         if updated:
+            self._invalidate_availability(*filter(None, [self._event_date(event)]))
+            reminder_scheduler.cancel(appointment_id)
             return True, "Appointment cancelled successfully."
         return False, "Failed to cancel appointment."
     
     def mark_reminder_sent(self, appointment_id: str) -> Tuple[bool, str]:
         """Mark that reminder was sent."""
-        event = google_calendar_client.get_event(appointment_id)
+        event = google_calendar_client.get_event(appointment_id, fields=EVENT_PATCH_SOURCE_FIELDS)
         if not event:
             return False, "Appointment not found."
         
-        description = event.get("description", "")
-        description = self._update_description_field(description, "Reminder Sent", "true")
+        updates = self._metadata_updates(event, "Reminder Sent", "reminder_sent", "true")
         
-        updated = google_calendar_client.update_event(
-            appointment_id,
-            {"description": description}
-        )
+        updated = google_calendar_client.update_event(appointment_id, updates)
         
         if updated:
             return True, "Reminder marked as sent."
@@ -399,41 +575,51 @@ class CalendarService:
     
     def mark_no_show(self, appointment_id: str) -> Tuple[bool, str]:
         """Mark appointment as no-show."""
-        event = google_calendar_client.get_event(appointment_id)
+        event = google_calendar_client.get_event(appointment_id, fields=EVENT_PATCH_SOURCE_FIELDS)
         if not event:
             return False, "Appointment not found."
         
-        description = event.get("description", "")
-        description = self._update_description_field(description, "Status", "no_show")
+        updates = self._metadata_updates(event, "Status", "status", AppointmentStatus.NO_SHOW.value)
+        updates["summary"] = event.get("summary", "").replace(APPOINTMENT_SUMMARY_PREFIX, "NO SHOW:")
         
-        summary = event.get("summary", "").replace("Appointment:", "NO SHOW:")
-        
-        updated = google_calendar_client.update_event(
-            appointment_id,
-            {"description": description, "summary": summary}
-        )
+        updated = google_calendar_client.update_event(appointment_id, updates)
         
         if updated:
+            self._invalidate_availability(*filter(None, [self._event_date(event)]))
+            reminder_scheduler.cancel(appointment_id)
             return True, "Appointment marked as no-show."
         return False, "Failed to update appointment."
     
     def get_upcoming_appointments(
         self, 
-        hours_ahead: Optional[int] = None
+        hours_ahead: Optional[int] = None,
+        pending_reminder_only: bool = False
     ) -> List[Appointment]:
-        """Get upcoming appointments, optionally within N hours."""
+        """
+        Get upcoming appointments, optionally within N hours.
+        
+        Filters run on the raw event first so that events which would be
+        discarded are never parsed into Appointment objects.
+        
+        Args:
+            hours_ahead: Only include appointments starting within this window
+            pending_reminder_only: Skip appointments whose reminder was already sent
+        """
         now = datetime.now(self.tz)
         
         if hours_ahead:
             time_max = now + timedelta(hours=hours_ahead)
-            events = google_calendar_client.get_events_in_range(now, time_max)
+            events = google_calendar_client.get_events_in_range(now, time_max, fields=EVENT_LIST_FIELDS)
         else:
-            events = google_calendar_client.list_events(time_min=now)
+            events = google_calendar_client.list_events(time_min=now, fields=EVENT_LIST_FIELDS)
         
         appointments = []
         for event in events:
-            if event.get("summary", "").startswith("Appointment:"):
-                appointments.append(self._event_to_appointment(event))
+            if not event.get("summary", "").startswith(APPOINTMENT_SUMMARY_PREFIX):
+                continue
+            if pending_reminder_only and REMINDER_SENT_MARKER in event.get("description", ""):
+                continue
+            appointments.append(self._event_to_appointment(event))
         
         return appointments
     
@@ -444,9 +630,9 @@ class CalendarService:
     ) -> List[dict]:
         """Get raw calendar events for doctor dashboard."""
         if time_min and time_min.tzinfo is None:
-            time_min = self.tz.localize(time_min)
+            time_min = time_min.replace(tzinfo=self.tz)
         if time_max and time_max.tzinfo is None:
-            time_max = self.tz.localize(time_max)
+            time_max = time_max.replace(tzinfo=self.tz)
         
         return google_calendar_client.list_events(
             time_min=time_min,
@@ -455,7 +641,13 @@ class CalendarService:
     
     # ============== Helpers ==============
     
-    def _build_event_description(
+    def _build_event_description(self, properties: Dict[str, str]) -> str:
+        """Build event description with metadata from already formatted properties."""
+        return "\n".join(
+            f"{label}: {properties[key]}" for key, label in DESCRIPTION_FIELDS
+        )
+    
+    def _build_event_properties(
         self,
         patient_name: str,
         patient_phone: str,
@@ -464,15 +656,49 @@ class CalendarService:
         status: AppointmentStatus,
         reminder_sent: bool,
         notes: Optional[str]
-    ) -> str:
-        """Build event description with metadata."""
-        return f"""Patient: {patient_name}
-Phone: {patient_phone}
-Email: {patient_email or 'N/A'}
-Type: {appointment_type.value}
-Status: {status.value}
-Reminder Sent: {str(reminder_sent).lower()}
-Notes: {notes or 'None'}"""
+    ) -> Dict[str, str]:
+        """
+        Build the event's private extended properties.
+        
+        Keys and values are exactly what _parse_description returns for
+        the description rendered from them.
+        """
+        return {
+            "patient": patient_name,
+            "phone": patient_phone,
+            "email": patient_email or "N/A",
+            "type": appointment_type.value,
+            "status": status.value,
+            "reminder_sent": str(reminder_sent).lower(),
+            "notes": notes or "None"
+        }
+    
+    def _appointment_properties(self, event: dict) -> Optional[Dict[str, str]]:
+        """Structured metadata stored on the event, or None for legacy events."""
+        private = event.get("extendedProperties", {}).get("private")
+        if private and APPOINTMENT_PROPERTY_KEY in private:
+            return private
+        return None
+    
+    def _metadata_updates(self, event: dict, label: str, key: str, value: str) -> dict:
+        """
+        Patch fields that change one metadata value.
+        
+        The description line is kept in sync for people reading the event in
+        Google Calendar. Events that already carry extended properties get
+        just the changed key (patch merges it server-side); legacy events are
+        migrated by writing the full property set parsed from the description.
+        """
+        updates = {
+            "description": self._update_description_field(event.get("description", ""), label, value)
+        }
+        properties = self._appointment_properties(event)
+        if properties is not None:
+            changed = {key: value}
+        else:
+            changed = {**self._parse_description(event.get("description", "")), key: value}
+        updates["extendedProperties"] = {"private": changed}
+        return updates
     
     def _update_description_field(
         self, 
@@ -480,36 +706,23 @@ Notes: {notes or 'None'}"""
         field: str, 
         value: str
     ) -> str:
-        """Update a specific field in description."""
-        lines = description.split("\n")
-        updated_lines = []
-        field_found = False
-        
-        for line in lines:
-            if line.startswith(f"{field}:"):
-                updated_lines.append(f"{field}: {value}")
-                field_found = True
-            else:
-                updated_lines.append(line)
-        
-        if not field_found:
-            updated_lines.append(f"{field}: {value}")
-        
-        return "\n".join(updated_lines)
+        """Update a specific field in description, appending it if missing."""
+        line = f"{field}: {value}"
+        updated, count = _description_field_re(field).subn(lambda _: line, description)
+        return updated if count else f"{description}\n{line}"
     
     def _parse_description(self, description: str) -> dict:
         """Parse event description into dict."""
-        parsed = {}
-        for line in description.split("\n"):
-            if ": " in line:
-                key, value = line.split(": ", 1)
-                parsed[key.lower().replace(" ", "_")] = value
-        return parsed
+        return {
+            key.lower().replace(" ", "_"): value
+            for key, value in DESCRIPTION_LINE_RE.findall(description)
+        }
     
     def _event_to_appointment(self, event: dict) -> Appointment:
         """Convert Google Calendar event to Appointment model."""
-        description = event.get("description", "")
-        parsed = self._parse_description(description)
+        parsed = self._appointment_properties(event)
+        if parsed is None:
+            parsed = self._parse_description(event.get("description", ""))
         
         start_str = event["start"].get("dateTime", event["start"].get("date"))
         end_str = event["end"].get("dateTime", event["end"].get("date"))
@@ -541,13 +754,177 @@ Notes: {notes or 'None'}"""
             ),
             start_time=start_time,
             end_time=end_time,
-            formatted_time=start_time.strftime("%-I:%M %p"),
-            formatted_date=start_time.strftime("%A, %B %d, %Y"),
+            formatted_time=_format_time(start_time.hour, start_time.minute),
+            formatted_date=_format_date(start_time.date(), FULL_DATE_DISPLAY_FORMAT),
             appointment_type=apt_type,
             status=status,
             reminder_sent=parsed.get("reminder_sent", "false").lower() == "true"
         )
 
 
+@lru_cache(maxsize=None)
+def _description_field_re(field: str) -> re.Pattern:
+    """Whole description lines starting with "<field>:" (one pattern per label)."""
+    return re.compile(rf"^{re.escape(field)}:.*$", re.MULTILINE)
+
+
+def _busy_epochs(busy_periods: List[dict]) -> List[Tuple[float, float]]:
+    """
+    Free/busy periods as (start, end) epoch seconds, sorted by start.
+    
+    Each RFC 3339 timestamp is parsed exactly once here, so overlap checks
+    compare plain floats instead of re-parsing or converting timezones.
+    """
+    return sorted(
+        (
+            _parse_iso_datetime(busy["start"]).timestamp(),
+            _parse_iso_datetime(busy["end"]).timestamp()
+        )
+        for busy in busy_periods
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_string: str, today_ordinal: int, tz_name: str) -> datetime:
+    """
+    Midnight of a lowercased, stripped date string in the given timezone.
+    
+    Keyed on today's ordinal so 'tomorrow' or a year-less date is
+    recomputed once the day changes. Results are immutable, so they are
+    shared between callers; failures raise and are not cached.
+    """
+    tz = get_timezone(tz_name)
+    today = date_type.fromordinal(today_ordinal)
+    
+    # Natural language
+    days_ahead = RELATIVE_DAYS.get(date_string)
+    if days_ahead is None and date_string.startswith(NEXT_WEEKDAY_PREFIX):
+        target_day = WEEKDAYS.get(date_string[len(NEXT_WEEKDAY_PREFIX):])
+        if target_day is not None:
+            # The coming occurrence, a full week out if it is today
+            days_ahead = (target_day - today.weekday() - 1) % 7 + 1
+    if days_ahead is not None:
+        target_date = today + timedelta(days=days_ahead)
+        return datetime(target_date.year, target_date.month, target_date.day, tzinfo=tz)
+    
+    # Standard formats: try the format the input's shape points to first,
+    # so the common cases cost one strptime and no exceptions
+    guessed_format = _guess_date_format(date_string)
+    if guessed_format:
+        try:
+            return _localize_parsed_date(datetime.strptime(date_string, guessed_format), today, tz)
+        except ValueError:
+            pass
+    
+    for fmt in DATE_INPUT_FORMATS:
+        if fmt == guessed_format:
+            continue
+        try:
+            return _localize_parsed_date(datetime.strptime(date_string, fmt), today, tz)
+        except ValueError:
+            continue
+    
+    raise ValueError(f"Could not parse date: {date_string}")
+
+
+def _localize_parsed_date(parsed: datetime, today: date_type, tz) -> datetime:
+    """Localize a strptime result to midnight, defaulting a missing year to this year."""
+    if parsed.year == 1900:
+        parsed = parsed.replace(year=today.year)
+    return datetime(parsed.year, parsed.month, parsed.day, tzinfo=tz)
+
+
+def _guess_date_format(date_string: str) -> Optional[str]:
+    """Pick the likely strptime format from the shape of a lowercased date string."""
+    if len(date_string) == 10 and date_string[4] == "-" and date_string[7] == "-":
+        return ISO_DATE_FORMAT
+    if "/" in date_string[:5]:
+        return US_SLASH_DATE_FORMAT
+    if "-" in date_string[:3]:
+        return US_DASH_DATE_FORMAT
+    month, _, day = date_string.partition(" ")
+    if day.isdigit():
+        if month in MONTH_NAMES:
+            return MONTH_DAY_FORMAT
+        if month in MONTH_ABBREVIATIONS:
+            return ABBREVIATED_MONTH_DAY_FORMAT
+    elif month in MONTH_NAMES and ", " in day:
+        return MONTH_DAY_YEAR_FORMAT
+    return None
+
+
+@lru_cache(maxsize=None)
+def _format_time(hour: int, minute: int) -> str:
+    """Display string for a wall-clock time, e.g. '2:00 PM' (at most 1440 entries)."""
+    return f"{hour % 12 or 12}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+@lru_cache(maxsize=512)
+def _format_date(day: date_type, fmt: str) -> str:
+    """Display string for a calendar date; the same few dates recur constantly."""
+    return day.strftime(fmt)
+
+
+@lru_cache(maxsize=8)
+def _slot_offsets(
+    duration: int,
+    buffer: int,
+    start_hour: int,
+    start_minute: int,
+    end_hour: int,
+    end_minute: int
+) -> Tuple[Tuple[timedelta, timedelta], ...]:
+    """
+    Slot (start, end) offsets from opening time for a day's configuration.
+    
+    The slot layout depends only on config, not on the date, so it is
+    computed once per configuration and reused for every day.
+    """
+    open_minutes = start_hour * 60 + start_minute
+    close_minutes = end_hour * 60 + end_minute
+    slot_duration = timedelta(minutes=duration)
+    step = timedelta(minutes=duration + buffer)
+    day_length = timedelta(minutes=close_minutes - open_minutes)
+    
+    offsets = []
+    current = timedelta(0)
+    while current + slot_duration <= day_length:
+        offsets.append((current, current + slot_duration))
+        current += step
+    return tuple(offsets)
+
+
+@lru_cache(maxsize=512)
+def _day_slots(
+    day: date_type,
+    duration: int,
+    buffer: int,
+    start_hour: int,
+    start_minute: int,
+    end_hour: int,
+    end_minute: int,
+    tz_name: str
+) -> Tuple[TimeSlot, ...]:
+    """All slots for one day, as an immutable tuple shared between callers."""
+    start_time = datetime(
+        day.year, day.month, day.day, start_hour, start_minute, tzinfo=get_timezone(tz_name)
+    )
+    
+    offsets = _slot_offsets(duration, buffer, start_hour, start_minute, end_hour, end_minute)
+    formatted_date = _format_date(day, SLOT_DATE_DISPLAY_FORMAT)
+    
+    slots = []
+    for start_offset, end_offset in offsets:
+        current = start_time + start_offset
+        slots.append(TimeSlot(
+            start=current,
+            end=start_time + end_offset,
+            formatted_time=_format_time(current.hour, current.minute),
+            formatted_date=formatted_date
+        ))
+    
+    return tuple(slots)
+
+
 # Global service instance
 calendar_service = CalendarService()
\ No newline at end of file
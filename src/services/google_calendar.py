@@ -3,27 +3,130 @@ Direct Google Calendar API interactions.
 Low-level functions for calendar operations.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-import pytz
+from itertools import islice
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from googleapiclient.discovery import build
 
-from src.config import appointment_config
+from src.config import appointment_config, GOOGLE_API_MAX_WORKERS
 from src.core.auth import auth_manager
+from src.utils.timezones import get_timezone
+
+GOOGLE_API_THREAD_NAME_PREFIX = "gcal"
+GOOGLE_CALENDAR_API_NAME = "calendar"
+GOOGLE_CALENDAR_API_VERSION = "v3"
+WARMUP_THREAD_NAME = "gcal-warmup"
+
+# Partial-response masks: only request the event fields appointments use
+EVENT_FIELDS = "id,summary,description,start,end,created,status,extendedProperties"
+EVENT_LIST_FIELDS = f"items({EVENT_FIELDS}),nextPageToken"
+# What status/reminder/reschedule writes read back before patching an event
+EVENT_PATCH_SOURCE_FIELDS = "summary,description,start,extendedProperties"
+FREEBUSY_FIELDS = "calendars"
+
+# Event fields holding a {"dateTime", "timeZone"} block
+EVENT_TIME_FIELDS = frozenset(("start", "end"))
+
+# Events requested per events.list page
+EVENTS_PAGE_SIZE = 50
+
+# Calendar calls block on the network, so independent requests are
+# overlapped on a small shared pool instead of being issued one by one.
+# Created on first use and again after close(), so an in-process restart
+# (or a re-entered test lifespan) gets a fresh pool.
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=GOOGLE_API_MAX_WORKERS,
+                thread_name_prefix=GOOGLE_API_THREAD_NAME_PREFIX
+            )
+        return _pool
 
 
 class GoogleCalendarClient:
     """Low-level Google Calendar API client."""
     
     def __init__(self):
-        self.timezone = pytz.timezone(appointment_config.timezone)
+        self.timezone_name = appointment_config.timezone
+        self.timezone = get_timezone(self.timezone_name)
         self.calendar_id = "primary"
+        
+        # Credentials are shared process-wide; discovery services are kept per
+        # thread because the underlying httplib2 connection is not thread-safe.
+        self._credentials = None
+        self._token_version = None
+        self._local = threading.local()
+    
+    def _get_credentials(self):
+        """Get cached credentials, reloading them only when stale or replaced."""
+        credentials = self._credentials
+        if (
+            credentials is None
+            or not credentials.valid
+            or self._token_version != auth_manager.token_version
+        ):
+            token_version = auth_manager.token_version
+            credentials = auth_manager.get_credentials()
+            if not credentials:
+                self._credentials = None
+                raise ConnectionError("Not connected to Google Calendar. Please authenticate first.")
+            self._credentials = credentials
+            self._token_version = token_version
+        return credentials
     
     def _get_service(self):
         """Get authenticated calendar service."""
-        service = auth_manager.get_calendar_service()
-        if not service:
-            raise ConnectionError("Not connected to Google Calendar. Please authenticate first.")
-        return service
+        credentials = self._get_credentials()
+        local = self._local
+        if getattr(local, "credentials", None) is not credentials:
+            local.service = build(
+                GOOGLE_CALENDAR_API_NAME,
+                GOOGLE_CALENDAR_API_VERSION,
+                credentials=credentials
+            )
+            local.credentials = credentials
+        return local.service
+    
+    def warmup(self) -> None:
+        """
+        Load (and if needed refresh) credentials and open a connection to the
+        Calendar API in the background, so the first real request does not pay
+        for the token refresh and TLS handshake.
+        """
+        def _warm():
+            try:
+                self._get_service().calendars().get(calendarId=self.calendar_id).execute()
+            except Exception:
+                # Not connected yet or offline; the first real call reports it
+                pass
+        
+        threading.Thread(target=_warm, name=WARMUP_THREAD_NAME, daemon=True).start()
+    
+    # ============== Concurrency ==============
+    
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Run an independent calendar call on the shared worker pool."""
+        return _get_pool().submit(fn, *args, **kwargs)
+    
+    def close(self) -> None:
+        """
+        Stop the worker pool, letting in-flight calls finish (call on shutdown).
+
+        Later submits start a new pool.
+        """
+        global _pool
+        with _pool_lock:
+            pool, _pool = _pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
     
     # ============== Free/Busy Queries ==============
     
@@ -31,6 +134,9 @@ class GoogleCalendarClient:
         """
         Query Google Calendar Free/Busy API.
         
+        Not cached here: CalendarService caches per-day availability, and
+        booking checks should see the calendar as it is now.
+        
         Args:
             start: Start of time range
             end: End of time range
@@ -38,22 +144,21 @@ class GoogleCalendarClient:
         Returns:
             List of busy periods with 'start' and 'end' keys
         """
-        service = self._get_service()
-        
         # Ensure timezone awareness
         if start.tzinfo is None:
-            start = self.timezone.localize(start)
+            start = start.replace(tzinfo=self.timezone)
         if end.tzinfo is None:
-            end = self.timezone.localize(end)
+            end = end.replace(tzinfo=self.timezone)
         
+        service = self._get_service()
         body = {
             "timeMin": start.isoformat(),
             "timeMax": end.isoformat(),
-            "timeZone": appointment_config.timezone,
+            "timeZone": self.timezone_name,
             "items": [{"id": self.calendar_id}]
         }
         
-        result = service.freebusy().query(body=body).execute()
+        result = service.freebusy().query(body=body, fields=FREEBUSY_FIELDS).execute()
         calendar_data = result.get("calendars", {}).get(self.calendar_id, {})
         
         return calendar_data.get("busy", [])
@@ -66,51 +171,53 @@ class GoogleCalendarClient:
         start: datetime,
         end: datetime,
         description: str = "",
-        location: str = ""
+        location: str = "",
+        private_properties: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """
         Create a calendar event.
         
+        Args:
+            private_properties: Key/value metadata stored in the event's
+                private extendedProperties (visible only to this app)
+        
         Returns:
             Created event data from Google
         """
         service = self._get_service()
         
-        # Ensure timezone awareness
-        if start.tzinfo is None:
-            start = self.timezone.localize(start)
-        if end.tzinfo is None:
-            end = self.timezone.localize(end)
-        
         event = {
             "summary": summary,
             "description": description,
             "location": location,
-            "start": {
-                "dateTime": start.isoformat(),
-                "timeZone": appointment_config.timezone
-            },
-            "end": {
-                "dateTime": end.isoformat(),
-                "timeZone": appointment_config.timezone
-            },
+            "start": self._event_time(start),
+            "end": self._event_time(end),
             "reminders": {
                 "useDefault": False,
                 "overrides": []
             }
         }
         
+        if private_properties:
+            event["extendedProperties"] = {"private": private_properties}
+        
         created_event = service.events().insert(
             calendarId=self.calendar_id,
-            body=event
+            body=event,
+            fields=EVENT_FIELDS
         ).execute()
         
         return created_event
     
-    def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
+    def get_event(self, event_id: str, fields: str = EVENT_FIELDS) -> Optional[Dict[str, Any]]:
         """
         Get a single event by ID.
         
+        Args:
+            event_id: Google Calendar event ID
+            fields: Partial-response selector; EVENT_PATCH_SOURCE_FIELDS is
+                enough to build a metadata patch
+        
         Returns:
             Event data or None if not found
         """
@@ -119,7 +226,8 @@ class GoogleCalendarClient:
         try:
             event = service.events().get(
                 calendarId=self.calendar_id,
-                eventId=event_id
+                eventId=event_id,
+                fields=fields
             ).execute()
             return event
         except Exception:
@@ -133,6 +241,9 @@ class GoogleCalendarClient:
         """
         Update an existing event.
         
+        Uses patch semantics: only the given fields are sent and Google
+        merges them into the stored event, so no prior read is needed.
+        
         Args:
             event_id: Google Calendar event ID
             updates: Fields to update
@@ -142,36 +253,30 @@ class GoogleCalendarClient:
         """
         service = self._get_service()
         
+        body = {
+            key: self._event_time(value)
+            if key in EVENT_TIME_FIELDS and isinstance(value, datetime)
+            else value
+            for key, value in updates.items()
+        }
+        
         try:
-            # Get existing event
-            event = service.events().get(
-                calendarId=self.calendar_id,
-                eventId=event_id
-            ).execute()
-            
-            # Apply updates
-            for key, value in updates.items():
-                if key in ["start", "end"] and isinstance(value, datetime):
-                    if value.tzinfo is None:
-                        value = self.timezone.localize(value)
-                    event[key] = {
-                        "dateTime": value.isoformat(),
-                        "timeZone": appointment_config.timezone
-                    }
-                else:
-                    event[key] = value
-            
-            # Save
-            updated_event = service.events().update(
+            updated_event = service.events().patch(
                 calendarId=self.calendar_id,
                 eventId=event_id,
-                body=event
+                body=body,
+                fields=EVENT_FIELDS
             ).execute()
-            
-            return updated_event
-            
         except Exception:
             return None
+        
+        return updated_event
+    
+    def _event_time(self, value: datetime) -> Dict[str, str]:
+        """Event start/end block for a datetime, localizing naive values."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=self.timezone)
+        return {"dateTime": value.isoformat(), "timeZone": self.timezone_name}
     
     def delete_event(self, event_id: str) -> bool:
         """
@@ -193,24 +298,27 @@ class GoogleCalendarClient:
     
     # ============== Event Queries ==============
     
-    def list_events(
+    def iter_events(
         self,
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None,
-        max_results: int = 50,
-        query: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        query: Optional[str] = None,
+        fields: Optional[str] = None,
+        page_size: int = EVENTS_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
         """
-        List calendar events.
+        Stream calendar events in start-time order, following pagination.
+        
+        Pages are fetched lazily, so a caller that stops iterating early
+        never requests the remaining pages. A `fields` mask must include
+        `nextPageToken` for pagination to continue past the first page.
         
         Args:
             time_min: Start of time range (default: now)
             time_max: End of time range (optional)
-            max_results: Maximum events to return
             query: Search query string
-            
-        Returns:
-            List of event data
+            fields: Partial-response mask (default: full event resources)
+            page_size: Events requested per page
         """
         service = self._get_service()
         
@@ -218,26 +326,67 @@ class GoogleCalendarClient:
         if time_min is None:
             time_min = datetime.now(self.timezone)
         elif time_min.tzinfo is None:
-            time_min = self.timezone.localize(time_min)
+            time_min = time_min.replace(tzinfo=self.timezone)
         
         params = {
             "calendarId": self.calendar_id,
             "timeMin": time_min.isoformat(),
-            "maxResults": max_results,
+            "maxResults": page_size,
             "singleEvents": True,
             "orderBy": "startTime"
         }
         
         if time_max:
             if time_max.tzinfo is None:
-                time_max = self.timezone.localize(time_max)
+                time_max = time_max.replace(tzinfo=self.timezone)
             params["timeMax"] = time_max.isoformat()
         
         if query:
             params["q"] = query
         
-        result = service.events().list(**params).execute()
-        return result.get("items", [])
+        if fields:
+            params["fields"] = fields
+        
+        while True:
+            result = service.events().list(**params).execute()
+            yield from result.get("items", [])
+            
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return
+            params["pageToken"] = page_token
+    
+    def list_events(
+        self,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 50,
+        query: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List calendar events.
+        
+        Args:
+            time_min: Start of time range (default: now)
+            time_max: End of time range (optional)
+            max_results: Maximum events to return
+            query: Search query string
+            fields: Partial-response mask (default: full event resources)
+            
+        Returns:
+            List of event data
+        """
+        return list(islice(
+            self.iter_events(
+                time_min=time_min,
+                time_max=time_max,
+                query=query,
+                fields=fields,
+                page_size=min(max_results, EVENTS_PAGE_SIZE)
+            ),
+            max_results
+        ))
     
     def search_events(self, query: str, max_results: int = 20) -> List[Dict[str, Any]]:
         """
@@ -248,12 +397,13 @@ class GoogleCalendarClient:
     def get_events_in_range(
         self, 
         start: datetime, 
-        end: datetime
+        end: datetime,
+        fields: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all events within a specific time range.
         """
-        return self.list_events(time_min=start, time_max=end, max_results=100)
+        return list(self.iter_events(time_min=start, time_max=end, fields=fields))
 
 
 # Global client instance
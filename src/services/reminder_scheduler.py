@@ -0,0 +1,153 @@
+"""
+Event-driven appointment reminders.
+
+Each booked appointment gets a timer that fires REMINDER_HOURS_BEFORE its
+start, instead of a periodic job polling the calendar for due reminders.
+Timers live on a private asyncio loop running in a daemon thread.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from src.config import REMINDER_HOURS_BEFORE, REMINDER_PRIME_HOURS
+from src.api.schemas.calendar import Appointment, AppointmentStatus
+from src.utils.logger import get_logger
+
+REMINDER_THREAD_NAME = "reminder-scheduler"
+
+log = get_logger("reminders")
+
+
+class ReminderScheduler:
+    """Schedules one reminder timer per upcoming appointment."""
+
+    def __init__(
+        self,
+        lead_time: timedelta = timedelta(hours=REMINDER_HOURS_BEFORE),
+        prime_window: timedelta = timedelta(hours=REMINDER_PRIME_HOURS)
+    ):
+        self.lead_time = lead_time
+        self.prime_window = prime_window
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._send_reminder: Optional[Callable[[str], None]] = None
+        self._load_upcoming: Optional[Callable[[timedelta], Iterable[Appointment]]] = None
+        # appointment_id -> pending timer; only touched on the loop thread
+        self._handles: Dict[str, asyncio.TimerHandle] = {}
+        self._start_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(
+        self,
+        send_reminder: Callable[[str], None],
+        load_upcoming: Callable[[timedelta], Iterable[Appointment]]
+    ) -> None:
+        """
+        Start the timer loop and prime it from the calendar.
+
+        Args:
+            send_reminder: Called with an appointment ID when its reminder is due
+            load_upcoming: Returns appointments starting within the given window
+                that still need a reminder; called once per prime window with
+                prime_window + lead_time
+        """
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            self._send_reminder = send_reminder
+            self._load_upcoming = load_upcoming
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._loop.run_forever,
+                name=REMINDER_THREAD_NAME,
+                daemon=True
+            ).start()
+
+        self._loop.call_soon_threadsafe(self._prime)
+
+    def stop(self) -> None:
+        """Stop the timer loop, dropping all pending reminders."""
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def schedule(self, appointment: Appointment) -> None:
+        """
+        Set (or replace) the reminder timer for an appointment.
+
+        Appointments that already had their reminder, are not scheduled,
+        or have started are ignored. No-op until the scheduler is started.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        if appointment.reminder_sent or appointment.status != AppointmentStatus.SCHEDULED:
+            self.cancel(appointment.id)
+            return
+
+        now = datetime.now(appointment.start_time.tzinfo)
+        if appointment.start_time <= now:
+            self.cancel(appointment.id)
+            return
+
+        # Booked inside the reminder window: remind right away
+        delay = max((appointment.start_time - self.lead_time - now).total_seconds(), 0)
+        loop.call_soon_threadsafe(self._set_timer, appointment.id, delay)
+
+    def cancel(self, appointment_id: str) -> None:
+        """Drop the pending reminder for an appointment, if any."""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._clear_timer, appointment_id)
+
+    # ============== Loop Thread ==============
+
+    def _set_timer(self, appointment_id: str, delay: float) -> None:
+        self._clear_timer(appointment_id)
+        loop = asyncio.get_running_loop()
+        self._handles[appointment_id] = loop.call_later(delay, self._fire, appointment_id)
+
+    def _clear_timer(self, appointment_id: str) -> None:
+        handle = self._handles.pop(appointment_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _fire(self, appointment_id: str) -> None:
+        self._handles.pop(appointment_id, None)
+        # Sending blocks on Twilio and Calendar, so keep it off the timer loop
+        asyncio.get_running_loop().run_in_executor(None, self._run_send, appointment_id)
+
+    def _run_send(self, appointment_id: str) -> None:
+        try:
+            self._send_reminder(appointment_id)
+        except Exception as e:
+            log.error("Reminder for %s failed: %s", appointment_id, e)
+
+    def _prime(self) -> None:
+        """Load the next window of appointments, then re-prime when it ends."""
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor(None, self._run_prime)
+        loop.call_later(self.prime_window.total_seconds(), self._prime)
+
+    def _run_prime(self) -> None:
+        # Reminders due before the next prime belong to appointments starting
+        # up to lead_time after it, so look that much further ahead
+        try:
+            appointments = list(self._load_upcoming(self.prime_window + self.lead_time))
+        except Exception as e:
+            log.warning("Could not load upcoming appointments for reminders: %s", e)
+            return
+
+        for appointment in appointments:
+            self.schedule(appointment)
+
+        log.debug("Scheduled %d appointment reminders", len(appointments))
+
+
+# Global instance
+reminder_scheduler = ReminderScheduler()
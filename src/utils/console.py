@@ -0,0 +1,31 @@
+"""
+Console colours for status prints.
+
+Colour codes are only produced when stdout is a terminal. Otherwise (log
+files, container log collectors) every Fore attribute is an empty string,
+and colorama never wraps sys.stdout, so prints skip its ANSI parsing.
+"""
+
+import sys
+
+COLOR_ENABLED = sys.stdout.isatty()
+
+
+class _PlainFore:
+    """Stand-in for colorama.Fore that emits no escape codes."""
+    RED = ""
+    GREEN = ""
+    YELLOW = ""
+    CYAN = ""
+    MAGENTA = ""
+    RESET = ""
+
+
+Fore = _PlainFore
+
+if COLOR_ENABLED:
+    try:
+        from colorama import Fore, init
+        init(autoreset=True)
+    except ImportError:
+        COLOR_ENABLED = False
@@ -0,0 +1,49 @@
+"""
+Application logging.
+
+Records from "callpilot.*" loggers are handed to a background thread
+through a queue, so request handlers never block on writing to stdout.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+from src import config
+
+ROOT_LOGGER_NAME = "callpilot"
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener = None
+_setup_lock = threading.Lock()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return the "callpilot.<name>" logger, configuring the queue on first use."""
+    _configure()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def _configure() -> None:
+    global _listener
+    if _listener is not None:
+        return
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        root.setLevel(logging.DEBUG if config.DEBUG else logging.INFO)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+        atexit.register(_listener.stop)
@@ -0,0 +1,34 @@
+"""
+Timezone lookups.
+
+Request handlers and the calendar service resolve the same few zone
+names over and over; each name is resolved once and the tzinfo object is
+shared afterwards.
+
+Zones are stdlib zoneinfo objects, so aware datetimes are built directly
+with tzinfo= (no pytz localize/normalize step) and wall-clock arithmetic
+stays correct across DST changes.
+"""
+
+from datetime import timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+TIMEZONE_CACHE_SIZE = 64
+
+UTC = timezone.utc
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def get_timezone(name: str) -> ZoneInfo:
+    """
+    Return the zoneinfo timezone for an IANA name.
+
+    Raises ZoneInfoNotFoundError for unknown or malformed names; failures
+    are not cached.
+    """
+    try:
+        return ZoneInfo(name)
+    except ValueError as e:
+        # Malformed keys (empty, absolute or relative paths) raise ValueError
+        raise ZoneInfoNotFoundError(f"No time zone found with key {name}") from e
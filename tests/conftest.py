@@ -63,6 +63,14 @@ def db_session(engine) -> Generator[Session, None, None]:
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_oauth_token_cache():
+    """Each test starts with an empty OAuth token cache (rows roll back between tests)"""
+    auth_service._oauth_token_cache.clear()
+    yield
+    auth_service._oauth_token_cache.clear()
+
+
 # ============================================================================
 # FASTAPI TEST CLIENT
 # ============================================================================
@@ -54,6 +54,41 @@ class TestUserManagement:
         assert user.email == sample_user.email
 
 
+class TestOAuthTokenCache:
+    """Tests for the in-memory OAuth token cache"""
+
+    def test_repeated_lookup_skips_database(self, db_session: Session, sample_user_with_oauth, monkeypatch):
+        """Test that a second lookup is served from the cache"""
+        first = auth_service.get_user_oauth_token(db_session, sample_user_with_oauth.id)
+
+        def fail_lookup(db, user_id):
+            raise AssertionError("database queried on a cache hit")
+
+        monkeypatch.setattr(auth_service, "get_user_by_id", fail_lookup)
+        second = auth_service.get_user_oauth_token(db_session, sample_user_with_oauth.id)
+
+        assert second == first
+        assert second is not first
+
+    def test_invalidate_forces_reload(self, db_session: Session, sample_user_with_oauth):
+        """Test that invalidation makes the next lookup see the stored token"""
+        auth_service.get_user_oauth_token(db_session, sample_user_with_oauth.id)
+
+        sample_user_with_oauth.google_oauth_token = None
+        db_session.commit()
+        auth_service.invalidate_oauth_token_cache(sample_user_with_oauth.id)
+
+        assert auth_service.get_user_oauth_token(db_session, sample_user_with_oauth.id) is None
+
+    def test_ttl_capped_by_token_expiry(self):
+        """Test that a token about to expire is not cached past its expiry"""
+        auth_service._store_oauth_token(
+            "user_expiring", {"access_token": "t"}, datetime.utcnow() - timedelta(seconds=1)
+        )
+
+        assert auth_service._get_cached_oauth_token("user_expiring") is None
+
+
 class TestSessionManagement:
     """Tests for user session management"""
 
@@ -72,3 +107,31 @@ class TestSessionManagement:
 
         assert retrieved is not None
         assert retrieved.id == created.id
+
+
+class TestGoogleClientSecrets:
+    """Tests for the cached OAuth client secrets file"""
+
+    @pytest.fixture
+    def secrets_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "google_credentials.json"
+        path.write_text('{"web": {"client_id": "first"}}')
+        monkeypatch.setattr(config.constants, "GOOGLE_CREDENTIALS_PATH", str(path))
+        config.get_google_client_secrets.cache_clear()
+        yield path
+        config.get_google_client_secrets.cache_clear()
+
+    def test_file_is_read_once(self, secrets_path):
+        """Test that later lookups reuse the secrets parsed on first read"""
+        first = config.get_google_client_secrets()
+        secrets_path.write_text('{"web": {"client_id": "second"}}')
+
+        assert config.get_google_client_secrets() is first
+        assert first["web"]["client_id"] == "first"
+
+    def test_missing_file_raises(self, secrets_path):
+        """Test that a missing secrets file surfaces as FileNotFoundError"""
+        secrets_path.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            config.get_google_client_secrets()
@@ -0,0 +1,187 @@
+"""
+Unit tests for appointment writes in the calendar business service.
+
+The Google Calendar client is monkeypatched, so these tests check which
+fields each operation sends without any network access.
+"""
+
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services import calendar_service as calendar_service_module
+from src.services.calendar_service import CalendarService
+from src.api.schemas.calendar import AppointmentStatus
+
+
+LEGACY_DESCRIPTION = (
+    "Patient: Jane Doe\n"
+    "Phone: +15551234567\n"
+    "Email: N/A\n"
+    "Type: checkup\n"
+    "Status: scheduled\n"
+    "Reminder Sent: false\n"
+    "Notes: None"
+)
+
+
+def make_event(event_id="evt_1", properties=None, description=LEGACY_DESCRIPTION):
+    start = datetime(2030, 3, 4, 10, 0)
+    event = {
+        "id": event_id,
+        "summary": "Appointment: Jane Doe",
+        "description": description,
+        "start": {"dateTime": start.isoformat() + "-05:00"},
+        "end": {"dateTime": (start + timedelta(minutes=30)).isoformat() + "-05:00"},
+    }
+    if properties is not None:
+        event["extendedProperties"] = {"private": properties}
+    return event
+
+
+class FakeClient:
+    """Records writes and serves events from a dict."""
+
+    def __init__(self, events):
+        self.events = events
+        self.created = []
+        self.updates = []
+
+    def get_event(self, event_id, fields=None):
+        return self.events.get(event_id)
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+    def create_event(self, **kwargs):
+        self.created.append(kwargs)
+        event = make_event(description=kwargs["description"])
+        if kwargs.get("private_properties"):
+            event["extendedProperties"] = {"private": kwargs["private_properties"]}
+        return event
+
+    def update_event(self, event_id, updates):
+        self.updates.append((event_id, updates))
+        stored = {
+            key: {"dateTime": value.isoformat()} if isinstance(value, datetime) else value
+            for key, value in updates.items()
+        }
+        return dict(self.events[event_id], **stored)
+
+
+@pytest.fixture
+def service():
+    return CalendarService()
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeClient({})
+    monkeypatch.setattr(calendar_service_module, "google_calendar_client", client)
+    return client
+
+
+class TestExtendedProperties:
+    """Tests for structured appointment metadata"""
+
+    def test_create_stores_properties_matching_description(self, service, fake_client, monkeypatch):
+        """Test that booking writes private properties mirroring the description"""
+        monkeypatch.setattr(service, "is_slot_available", lambda dt: True)
+
+        success, _, _, appointment = service.create_appointment(
+            patient_name="Jane Doe",
+            patient_phone="+15551234567",
+            appointment_datetime=datetime(2030, 3, 4, 10, 0)
+        )
+
+        created = fake_client.created[0]
+        assert success is True
+        assert created["private_properties"] == service._parse_description(created["description"])
+        assert appointment.patient.name == "Jane Doe"
+
+    def test_cancel_patches_single_property(self, service, fake_client):
+        """Test that cancelling a structured event patches only the status key"""
+        properties = service._parse_description(LEGACY_DESCRIPTION)
+        fake_client.events["evt_1"] = make_event(properties=properties)
+
+        success, _ = service.cancel_appointment("evt_1")
+
+        _, updates = fake_client.updates[0]
+        assert success is True
+        assert updates["extendedProperties"] == {"private": {"status": "cancelled"}}
+        assert "Status: cancelled" in updates["description"]
+        assert updates["summary"] == "CANCELLED: Jane Doe"
+
+    def test_cancel_uses_event_already_read(self, service, fake_client, monkeypatch):
+        """Test that cancelling with a prefetched event doesn't read it again"""
+        event = make_event(properties=service._parse_description(LEGACY_DESCRIPTION))
+        fake_client.events["evt_1"] = event
+        monkeypatch.setattr(fake_client, "get_event", lambda *args, **kwargs: pytest.fail("re-read"))
+
+        success, _ = service.cancel_appointment("evt_1", event=event)
+
+        assert success is True
+        assert fake_client.updates[0][0] == "evt_1"
+
+    def test_legacy_event_is_migrated_on_write(self, service, fake_client):
+        """Test that a description-only event gets the full property set"""
+        fake_client.events["evt_1"] = make_event()
+
+        service.mark_reminder_sent("evt_1")
+
+        _, updates = fake_client.updates[0]
+        private = updates["extendedProperties"]["private"]
+        assert private["reminder_sent"] == "true"
+        assert private["patient"] == "Jane Doe"
+        assert private["phone"] == "+15551234567"
+
+    def test_description_field_replaced_in_place_or_appended(self, service):
+        """Test that a field line is rewritten where it is, or added at the end"""
+        replaced = service._update_description_field(LEGACY_DESCRIPTION, "Status", r"no_show \1")
+        appended = service._update_description_field("Patient: Jane Doe", "Status", "confirmed")
+
+        assert replaced == LEGACY_DESCRIPTION.replace("Status: scheduled", r"Status: no_show \1")
+        assert appended == "Patient: Jane Doe\nStatus: confirmed"
+
+    def test_properties_take_precedence_over_description(self, service):
+        """Test that reads prefer structured properties to the description"""
+        properties = dict(service._parse_description(LEGACY_DESCRIPTION), status="no_show")
+        event = make_event(properties=properties)
+
+        appointment = service._event_to_appointment(event)
+
+        assert appointment.status == AppointmentStatus.NO_SHOW
+        assert appointment.patient.email is None
+
+
+class TestRescheduleAppointment:
+    """Tests for moving an appointment"""
+
+    def test_reschedule_patches_times_and_resets_reminder(self, service, fake_client, monkeypatch):
+        """Test that rescheduling sends new times and clears the reminder flag"""
+        properties = dict(service._parse_description(LEGACY_DESCRIPTION), reminder_sent="true")
+        fake_client.events["evt_1"] = make_event(properties=properties)
+        monkeypatch.setattr(service, "is_slot_available", lambda dt: True)
+        new_start = datetime(2030, 3, 5, 11, 0, tzinfo=service.tz)
+
+        success, _, appointment = service.reschedule_appointment("evt_1", new_start)
+
+        _, updates = fake_client.updates[0]
+        assert success is True
+        assert updates["start"] == new_start
+        assert updates["end"] - new_start == timedelta(minutes=service.duration)
+        assert updates["extendedProperties"] == {"private": {"reminder_sent": "false"}}
+
+    def test_unavailable_slot_is_not_patched(self, service, fake_client, monkeypatch):
+        """Test that a taken slot aborts the reschedule without writing"""
+        fake_client.events["evt_1"] = make_event()
+        monkeypatch.setattr(service, "is_slot_available", lambda dt: False)
+
+        success, _, appointment = service.reschedule_appointment("evt_1", datetime(2030, 3, 5, 11, 0))
+
+        assert success is False
+        assert appointment is None
+        assert fake_client.updates == []
@@ -0,0 +1,280 @@
+"""
+Unit tests for date parsing and availability logic in the calendar
+business service.
+
+Google Calendar is never contacted: free/busy data is passed in directly
+or supplied through a monkeypatched client.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.calendar_service import CalendarService
+
+
+@pytest.fixture
+def service():
+    return CalendarService()
+
+
+def busy(start: datetime, end: datetime) -> dict:
+    """Build a free/busy period the way Google returns it (UTC, Z suffix)."""
+    return {
+        "start": start.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "end": end.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def future_day(service: CalendarService) -> datetime:
+    """Midnight of a day safely in the future, in the practice timezone."""
+    day = datetime.now(service.tz).date() + timedelta(days=7)
+    return datetime(day.year, day.month, day.day, tzinfo=service.tz)
+
+
+class TestParseDate:
+    """Tests for parsing user-supplied dates"""
+
+    @pytest.mark.parametrize("text", [
+        "2027-03-05",
+        "03/05/2027",
+        "3/5/2027",
+        "03-05-2027",
+        "March 5, 2027",
+    ])
+    def test_explicit_formats(self, service, text):
+        """Test that every supported explicit format parses to the same day"""
+        parsed = service.parse_date(text)
+
+        assert (parsed.year, parsed.month, parsed.day) == (2027, 3, 5)
+        assert (parsed.hour, parsed.minute) == (0, 0)
+        assert parsed.tzinfo is not None
+
+    @pytest.mark.parametrize("text", ["March 5", "mar 5", "MAY 5"])
+    def test_month_names_default_to_current_year(self, service, text):
+        """Test that month-name dates without a year use the current year"""
+        parsed = service.parse_date(text)
+
+        assert parsed.year == datetime.now(service.tz).year
+        assert parsed.day == 5
+
+    def test_relative_dates(self, service):
+        """Test that today, tomorrow and next <weekday> count from today"""
+        today = datetime.now(service.tz).date()
+        next_same_weekday = service.parse_date(f"next {today.strftime('%A')}")
+
+        assert service.parse_date("today").date() == today
+        assert service.parse_date("Tomorrow").date() == today + timedelta(days=1)
+        assert next_same_weekday.date() == today + timedelta(days=7)
+
+    def test_repeated_input_is_cached(self, service):
+        """Test that parsing the same input again reuses the cached result"""
+        assert service.parse_date(" 2027-03-05") is service.parse_date("2027-03-05 ")
+
+    def test_unparseable_date_raises(self, service):
+        """Test that garbage input raises ValueError"""
+        with pytest.raises(ValueError):
+            service.parse_date("someday soon")
+
+
+class TestGenerateTimeSlots:
+    """Tests for building a day's slot grid"""
+
+    def test_repeated_calls_share_slots_but_not_lists(self, service):
+        """Test that a day's slots are reused while each caller gets its own list"""
+        day = future_day(service)
+        first = service._generate_time_slots(day, 30)
+        first.clear()
+        second = service._generate_time_slots(day, 30)
+
+        assert second
+        assert second[0] is service._generate_time_slots(day, 30)[0]
+        assert second[0].start.date() == day.date()
+
+
+class TestFilterAvailableSlots:
+    """Tests for removing busy slots"""
+
+    def test_no_busy_periods_keeps_all_slots(self, service):
+        """Test that an empty calendar leaves every slot available"""
+        slots = service._generate_time_slots(future_day(service), 30)
+
+        assert service._filter_available_slots(slots, []) == slots
+
+    def test_busy_period_blocks_overlapping_slots(self, service):
+        """Test that only slots overlapping a busy period are removed"""
+        day = future_day(service)
+        slots = service._generate_time_slots(day, 30)
+        blocked = busy(day.replace(hour=10), day.replace(hour=11))
+
+        available = service._filter_available_slots(slots, [blocked])
+        starts = {(slot.start.hour, slot.start.minute) for slot in available}
+
+        assert (10, 0) not in starts
+        assert (10, 30) not in starts
+        assert (9, 30) in starts
+        assert (11, 0) in starts
+
+    def test_unsorted_and_nested_busy_periods(self, service):
+        """Test that unsorted, nested busy periods match a brute-force check"""
+        day = future_day(service)
+        slots = service._generate_time_slots(day, 30)
+        periods = [
+            busy(day.replace(hour=14, minute=10), day.replace(hour=14, minute=20)),
+            busy(day.replace(hour=9), day.replace(hour=12)),
+            busy(day.replace(hour=9, minute=30), day.replace(hour=9, minute=45)),
+            busy(day.replace(hour=16, minute=59), day.replace(hour=18)),
+        ]
+
+        def overlaps(slot, period):
+            start = datetime.fromisoformat(period["start"].replace("Z", "+00:00"))
+            end = datetime.fromisoformat(period["end"].replace("Z", "+00:00"))
+            return slot.start < end and start < slot.end
+
+        expected = [s for s in slots if not any(overlaps(s, p) for p in periods)]
+
+        assert service._filter_available_slots(slots, periods) == expected
+
+    def test_now_drops_started_slots(self, service):
+        """Test that slots starting at or before `now` are removed in the same pass"""
+        day = future_day(service)
+        slots = service._generate_time_slots(day, 30)
+        blocked = busy(day.replace(hour=13), day.replace(hour=14))
+
+        available = service._filter_available_slots(slots, [blocked], now=day.replace(hour=12))
+        starts = [(slot.start.hour, slot.start.minute) for slot in available]
+
+        assert starts[0] == (12, 30)
+        assert (12, 0) not in starts
+        assert (13, 0) not in starts
+        assert (14, 0) in starts
+
+
+class TestAvailabilityCache:
+    """Tests for the short-lived availability cache"""
+
+    @pytest.fixture
+    def busy_calls(self, monkeypatch):
+        from src.services import calendar_service as calendar_service_module
+
+        calls = []
+
+        def fake_get_busy_periods(start, end):
+            calls.append((start, end))
+            return []
+
+        monkeypatch.setattr(
+            calendar_service_module.google_calendar_client,
+            "get_busy_periods",
+            fake_get_busy_periods
+        )
+        return calls
+
+    def test_repeated_check_uses_cache(self, service, busy_calls):
+        """Test that a second check for the same date skips free/busy"""
+        date_str = future_day(service).strftime("%Y-%m-%d")
+
+        first = service.check_availability(date_str)
+        second = service.check_availability(date_str)
+
+        assert first == second
+        assert len(busy_calls) == 1
+
+    def test_different_duration_is_separate_entry(self, service, busy_calls):
+        """Test that the cache is keyed by duration as well as date"""
+        date_str = future_day(service).strftime("%Y-%m-%d")
+
+        service.check_availability(date_str, 30)
+        service.check_availability(date_str, 60)
+
+        assert len(busy_calls) == 2
+
+    def test_day_without_open_slots_skips_free_busy(self, service, busy_calls, monkeypatch):
+        """Test that free/busy is not queried when no slot is left to offer"""
+        monkeypatch.setattr(service, "_generate_time_slots", lambda date, duration: [])
+        date_str = future_day(service).strftime("%Y-%m-%d")
+
+        _, _, slots, _ = service.check_availability(date_str)
+
+        assert slots == []
+        assert busy_calls == []
+
+    def test_range_fetches_free_busy_once(self, service, busy_calls):
+        """Test that a multi-day range shares one free/busy query, then the cache"""
+        first = future_day(service)
+        dates = [(first + timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(7)]
+
+        results = service.check_availability_range(dates)
+        service.check_availability_range(dates)
+
+        assert [result[0] for result in results] == dates
+        assert len(busy_calls) == 1
+
+    def test_invalidate_date_forces_refetch(self, service, busy_calls):
+        """Test that invalidating a date drops its cached result"""
+        date_str = future_day(service).strftime("%Y-%m-%d")
+
+        service.check_availability(date_str)
+        service._invalidate_availability(date_str)
+        service.check_availability(date_str)
+
+        assert len(busy_calls) == 2
+
+
+class TestIsSlotAvailable:
+    """Tests for checking a single requested slot"""
+
+    @pytest.fixture
+    def busy_queries(self, monkeypatch):
+        from src.services import calendar_service as calendar_service_module
+
+        queries = []
+        busy_periods = []
+
+        def fake_get_busy_periods(start, end):
+            queries.append((start, end))
+            return list(busy_periods)
+
+        monkeypatch.setattr(
+            calendar_service_module.google_calendar_client,
+            "get_busy_periods",
+            fake_get_busy_periods
+        )
+        return queries, busy_periods
+
+    def test_free_slot_queries_only_that_slot(self, service, busy_queries):
+        """Test that a free on-grid slot is available and only its window is queried"""
+        queries, _ = busy_queries
+        slot_start = future_day(service).replace(hour=10)
+
+        assert service.is_slot_available(slot_start) is True
+        assert len(queries) == 1
+        start, end = queries[0]
+        assert start == slot_start
+        assert end - start == timedelta(minutes=service.duration)
+
+    def test_busy_slot_is_unavailable(self, service, busy_queries):
+        """Test that an overlapping busy period makes the slot unavailable"""
+        _, busy_periods = busy_queries
+        slot_start = future_day(service).replace(hour=10)
+        busy_periods.append(busy(slot_start + timedelta(minutes=10), slot_start + timedelta(hours=1)))
+
+        assert service.is_slot_available(slot_start) is False
+
+    def test_off_grid_and_closed_times_skip_api(self, service, busy_queries):
+        """Test that times outside the slot grid are rejected without a free/busy call"""
+        queries, _ = busy_queries
+        day = future_day(service)
+
+        assert service.is_slot_available(day.replace(hour=10, minute=7)) is False
+        assert service.is_slot_available(day.replace(hour=6)) is False
+        assert service.is_slot_available(day.replace(hour=23)) is False
+        assert queries == []
+
+    def test_past_slot_is_unavailable(self, service, busy_queries):
+        """Test that slots in the past are rejected"""
+        queries, _ = busy_queries
+        yesterday = future_day(service) - timedelta(days=8)
+
+        assert service.is_slot_available(yesterday.replace(hour=10)) is False
+        assert queries == []
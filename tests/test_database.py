@@ -87,6 +87,26 @@ class TestPatientModel:
         
         assert patient.doctor.id == sample_user.id
 
+    def test_timestamps_loaded_by_flush(self, db_session: Session, sample_user):
+        """Test that database-filled timestamps come back with the INSERT and UPDATE"""
+        from sqlalchemy import inspect
+
+        patient = db_models.Patient(
+            id="pat_ts_123",
+            doctor_id=sample_user.id,
+            name="Jane Doe",
+            phone="+12025551236"
+        )
+        db_session.add(patient)
+        db_session.flush()
+        assert not inspect(patient).expired_attributes
+        assert patient.created_at is not None
+
+        patient.notes = "Prefers mornings"
+        db_session.flush()
+        assert not inspect(patient).expired_attributes
+        assert patient.updated_at is not None
+
 
 class TestAppointmentModel:
     """Tests for Appointment model"""
@@ -123,6 +143,67 @@ class TestAppointmentModel:
         assert appointment.patient.id == sample_patient.id
 
 
+    def test_set_status_matches_id_or_calendar_event(self, db_session: Session, sample_appointment):
+        """Test that status updates find appointments by either identifier"""
+        from src.api.main import set_appointment_status
+
+        doctor_id = sample_appointment.doctor_id
+
+        assert set_appointment_status(db_session, doctor_id, "google_event_123", "confirmed") is True
+        assert set_appointment_status(db_session, doctor_id, "missing", "confirmed") is False
+        assert set_appointment_status(db_session, "other_doctor", "appt_test_123", "cancelled") is False
+        db_session.commit()
+        db_session.refresh(sample_appointment)
+
+        assert sample_appointment.status == "confirmed"
+
+    def test_scheduled_at_follows_date_and_time(self, db_session: Session, sample_appointment):
+        """Test that scheduled_at is filled on insert and kept in sync on update"""
+        assert sample_appointment.scheduled_at == datetime(2026, 2, 15, 14, 0)
+
+        sample_appointment.time = "09:30"
+        db_session.commit()
+        db_session.refresh(sample_appointment)
+
+        assert sample_appointment.scheduled_at == datetime(2026, 2, 15, 9, 30)
+
+    def test_response_built_from_row(self, sample_appointment):
+        """Test that the appointment response reads row fields and fallbacks"""
+        from src.api.main import appointment_to_response
+
+        response = appointment_to_response(sample_appointment)
+
+        assert response.id == "appt_test_123"
+        assert response.patient_name == sample_appointment.patient.name
+        assert response.created_at == sample_appointment.created_at
+        assert response.model_dump()["calendar_event_id"] == "google_event_123"
+
+    def test_column_rows_match_orm_responses(self, db_session: Session, sample_appointment):
+        """Test that responses built from selected columns match the ORM path"""
+        from src.api.main import (
+            APPOINTMENT_RESPONSE_COLUMNS, appointment_rows_to_responses, appointment_to_response
+        )
+
+        rows = db_session.query(*APPOINTMENT_RESPONSE_COLUMNS).outerjoin(
+            db_models.Patient, db_models.Patient.id == db_models.Appointment.patient_id
+        ).all()
+
+        assert [r.model_dump() for r in appointment_rows_to_responses(rows)] == [
+            appointment_to_response(sample_appointment).model_dump()
+        ]
+
+    def test_last_appointment_times_per_patient(self, db_session: Session, sample_appointment):
+        """Test that the latest appointment time is returned per patient in one lookup"""
+        from src.api.main import last_appointment_times
+
+        patient_id = sample_appointment.patient_id
+
+        assert last_appointment_times(db_session, [patient_id, "missing"]) == {
+            patient_id: datetime(2026, 2, 15, 14, 0)
+        }
+        assert last_appointment_times(db_session, []) == {}
+
+
 class TestCallModel:
     """Tests for Call model"""
 
@@ -190,6 +271,75 @@ class TestDatabaseConstraints:
         with pytest.raises(Exception):  # IntegrityError
             db_session.commit()
 
+    def test_patient_phone_unique_per_doctor(self, db_session: Session, sample_patient):
+        """Test that a doctor can't have two patients with the same phone"""
+        duplicate = db_models.Patient(
+            id="pat_duplicate",
+            doctor_id=sample_patient.doctor_id,
+            name="Someone Else",
+            phone=sample_patient.phone
+        )
+
+        db_session.add(duplicate)
+        with pytest.raises(Exception):  # IntegrityError
+            db_session.commit()
+
+    def test_find_or_create_patient_reuses_existing(self, db_session: Session, sample_patient):
+        """Test that find-or-create returns the existing row instead of inserting"""
+        from src.api.main import find_or_create_patient
+
+        patient, created = find_or_create_patient(
+            db_session, sample_patient.doctor_id, "John Doe", sample_patient.phone
+        )
+        new_patient, new_created = find_or_create_patient(
+            db_session, sample_patient.doctor_id, "Jane Roe", "+12025552222"
+        )
+
+        assert created is False
+        assert patient.id == sample_patient.id
+        assert new_created is True
+        assert new_patient.name == "Jane Roe"
+
+    def test_patient_unique_key_added_to_existing_table(self):
+        """Test that duplicate patients are merged before the unique index is built"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import StaticPool
+        from src.api.main import find_or_create_patient
+
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        db_models.Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX uq_patients_doctor_phone")
+
+        with Session(engine) as session:
+            session.add(db_models.User(id="user_1", email="doc@example.com", name="Doc"))
+            session.add_all([
+                db_models.Patient(id="pat_old", doctor_id="user_1", name="A", phone="+1",
+                                  created_at=datetime(2024, 1, 1)),
+                db_models.Patient(id="pat_new", doctor_id="user_1", name="A", phone="+1",
+                                  created_at=datetime(2024, 2, 1)),
+                db_models.Appointment(id="appt_1", doctor_id="user_1", patient_id="pat_new",
+                                      date="2030-01-01", time="09:00"),
+            ])
+            session.commit()
+
+            # No unique key yet: falls back to lookup-then-add
+            patient, created = find_or_create_patient(session, "user_1", "A", "+1")
+            assert created is False
+            session.rollback()
+
+        db_models._dedupe_patients(engine)
+        db_models._create_missing_indexes(engine)
+
+        with Session(engine) as session:
+            assert [p.id for p in session.query(db_models.Patient)] == ["pat_old"]
+            assert session.get(db_models.Appointment, "appt_1").patient_id == "pat_old"
+            assert db_models.has_unique_key(
+                session.connection(), "patients", ("doctor_id", "phone")
+            )
+            patient, created = find_or_create_patient(session, "user_1", "A", "+1")
+            assert (patient.id, created) == ("pat_old", False)
+
     def test_patient_requires_doctor(self, db_session: Session):
         """Test that patient must have a doctor"""
         pytest.skip("SQLite in-memory doesn't enforce FK constraints by default in test mode")
@@ -0,0 +1,136 @@
+"""
+Unit tests for the file-backed Google auth manager.
+
+Tokens are written to a temporary file; Google is never contacted.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src import config
+from src.core.auth import GoogleAuthManager
+
+
+def write_token(path, token: str) -> None:
+    path.write_text(json.dumps({
+        "token": token,
+        "refresh_token": "1//refresh",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "test_client_id",
+        "client_secret": "test_client_secret",
+        "scopes": ["openid"],
+        "expiry": (datetime.utcnow() + timedelta(hours=1)).isoformat()
+    }))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # Settings come from the config snapshot, not the live environment
+    monkeypatch.setitem(config._ENV, "GOOGLE_REDIRECT_URI", "http://localhost:8000/callback")
+    monkeypatch.setitem(config._ENV, "GOOGLE_OAUTH_SCOPES", "openid")
+    auth = GoogleAuthManager()
+    auth.token_file = str(tmp_path / "token.json")
+    return auth
+
+
+class TestGetAuthUrl:
+    """Tests for building the consent URL"""
+
+    def test_url_carries_client_settings_and_fresh_state(self, manager):
+        """Test that each URL has the fixed OAuth parameters and a new state"""
+        first = parse_qs(urlsplit(manager.get_auth_url()).query)
+        second = parse_qs(urlsplit(manager.get_auth_url()).query)
+
+        assert first["redirect_uri"] == ["http://localhost:8000/callback"]
+        assert first["scope"] == ["openid"]
+        assert first["access_type"] == ["offline"]
+        assert first["response_type"] == ["code"]
+        assert first["state"] != second["state"]
+
+
+class TestGetCredentials:
+    """Tests for loading stored credentials"""
+
+    def test_missing_token_file(self, manager):
+        """Test that no token file means no credentials"""
+        assert manager.get_credentials() is None
+
+    def test_unchanged_file_reuses_credentials(self, manager, tmp_path):
+        """Test that the token file is parsed once until it changes"""
+        token_path = tmp_path / "token.json"
+        write_token(token_path, "first")
+
+        first = manager.get_credentials()
+        second = manager.get_credentials()
+
+        assert first is second
+        assert first.token == "first"
+
+        write_token(token_path, "second")
+        stat = os.stat(token_path)
+        os.utime(token_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert manager.get_credentials().token == "second"
+
+    def test_disconnect_drops_credentials(self, manager, tmp_path):
+        """Test that disconnecting forgets the cached credentials"""
+        write_token(tmp_path / "token.json", "first")
+        manager.get_credentials()
+
+        manager.disconnect()
+
+        assert manager.get_credentials() is None
+
+
+class TestSaveTokens:
+    """Tests for persisting refreshed credentials"""
+
+    def test_save_replaces_file_and_refreshes_cache(self, manager, tmp_path):
+        """Test that saving swaps in the new file and keeps the saved credentials"""
+        token_path = tmp_path / "token.json"
+        write_token(token_path, "first")
+        credentials = manager.get_credentials()
+        credentials.token = "rotated"
+
+        manager._save_tokens(credentials)
+
+        assert json.loads(token_path.read_text())["token"] == "rotated"
+        assert list(tmp_path.iterdir()) == [token_path]
+        assert manager.get_credentials() is credentials
+
+
+class TestGetUserEmail:
+    """Tests for the userinfo email lookup"""
+
+    @pytest.fixture
+    def userinfo_calls(self, monkeypatch):
+        from src.core import auth as auth_module
+
+        calls = []
+
+        class FakeUserinfo:
+            def get(self):
+                return self
+
+            def execute(self):
+                calls.append(1)
+                return {"email": "doctor@example.com"}
+
+        class FakeService:
+            def userinfo(self):
+                return FakeUserinfo()
+
+        monkeypatch.setattr(auth_module, "build", lambda *args, **kwargs: FakeService())
+        return calls
+
+    def test_email_is_fetched_once_per_token(self, manager, tmp_path, userinfo_calls):
+        """Test that repeated status checks reuse the email for the same token"""
+        write_token(tmp_path / "token.json", "first")
+
+        assert manager.get_status() == (True, "doctor@example.com", "primary")
+        assert manager.get_status()[1] == "doctor@example.com"
+        assert len(userinfo_calls) == 1
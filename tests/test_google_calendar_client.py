@@ -0,0 +1,183 @@
+"""
+Unit tests for the low-level Google Calendar client.
+
+The Google API is replaced by a small in-memory fake that records every
+request, so these tests run without network access or credentials.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.services.google_calendar import EVENT_PATCH_SOURCE_FIELDS, GoogleCalendarClient
+
+
+class FakeRequest:
+    """Deferred request returned by the fake service, mirroring googleapiclient."""
+
+    def __init__(self, service, method, kwargs):
+        self.service = service
+        self.method = method
+        self.kwargs = kwargs
+
+    def execute(self):
+        self.service.calls.append((self.method, self.kwargs))
+        return self.service.handle(self.method, self.kwargs)
+
+
+class FakeEvents:
+    """Fake `service.events()` resource."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def __getattr__(self, method):
+        return lambda **kwargs: FakeRequest(self.service, method, kwargs)
+
+
+class FakeCalendarService:
+    """In-memory stand-in for the Calendar v3 discovery service."""
+
+    def __init__(self, events=None):
+        self.events_by_id = dict(events or {})
+        self.list_pages = [[]]
+        self.busy = []
+        self.calls = []
+
+    def events(self):
+        return FakeEvents(self)
+
+    def freebusy(self):
+        return FakeEvents(self)
+
+    def handle(self, method, kwargs):
+        if method == "insert":
+            event = dict(kwargs["body"], id=f"evt_{len(self.events_by_id) + 1}")
+            self.events_by_id[event["id"]] = event
+            return event
+        if method == "get":
+            return dict(self.events_by_id[kwargs["eventId"]])
+        if method == "patch":
+            event = self.events_by_id[kwargs["eventId"]]
+            event.update(kwargs["body"])
+            return dict(event)
+        if method == "list":
+            pages = self.list_pages
+            index = int(kwargs.get("pageToken", 0))
+            page = {"items": pages[index]}
+            if index + 1 < len(pages):
+                page["nextPageToken"] = str(index + 1)
+            return page
+        if method == "delete":
+            self.events_by_id.pop(kwargs["eventId"])
+            return None
+        if method == "query":
+            return {"calendars": {"primary": {"busy": list(self.busy)}}}
+        raise AssertionError(f"Unexpected events().{method} call")
+
+    def methods_called(self):
+        return [method for method, _ in self.calls]
+
+
+@pytest.fixture
+def fake_service():
+    return FakeCalendarService({
+        "evt_1": {
+            "id": "evt_1",
+            "summary": "Appointment: Jane Doe",
+            "description": "Patient: Jane Doe\nStatus: scheduled",
+        }
+    })
+
+
+@pytest.fixture
+def client(fake_service, monkeypatch):
+    calendar_client = GoogleCalendarClient()
+    monkeypatch.setattr(calendar_client, "_get_service", lambda: fake_service)
+    return calendar_client
+
+
+class TestUpdateEvent:
+    """Tests for patch-based event updates"""
+
+    def test_update_event_patches_only_changed_fields(self, client, fake_service):
+        """Test that an update is a single patch carrying only the given fields"""
+        updated = client.update_event("evt_1", {"summary": "CANCELLED: Jane Doe"})
+
+        assert fake_service.methods_called() == ["patch"]
+        assert fake_service.calls[0][1]["body"] == {"summary": "CANCELLED: Jane Doe"}
+        assert updated["summary"] == "CANCELLED: Jane Doe"
+        assert updated["description"] == "Patient: Jane Doe\nStatus: scheduled"
+
+    def test_update_event_serializes_datetimes(self, client, fake_service):
+        """Test that start/end datetimes are sent as timezone-aware dateTime blocks"""
+        client.update_event("evt_1", {"start": datetime(2026, 3, 2, 9, 0)})
+
+        start = fake_service.calls[0][1]["body"]["start"]
+        assert start["dateTime"].startswith("2026-03-02T09:00:00")
+        assert start["timeZone"]
+
+    def test_patch_then_get_requests_only_patch_fields(self, client, fake_service):
+        """Test that reading an event back for a patch asks only for the fields a patch needs"""
+        client.update_event("evt_1", {"summary": "NO SHOW: Jane Doe"})
+        client.get_event("evt_1", fields=EVENT_PATCH_SOURCE_FIELDS)
+
+        assert fake_service.methods_called() == ["patch", "get"]
+        assert fake_service.calls[1][1]["fields"] == EVENT_PATCH_SOURCE_FIELDS
+
+    def test_each_get_reads_from_api(self, client, fake_service):
+        """Test that every get reads the event from the API"""
+        client.get_event("evt_1")
+        client.get_event("evt_1")
+
+        assert fake_service.methods_called() == ["get", "get"]
+
+
+class TestListEvents:
+    """Tests for paginated event listing"""
+
+    @pytest.fixture
+    def paged_service(self, fake_service):
+        fake_service.list_pages = [
+            [{"id": "a"}, {"id": "b"}],
+            [{"id": "c"}, {"id": "d"}],
+            [{"id": "e"}],
+        ]
+        return fake_service
+
+    def test_range_query_follows_all_pages(self, client, paged_service):
+        """Test that a range query returns events from every page"""
+        events = client.get_events_in_range(datetime(2026, 3, 2), datetime(2026, 3, 9))
+
+        assert [event["id"] for event in events] == ["a", "b", "c", "d", "e"]
+        assert paged_service.methods_called() == ["list", "list", "list"]
+
+    def test_max_results_stops_fetching_early(self, client, paged_service):
+        """Test that pages past max_results are never requested"""
+        events = client.list_events(max_results=3)
+
+        assert [event["id"] for event in events] == ["a", "b", "c"]
+        assert paged_service.methods_called() == ["list", "list"]
+
+
+class TestBusyPeriods:
+    """Tests for free/busy queries"""
+
+    def test_each_check_queries_free_busy(self, client, fake_service):
+        """Test that free/busy is read fresh on every call"""
+        fake_service.busy = [{"start": "2026-03-02T14:00:00Z", "end": "2026-03-02T15:00:00Z"}]
+        start, end = datetime(2026, 3, 2), datetime(2026, 3, 3)
+
+        assert client.get_busy_periods(start, end) == fake_service.busy
+        assert client.get_busy_periods(start, end) == fake_service.busy
+        assert fake_service.methods_called() == ["query", "query"]
+
+
+class TestWorkerPool:
+    """Tests for the shared calendar worker pool"""
+
+    def test_submit_after_close_starts_new_pool(self, client):
+        """Test that closing the client doesn't break later submits in the same process"""
+        client.close()
+
+        assert client.submit(lambda: "ok").result() == "ok"
@@ -0,0 +1,100 @@
+"""
+Unit tests for the event-driven reminder scheduler.
+
+Lead times are shrunk to fractions of a second so timers fire during the
+test; the send and load callbacks are plain functions.
+"""
+
+from datetime import datetime, timedelta, timezone
+import threading
+
+import pytest
+
+from src.api.schemas.calendar import Appointment, AppointmentStatus, AppointmentType, Patient
+from src.services.reminder_scheduler import ReminderScheduler
+
+FIRE_TIMEOUT_SECONDS = 2
+
+
+def make_appointment(appointment_id: str, starts_in: timedelta, **overrides) -> Appointment:
+    start = datetime.now(timezone.utc) + starts_in
+    fields = dict(
+        id=appointment_id,
+        patient=Patient(name="Jane Doe", phone="+15551234567"),
+        start_time=start,
+        end_time=start + timedelta(minutes=30),
+        formatted_time="10:00 AM",
+        formatted_date="Monday, March 04",
+        appointment_type=AppointmentType.CHECKUP,
+        status=AppointmentStatus.SCHEDULED,
+    )
+    fields.update(overrides)
+    return Appointment(**fields)
+
+
+@pytest.fixture
+def sent():
+    return {"ids": [], "event": threading.Event()}
+
+
+@pytest.fixture
+def send_reminder(sent):
+    def record(appointment_id):
+        sent["ids"].append(appointment_id)
+        sent["event"].set()
+    return record
+
+
+@pytest.fixture
+def scheduler(send_reminder):
+    reminder_scheduler = ReminderScheduler(
+        lead_time=timedelta(seconds=1),
+        prime_window=timedelta(hours=24)
+    )
+    reminder_scheduler.start(send_reminder, lambda window: [])
+    yield reminder_scheduler
+    reminder_scheduler.stop()
+
+
+class TestReminderScheduler:
+    """Tests for per-appointment reminder timers"""
+
+    def test_reminder_fires_lead_time_before_start(self, scheduler, sent):
+        """Test that a scheduled appointment triggers exactly its reminder"""
+        scheduler.schedule(make_appointment("evt_1", timedelta(seconds=1.1)))
+
+        assert sent["event"].wait(FIRE_TIMEOUT_SECONDS)
+        assert sent["ids"] == ["evt_1"]
+
+    def test_cancelled_reminder_does_not_fire(self, scheduler, sent):
+        """Test that cancelling before the timer fires suppresses the reminder"""
+        scheduler.schedule(make_appointment("evt_1", timedelta(seconds=1.3)))
+        scheduler.cancel("evt_1")
+
+        assert not sent["event"].wait(0.6)
+
+    def test_sent_or_inactive_appointments_are_skipped(self, scheduler, sent):
+        """Test that reminders are only set for scheduled appointments that still need one"""
+        scheduler.schedule(make_appointment("evt_1", timedelta(seconds=1), reminder_sent=True))
+        scheduler.schedule(make_appointment("evt_2", timedelta(seconds=1), status=AppointmentStatus.CANCELLED))
+        scheduler.schedule(make_appointment("evt_3", timedelta(seconds=-60)))
+
+        assert not sent["event"].wait(0.3)
+
+    def test_start_primes_from_loader(self, sent, send_reminder):
+        """Test that starting loads every reminder due before the next prime and schedules it"""
+        windows = []
+
+        def load_upcoming(window):
+            windows.append(window)
+            return [make_appointment("evt_9", timedelta(seconds=1))]
+
+        reminder_scheduler = ReminderScheduler(lead_time=timedelta(seconds=1))
+        reminder_scheduler.start(send_reminder, load_upcoming)
+        try:
+            assert sent["event"].wait(FIRE_TIMEOUT_SECONDS)
+        finally:
+            reminder_scheduler.stop()
+
+        assert sent["ids"] == ["evt_9"]
+        assert windows == [reminder_scheduler.prime_window + reminder_scheduler.lead_time]
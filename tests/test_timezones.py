@@ -0,0 +1,27 @@
+"""
+Unit tests for the cached timezone lookup.
+"""
+
+from zoneinfo import ZoneInfoNotFoundError
+
+import pytest
+
+from src.utils.timezones import get_timezone
+
+
+class TestGetTimezone:
+    """Tests for resolving IANA timezone names"""
+
+    def test_same_name_returns_same_object(self):
+        """Test that repeated lookups share one tzinfo"""
+        first = get_timezone("America/New_York")
+
+        assert get_timezone("America/New_York") is first
+        assert first.key == "America/New_York"
+
+    def test_unknown_name_raises(self):
+        """Test that unknown and malformed names raise ZoneInfoNotFoundError"""
+        with pytest.raises(ZoneInfoNotFoundError):
+            get_timezone("Not/AZone")
+        with pytest.raises(ZoneInfoNotFoundError):
+            get_timezone("")
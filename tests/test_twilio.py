@@ -0,0 +1,122 @@
+"""
+Unit tests for the Twilio wrapper's call status cache, TwiML helpers and
+the background SMS queue.
+
+Twilio is never contacted: the REST client is replaced with a fake.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.integrations import twilio as twilio_module
+
+
+class FakeCalls:
+    """Stands in for client.calls; counts fetches and serves a settable status."""
+
+    def __init__(self):
+        self.fetches = 0
+        self.status = "in-progress"
+
+    def __call__(self, call_sid):
+        return SimpleNamespace(fetch=lambda: self._fetch(call_sid))
+
+    def _fetch(self, call_sid):
+        self.fetches += 1
+        return SimpleNamespace(
+            sid=call_sid, status=self.status, duration=None, price=None,
+            to="+12025551234", from_="+12025550000",
+            start_time=None, end_time=None, direction="outbound-api"
+        )
+
+
+@pytest.fixture
+def fake_calls():
+    return FakeCalls()
+
+
+@pytest.fixture
+def wrapper(monkeypatch, fake_calls):
+    monkeypatch.setattr(
+        twilio_module, "Client", lambda *args, **kwargs: SimpleNamespace(calls=fake_calls)
+    )
+    return twilio_module.TwilioWrapper()
+
+
+class TestGetCallStatus:
+    """Tests for polling a call's status"""
+
+    def test_repeated_poll_uses_cache(self, wrapper, fake_calls):
+        """Test that polling a live call twice makes one request"""
+        first = wrapper.get_call_status("CA1")
+        first["status"] = "mutated"
+
+        assert wrapper.get_call_status("CA1")["status"] == "in-progress"
+        assert fake_calls.fetches == 1
+
+    def test_force_refresh_skips_cache(self, wrapper, fake_calls):
+        """Test that force_refresh always asks Twilio"""
+        wrapper.get_call_status("CA1")
+        fake_calls.status = "completed"
+
+        assert wrapper.get_call_status("CA1", force_refresh=True)["status"] == "completed"
+        assert fake_calls.fetches == 2
+
+    def test_only_finished_calls_outlive_ttl(self, wrapper, fake_calls, monkeypatch):
+        """Test that live statuses expire while terminal ones stay cached"""
+        monkeypatch.setattr(twilio_module.config, "TWILIO_STATUS_CACHE_TTL_SECONDS", 0)
+
+        wrapper.get_call_status("CA1")
+        wrapper.get_call_status("CA1")
+        assert fake_calls.fetches == 2
+
+        fake_calls.status = "completed"
+        wrapper.get_call_status("CA2")
+        wrapper.get_call_status("CA2")
+        assert fake_calls.fetches == 3
+
+
+class TestTwimlHelpers:
+    """Tests for the pre-rendered TwiML templates"""
+
+    def test_say_matches_voice_response(self):
+        """Test that the cached template renders what VoiceResponse would"""
+        expected = twilio_module.VoiceResponse()
+        expected.say("Hi & bye <now>", voice="alice")
+
+        rendered = twilio_module.TwilioWrapper.create_say_response(
+            "Hi & bye <now>", language=None, voice="alice"
+        )
+        assert rendered == expected.to_xml()
+
+    def test_gather_matches_voice_response(self):
+        """Test that the gather template only swaps in the prompt"""
+        expected = twilio_module.VoiceResponse()
+        expected.gather(num_digits=4, finish_on_key="*").say("Enter your PIN")
+
+        rendered = twilio_module.TwilioWrapper.create_gather_response(
+            "Enter your PIN", num_digits=4, finish_on_key="*"
+        )
+        assert rendered == expected.to_xml()
+
+
+class TestSmsQueue:
+    """Tests for the background SMS pool across app restarts"""
+
+    def test_queue_sms_after_lifespan_reentered(self, monkeypatch):
+        """Test that SMS can still be queued after the app has shut down and started again"""
+        from fastapi.testclient import TestClient
+        from src.api import main
+
+        sent = []
+        monkeypatch.setattr(main.twilio, "send_sms", lambda **kwargs: sent.append(kwargs))
+
+        for _ in range(2):
+            with TestClient(main.app):
+                pass
+
+        main.queue_sms("+12025551234", "See you tomorrow")
+        main.close_notification_pool()
+
+        assert sent == [{"to_number": "+12025551234", "message": "See you tomorrow"}]